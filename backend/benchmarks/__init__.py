@@ -0,0 +1 @@
+"""Benchmarks run against a live API."""
@@ -0,0 +1,162 @@
+"""Login throughput benchmark.
+
+Fires a burst of concurrent logins at a running API while probing the
+liveness endpoint, and reports login throughput and latency next to the
+probe latency. A probe latency that grows with the burst means password
+hashing is blocking the event loop.
+
+Usage:
+    python -m benchmarks.login --url http://localhost:5000 --logins 200
+"""
+
+import argparse
+import asyncio
+import secrets
+import statistics
+import sys
+import time
+import uuid
+from http import HTTPStatus
+
+import httpx
+
+
+def _summary(name: str, latencies: list[float]) -> str:
+    """Summarize latencies.
+
+    Args:
+        name: The series name.
+        latencies: The latencies in seconds.
+
+    Returns:
+        A line with the median, p99 and max latency in milliseconds.
+
+    """
+    if not latencies:
+        return f"{name}: no samples"
+
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"{name}: p50 {statistics.median(ordered) * 1000:.1f} ms, "
+        f"p99 {p99 * 1000:.1f} ms, max {ordered[-1] * 1000:.1f} ms"
+    )
+
+
+async def _login(
+    client: httpx.AsyncClient,
+    credentials: dict[str, str],
+    latencies: list[float],
+    statuses: dict[int, int],
+) -> None:
+    """Log in once and record the outcome.
+
+    Args:
+        client: The HTTP client.
+        credentials: The login payload.
+        latencies: The login latencies to append to.
+        statuses: The response status counts to update.
+
+    """
+    start = time.perf_counter()
+    response = await client.post(url="/auth/login", json=credentials)
+    latencies.append(time.perf_counter() - start)
+    statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+
+async def _probe(
+    client: httpx.AsyncClient, latencies: list[float], done: asyncio.Event
+) -> None:
+    """Hit the liveness endpoint until the burst is over.
+
+    Args:
+        client: The HTTP client.
+        latencies: The probe latencies to append to.
+        done: Set once the burst has finished.
+
+    """
+    while not done.is_set():
+        start = time.perf_counter()
+        await client.get(url="/health/liveness")
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.05)
+
+
+async def run(url: str, logins: int, concurrency: int) -> None:
+    """Run the benchmark.
+
+    Args:
+        url: The API base URL.
+        logins: The number of logins.
+        concurrency: The logins in flight at once.
+
+    """
+    credentials = {
+        "email": f"bench-{uuid.uuid4().hex[:8]}@example.com",
+        "password": secrets.token_urlsafe(16),
+    }
+    limits = httpx.Limits(max_connections=concurrency + 1)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        response = await client.post(url="/auth/register", json=credentials)
+        if response.status_code != HTTPStatus.OK:
+            sys.exit(f"Registration failed with status {response.status_code}")
+
+        login_latencies: list[float] = []
+        probe_latencies: list[float] = []
+        statuses: dict[int, int] = {}
+        semaphore = asyncio.Semaphore(concurrency)
+        done = asyncio.Event()
+
+        async def login() -> None:
+            """Log in once the concurrency limit allows."""
+            async with semaphore:
+                await _login(
+                    client=client,
+                    credentials=credentials,
+                    latencies=login_latencies,
+                    statuses=statuses,
+                )
+
+        probe = asyncio.create_task(
+            _probe(client=client, latencies=probe_latencies, done=done)
+        )
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe
+
+    sys.stdout.write(
+        "\n".join(
+            [
+                f"{logins} logins in {elapsed:.2f} s, {logins / elapsed:.1f} logins/s",
+                f"statuses: {dict(sorted(statuses.items()))}",
+                _summary(name="login", latencies=login_latencies),
+                _summary(name="liveness", latencies=probe_latencies),
+            ]
+        )
+        + "\n"
+    )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:5000", help="API URL")
+    parser.add_argument("--logins", type=int, default=200, help="Total logins")
+    parser.add_argument(
+        "--concurrency", type=int, default=50, help="Logins in flight at once"
+    )
+    arguments = parser.parse_args()
+
+    asyncio.run(
+        run(
+            url=arguments.url,
+            logins=arguments.logins,
+            concurrency=arguments.concurrency,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
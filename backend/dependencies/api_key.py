@@ -0,0 +1,13 @@
+"""API key dependency providers."""
+
+from usecases import ApiKeyUsecase
+
+
+def get_api_key_usecase() -> ApiKeyUsecase:
+    """Get the API key usecase.
+
+    Returns:
+        The API key usecase.
+
+    """
+    return ApiKeyUsecase()
@@ -2,24 +2,30 @@
 
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Query, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from dependencies import db
 from schemas import UserResponse
 from usecases import AuthUsecase
+from utils.rate_limit import VERIFIED_PAYLOAD_STATE
 
 security = HTTPBearer()
 
 
 async def get_current_user(
+    request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(dependency=security)],
     session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
 ) -> UserResponse:
     """Get the user.
 
+    The rate limiter leaves the payload of the access token it verified in
+    the request state, which spares decoding the token again.
+
     Dependencies:
+        request: The request.
         credentials: The credentials.
         session: The session.
 
@@ -27,14 +33,34 @@ async def get_current_user(
         The user.
 
     """
-    return UserResponse.model_validate(
-        await AuthUsecase().get_current_user(
-            token=credentials.credentials,
-            session=session,
-        )
+    token, payload = getattr(request.state, VERIFIED_PAYLOAD_STATE, (None, None))
+    return await AuthUsecase().get_principal(
+        token=credentials.credentials,
+        session=session,
+        payload=payload if token == credentials.credentials else None,
     )
 
 
+async def get_websocket_user(
+    token: Annotated[str, Query(description="Access token")],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+) -> UserResponse:
+    """Get the user of a WebSocket connection.
+
+    Browsers cannot set headers on WebSocket requests, so the access token is
+    passed as a query parameter.
+
+    Dependencies:
+        token: The access token.
+        session: The session.
+
+    Returns:
+        The user.
+
+    """
+    return await AuthUsecase().get_principal(token=token, session=session)
+
+
 def get_auth_usecase() -> AuthUsecase:
     """Get the user auth usecase.
 
@@ -0,0 +1,36 @@
+"""Pagination dependency providers."""
+
+from typing import Annotated
+
+from fastapi import Query, Response
+
+from enums import SortOrder
+from settings import pagination_settings
+from utils.pagination import Page
+
+
+def get_page(
+    response: Response,
+    limit: Annotated[
+        int,
+        Query(description="Items per page", ge=1, le=pagination_settings.max_limit),
+    ] = pagination_settings.default_limit,
+    cursor: Annotated[
+        str | None,
+        Query(description="Opaque cursor from the X-Next-Cursor header"),
+    ] = None,
+    order: Annotated[SortOrder, Query(description="Sort order")] = SortOrder.ASC,
+) -> Page:
+    """Get the requested page of a list.
+
+    Args:
+        response: The response, which receives the next page cursor.
+        limit: The page size.
+        cursor: Where the page starts, from the previous page.
+        order: The sort order.
+
+    Returns:
+        The page.
+
+    """
+    return Page(limit=limit, cursor=cursor, order=order, response=response)
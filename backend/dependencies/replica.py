@@ -0,0 +1,56 @@
+"""Session providers that route reads to the replica."""
+
+from collections.abc import AsyncGenerator
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dependencies import auth, db
+from schemas import UserResponse
+from sessions import replica_session
+from utils.replica import read_routing
+
+
+async def get_read_session(
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get a session for a read-only request.
+
+    Dependencies:
+        current_user: The user.
+        session: The primary session.
+
+    Yields:
+        A replica session, or the primary one when no replica is configured
+        or the user wrote recently.
+
+    """
+    if not await read_routing.use_replica(user_id=current_user.id):
+        yield session
+        return
+
+    async with replica_session() as replica:
+        yield replica
+
+
+async def get_write_session(
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+) -> AsyncSession:
+    """Get a session for a request that writes.
+
+    The user's reads are pinned to the primary before the write happens, so
+    no read after it can hit a replica that has not caught up yet.
+
+    Dependencies:
+        current_user: The user.
+        session: The primary session.
+
+    Returns:
+        The primary session.
+
+    """
+    await read_routing.pin(user_id=current_user.id)
+    return session
@@ -0,0 +1,29 @@
+"""Workflow execution engine."""
+
+from engine.cache import PlanCache, plan_cache
+from engine.context import ExecutionContext
+from engine.events import ExecutionEvents, execution_events
+from engine.executor import ExecutionEngine, execution_engine
+from engine.flows import (
+    FlowRunSubmitter,
+    PrefectExecutionEngine,
+    execute_workflow,
+    flow_run_submitter,
+)
+from engine.plan import ExecutionPlan, compile_plan
+
+__all__ = [
+    "ExecutionContext",
+    "ExecutionEngine",
+    "ExecutionEvents",
+    "ExecutionPlan",
+    "FlowRunSubmitter",
+    "PlanCache",
+    "PrefectExecutionEngine",
+    "compile_plan",
+    "execute_workflow",
+    "execution_engine",
+    "execution_events",
+    "flow_run_submitter",
+    "plan_cache",
+]
@@ -0,0 +1,124 @@
+"""Two-tier cache for compiled execution plans."""
+
+import logging
+from datetime import datetime
+
+import redis.asyncio as redis
+from pydantic import ValidationError
+
+from engine.plan import ExecutionPlan
+from settings import execution_settings
+from utils.cache import LRUCache
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "plan:"
+
+
+class PlanCache:
+    """Cache plans in process and in Redis, keyed by workflow revision.
+
+    A revision is the workflow ID, its graph version and the time the
+    workflow row was last written. Versions only grow, so an entry never has
+    to be invalidated: a graph edit bumps the version and later lookups miss
+    the old key. The timestamp keeps keys unique when IDs and versions repeat,
+    as they do after a database restore or in a fresh test database.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._local: LRUCache[tuple[int, int, datetime], ExecutionPlan] = LRUCache(
+            maxsize=execution_settings.plan_cache_size
+        )
+
+    @staticmethod
+    def _key(workflow_id: int, version: int, updated_at: datetime) -> str:
+        """Build the Redis key of a plan.
+
+        Args:
+            workflow_id: The workflow ID.
+            version: The workflow version.
+            updated_at: The workflow update time.
+
+        Returns:
+            The Redis key.
+
+        """
+        return f"{KEY_PREFIX}{workflow_id}:{version}:{updated_at.isoformat()}"
+
+    async def get(
+        self, workflow_id: int, version: int, updated_at: datetime
+    ) -> ExecutionPlan | None:
+        """Get a cached plan.
+
+        Args:
+            workflow_id: The workflow ID.
+            version: The workflow version.
+            updated_at: The workflow update time.
+
+        Returns:
+            The plan, or None on a miss.
+
+        """
+        plan = self._local.get(key=(workflow_id, version, updated_at))
+        if plan:
+            return plan
+
+        try:
+            payload = await redis_client.get(
+                self._key(
+                    workflow_id=workflow_id, version=version, updated_at=updated_at
+                )
+            )
+        except redis.RedisError:
+            logger.warning("Plan cache unavailable", exc_info=True)
+            return None
+
+        if not payload:
+            return None
+
+        try:
+            plan = ExecutionPlan.model_validate_json(payload)
+        except ValidationError:
+            return None
+
+        self._local.set(key=(workflow_id, version, updated_at), value=plan)
+        return plan
+
+    async def set(self, plan: ExecutionPlan, updated_at: datetime) -> None:
+        """Cache a plan in both tiers.
+
+        Args:
+            plan: The plan.
+            updated_at: The update time of the workflow it was compiled from.
+
+        """
+        self._local.set(key=(plan.workflow_id, plan.version, updated_at), value=plan)
+
+        try:
+            await redis_client.set(
+                self._key(
+                    workflow_id=plan.workflow_id,
+                    version=plan.version,
+                    updated_at=updated_at,
+                ),
+                plan.model_dump_json(),
+                ex=execution_settings.plan_cache_ttl,
+            )
+        except redis.RedisError:
+            logger.warning("Plan cache unavailable", exc_info=True)
+
+    async def clear(self) -> None:
+        """Remove every cached plan from both tiers."""
+        self._local.clear()
+
+        try:
+            keys = [key async for key in redis_client.scan_iter(match=f"{KEY_PREFIX}*")]
+            if keys:
+                await redis_client.delete(*keys)
+        except redis.RedisError:
+            logger.warning("Plan cache unavailable", exc_info=True)
+
+
+plan_cache = PlanCache()
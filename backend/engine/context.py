@@ -0,0 +1,47 @@
+"""Runtime context shared by the nodes of one execution."""
+
+from dataclasses import dataclass, field
+
+from exceptions import LLMProviderNotFoundError
+from models import LLMProvider
+
+
+@dataclass(slots=True)
+class ExecutionContext:
+    """Everything a node needs at run time, loaded before any node starts.
+
+    Nodes run concurrently, so they never touch the database session; the
+    engine preloads the owner's LLM providers here instead.
+    """
+
+    execution_id: int
+    workflow_id: int
+    owner_id: int
+    input_data: dict
+    providers: dict[int, LLMProvider] = field(default_factory=dict)
+
+    def get_provider(self, provider_id: int | None) -> LLMProvider:
+        """Resolve the provider for an LLM node.
+
+        Args:
+            provider_id: The provider ID configured on the node, if any.
+
+        Returns:
+            The configured provider, or the owner's default provider.
+
+        Raises:
+            LLMProviderNotFoundError: If no matching provider exists.
+
+        """
+        if provider_id is not None:
+            provider = self.providers.get(provider_id)
+        else:
+            provider = next(
+                (item for item in self.providers.values() if item.is_default),
+                None,
+            )
+
+        if not provider:
+            raise LLMProviderNotFoundError
+
+        return provider
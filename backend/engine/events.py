@@ -0,0 +1,124 @@
+"""Execution event fan-out over Redis pub/sub."""
+
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import redis.asyncio as redis
+from pydantic import ValidationError
+
+from enums import ExecutionEventType
+from schemas import ExecutionEvent
+from settings import execution_settings
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionEvents:
+    """Publish execution events and subscribe to them from any API worker.
+
+    Events are fire-and-forget: the engine never waits for subscribers, and a
+    subscriber only sees events published after it subscribed, so streams
+    start from a snapshot read from the database.
+    """
+
+    @staticmethod
+    def _channel(execution_id: int) -> str:
+        """Build the channel name of an execution.
+
+        Args:
+            execution_id: The execution ID.
+
+        Returns:
+            The channel name.
+
+        """
+        return f"execution:{execution_id}:events"
+
+    async def publish(
+        self,
+        execution_id: int,
+        type: ExecutionEventType,  # noqa: A002
+        node_id: int | None = None,
+        data: Any = None,  # noqa: ANN401
+    ) -> None:
+        """Publish an execution event.
+
+        Args:
+            execution_id: The execution ID.
+            type: The event type.
+            node_id: The node the event belongs to, if any.
+            data: The event payload.
+
+        """
+        event = ExecutionEvent(type=type, node_id=node_id, data=data)
+        try:
+            await redis_client.publish(
+                self._channel(execution_id=execution_id), event.model_dump_json()
+            )
+        except redis.RedisError:
+            logger.warning("Execution events unavailable", exc_info=True)
+
+    @asynccontextmanager
+    async def subscribe(
+        self, execution_id: int
+    ) -> AsyncGenerator[AsyncGenerator[ExecutionEvent, None] | None, None]:
+        """Subscribe to the events of an execution.
+
+        Args:
+            execution_id: The execution ID.
+
+        Yields:
+            The event iterator, or None when Redis is unavailable.
+
+        """
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self._channel(execution_id=execution_id))
+        except redis.RedisError:
+            logger.warning("Execution events unavailable", exc_info=True)
+            await pubsub.aclose()
+            yield None
+            return
+
+        try:
+            yield self._listen(pubsub=pubsub)
+        finally:
+            await pubsub.aclose()
+
+    @staticmethod
+    async def _listen(
+        pubsub: redis.client.PubSub,
+    ) -> AsyncGenerator[ExecutionEvent, None]:
+        """Read events from a subscription, emitting heartbeats while idle.
+
+        Args:
+            pubsub: The subscription.
+
+        Yields:
+            The events, until the connection to Redis is lost.
+
+        """
+        while True:
+            try:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=execution_settings.stream_heartbeat,
+                )
+            except redis.RedisError:
+                logger.warning("Execution events unavailable", exc_info=True)
+                return
+
+            if message is None:
+                yield ExecutionEvent(type=ExecutionEventType.HEARTBEAT)
+                continue
+
+            try:
+                yield ExecutionEvent.model_validate_json(message["data"])
+            except ValidationError:
+                logger.warning("Dropped malformed execution event")
+
+
+execution_events = ExecutionEvents()
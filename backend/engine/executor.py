@@ -0,0 +1,578 @@
+"""Asyncio workflow execution engine."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from engine.cache import plan_cache
+from engine.context import ExecutionContext
+from engine.events import execution_events
+from engine.memo import memoized_nodes, node_hashes
+from engine.nodes import NODE_HANDLERS
+from engine.plan import ExecutionPlan, compile_plan
+from enums import ExecutionEventType, ExecutionStatus
+from exceptions import BaseError, NodeExecutionError
+from models import Execution, Workflow
+from repositories import (
+    EdgeRepository,
+    ExecutionRepository,
+    LLMProviderRepository,
+    NodeRepository,
+    NodeResultRepository,
+    WorkflowRepository,
+)
+from sessions import async_session
+from settings import execution_settings
+from utils.admission import execution_admission
+from utils.payloads import payload_store
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionEngine:
+    """Run workflow executions as in-process asyncio tasks.
+
+    Graph structure comes from a compiled plan cached per workflow revision.
+    Nodes start as soon as all of their upstream nodes have finished, so
+    independent branches run concurrently and an execution takes as long as
+    its longest path rather than the sum of all node runtimes.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession] = async_session
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            session_factory: The factory used to open execution sessions.
+
+        """
+        self.session_factory = session_factory
+        self._execution_repository = ExecutionRepository()
+        self._workflow_repository = WorkflowRepository()
+        self._node_repository = NodeRepository()
+        self._edge_repository = EdgeRepository()
+        self._llm_provider_repository = LLMProviderRepository()
+        self._node_result_repository = NodeResultRepository()
+        self._plan_cache = plan_cache
+        self._admission = execution_admission
+        self._payload_store = payload_store
+        self._events = execution_events
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(
+        self, execution_id: int, started_at: datetime, user_id: int
+    ) -> asyncio.Task:
+        """Schedule an execution in the background.
+
+        Args:
+            execution_id: The execution ID.
+            started_at: The execution start time, which locates its partition.
+            user_id: The owner user ID holding the admission slot.
+
+        Returns:
+            The task running the execution.
+
+        """
+        task = asyncio.create_task(
+            self.run(execution_id=execution_id, started_at=started_at, user_id=user_id),
+            name=f"execution-{execution_id}",
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return task
+
+    async def dispatch(
+        self, executions: list[tuple[int, datetime]], user_id: int
+    ) -> None:
+        """Start executions promoted from the user's admission queue.
+
+        Args:
+            executions: The execution IDs and start times.
+            user_id: The owner user ID.
+
+        """
+        for execution_id, started_at in executions:
+            self.submit(
+                execution_id=execution_id, started_at=started_at, user_id=user_id
+            )
+
+    async def drain(self) -> None:
+        """Wait for all in-flight executions to finish."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def run(self, execution_id: int, started_at: datetime, user_id: int) -> None:
+        """Run an execution, persist its result and release its slot.
+
+        The slot's lease is renewed while the execution runs, so executions
+        outliving the lease TTL keep their slot.
+
+        Args:
+            execution_id: The execution ID.
+            started_at: The execution start time, which locates its partition.
+            user_id: The owner user ID holding the admission slot.
+
+        """
+        heartbeat = asyncio.create_task(
+            self._heartbeat(
+                execution_id=execution_id, started_at=started_at, user_id=user_id
+            ),
+            name=f"execution-{execution_id}-heartbeat",
+        )
+        try:
+            await self._run(execution_id=execution_id, started_at=started_at)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            await self._release(
+                execution_id=execution_id, started_at=started_at, user_id=user_id
+            )
+
+    async def _heartbeat(
+        self, execution_id: int, started_at: datetime, user_id: int
+    ) -> None:
+        """Renew an execution's admission lease until cancelled.
+
+        Args:
+            execution_id: The execution ID.
+            started_at: The execution start time.
+            user_id: The owner user ID holding the admission slot.
+
+        """
+        while True:
+            await asyncio.sleep(execution_settings.lease_renew_interval)
+            await self._admission.renew(
+                user_id=user_id, execution_id=execution_id, started_at=started_at
+            )
+
+    async def _run(self, execution_id: int, started_at: datetime) -> None:
+        """Run an execution and persist its result.
+
+        Args:
+            execution_id: The execution ID.
+            started_at: The execution start time, which locates its partition.
+
+        """
+        async with self.session_factory() as session:
+            execution = await self._execution_repository.update_by(
+                session=session,
+                data={"status": ExecutionStatus.RUNNING},
+                id=execution_id,
+                started_at=started_at,
+            )
+            if not execution:
+                return
+
+            await self._events.publish(
+                execution_id=execution_id,
+                type=ExecutionEventType.STATUS,
+                data={"status": ExecutionStatus.RUNNING},
+            )
+
+            # Storing the result is covered too: an execution must never be
+            # left RUNNING without a FINISHED event for its subscribers.
+            try:
+                output_data = await self._run_plan(session=session, execution=execution)
+                inline, ref = await self._payload_store.put(payload=output_data)
+                await self._execution_repository.update_by(
+                    session=session,
+                    data={
+                        "status": ExecutionStatus.SUCCESS,
+                        "output_data": inline,
+                        "output_ref": ref,
+                        "finished_at": func.now(),
+                    },
+                    id=execution_id,
+                    started_at=started_at,
+                )
+            except Exception as e:
+                logger.exception("Execution %s failed", execution_id)
+                await session.rollback()
+                await self._fail(
+                    session=session,
+                    execution_id=execution_id,
+                    started_at=started_at,
+                    error=e.message if isinstance(e, BaseError) else str(e),
+                )
+            else:
+                await self._events.publish(
+                    execution_id=execution_id,
+                    type=ExecutionEventType.FINISHED,
+                    data={
+                        "status": ExecutionStatus.SUCCESS,
+                        "output_data": output_data,
+                    },
+                )
+
+    async def fail(
+        self, execution_id: int, started_at: datetime, user_id: int, error: str
+    ) -> None:
+        """Mark an execution that could not be run as failed.
+
+        Args:
+            execution_id: The execution ID.
+            started_at: The execution start time, which locates its partition.
+            user_id: The owner user ID holding the admission slot.
+            error: The error message.
+
+        """
+        try:
+            async with self.session_factory() as session:
+                await self._fail(
+                    session=session,
+                    execution_id=execution_id,
+                    started_at=started_at,
+                    error=error,
+                )
+        finally:
+            await self._release(
+                execution_id=execution_id, started_at=started_at, user_id=user_id
+            )
+
+    async def _release(
+        self, execution_id: int, started_at: datetime, user_id: int
+    ) -> None:
+        """Release an execution's admission slot and start queued ones.
+
+        Args:
+            execution_id: The execution ID.
+            started_at: The execution start time.
+            user_id: The owner user ID.
+
+        """
+        await self.dispatch(
+            executions=await self._admission.release(
+                user_id=user_id, execution_id=execution_id, started_at=started_at
+            ),
+            user_id=user_id,
+        )
+
+    async def _fail(
+        self,
+        session: AsyncSession,
+        execution_id: int,
+        started_at: datetime,
+        error: str,
+    ) -> None:
+        """Persist a failed execution.
+
+        Args:
+            session: The session.
+            execution_id: The execution ID.
+            started_at: The execution start time, which locates its partition.
+            error: The error message.
+
+        """
+        await self._execution_repository.update_by(
+            session=session,
+            data={
+                "status": ExecutionStatus.FAILED,
+                "error": error,
+                "finished_at": func.now(),
+            },
+            id=execution_id,
+            started_at=started_at,
+        )
+        await self._events.publish(
+            execution_id=execution_id,
+            type=ExecutionEventType.FINISHED,
+            data={"status": ExecutionStatus.FAILED, "error": error},
+        )
+
+    async def _run_plan(
+        self, session: AsyncSession, execution: Execution
+    ) -> dict[str, Any]:
+        """Run the nodes of an execution, reusing memoized node outputs.
+
+        Memoized nodes (LLM nodes that opt in through `cache`) whose hash
+        already has a stored output are not run, and neither are their
+        ancestors unless another node still needs them, so after an edit only
+        the edited node and its descendants run. Outputs of nodes that did run
+        are stored even if the execution fails, unless storing them fails too.
+
+        Args:
+            session: The session.
+            execution: The execution.
+
+        Returns:
+            The execution output keyed by OUTPUT node.
+
+        """
+        plan, context = await self._load(session=session, execution=execution)
+
+        hashes = node_hashes(plan=plan, context=context)
+        memoized = memoized_nodes(plan=plan)
+        stored = await self._node_result_repository.get_outputs(
+            session=session,
+            workflow_id=plan.workflow_id,
+            node_hashes=[hashes[index] for index in memoized],
+        )
+        outputs = {
+            index: stored[hashes[index]]
+            for index in memoized
+            if hashes[index] in stored
+        }
+        for index, output in outputs.items():
+            await self._events.publish(
+                execution_id=context.execution_id,
+                type=ExecutionEventType.NODE_COMPLETED,
+                node_id=plan.node_ids[index],
+                data={"output": output, "reused": True},
+            )
+
+        def new_outputs() -> dict[str, Any]:
+            return {
+                hashes[index]: outputs[index]
+                for index in memoized
+                if index in outputs and hashes[index] not in stored
+            }
+
+        try:
+            result = await self._execute(plan=plan, context=context, outputs=outputs)
+        except Exception:
+            # The save may fail for the same reason the run did, e.g. a broken
+            # session, and must not replace the error the execution reports.
+            try:
+                await self._node_result_repository.save_outputs(
+                    session=session,
+                    workflow_id=plan.workflow_id,
+                    outputs=new_outputs(),
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to save node outputs of execution %s",
+                    context.execution_id,
+                )
+            raise
+
+        await self._node_result_repository.save_outputs(
+            session=session, workflow_id=plan.workflow_id, outputs=new_outputs()
+        )
+
+        return result
+
+    async def _load(
+        self, session: AsyncSession, execution: Execution
+    ) -> tuple[ExecutionPlan, ExecutionContext]:
+        """Load the execution plan and runtime context of an execution.
+
+        Args:
+            session: The session.
+            execution: The execution.
+
+        Returns:
+            The plan and the context.
+
+        """
+        workflow = await self._workflow_repository.get_by(
+            session=session, id=execution.workflow_id
+        )
+        plan = await self.get_plan(session=session, workflow=workflow)
+        providers = await self._llm_provider_repository.get_all(
+            session=session, user_id=workflow.owner_id
+        )
+
+        return plan, ExecutionContext(
+            execution_id=execution.id,
+            workflow_id=execution.workflow_id,
+            owner_id=workflow.owner_id,
+            input_data=await self._payload_store.resolve(
+                payload=execution.input_data, ref=execution.input_ref
+            )
+            or {},
+            providers={provider.id: provider for provider in providers},
+        )
+
+    async def get_plan(
+        self, session: AsyncSession, workflow: Workflow
+    ) -> ExecutionPlan:
+        """Get the plan of a workflow revision, compiling it on a cache miss.
+
+        Args:
+            session: The session.
+            workflow: The workflow.
+
+        Returns:
+            The plan.
+
+        """
+        plan = await self._plan_cache.get(
+            workflow_id=workflow.id,
+            version=workflow.version,
+            updated_at=workflow.updated_at,
+        )
+        if plan:
+            return plan
+
+        plan = compile_plan(
+            workflow_id=workflow.id,
+            version=workflow.version,
+            nodes=await self._node_repository.get_all(
+                session=session, workflow_id=workflow.id
+            ),
+            edges=await self._edge_repository.get_all(
+                session=session, workflow_id=workflow.id
+            ),
+        )
+        await self._plan_cache.set(plan=plan, updated_at=workflow.updated_at)
+
+        return plan
+
+    async def _execute(
+        self,
+        plan: ExecutionPlan,
+        context: ExecutionContext,
+        outputs: dict[int, Any],
+    ) -> dict[str, Any]:
+        """Run the nodes of a plan that are still required, in dependency order.
+
+        Args:
+            plan: The execution plan.
+            context: The execution context.
+            outputs: The known node outputs by index, filled in as nodes
+                finish.
+
+        Returns:
+            The execution output keyed by OUTPUT node.
+
+        """
+        remaining = {
+            index: sum(item not in outputs for item in plan.predecessors[index])
+            for index in plan.required(available=set(outputs))
+        }
+        semaphore = asyncio.Semaphore(execution_settings.max_concurrency)
+        pending: dict[asyncio.Task, int] = {}
+
+        async def run_node(index: int) -> Any:  # noqa: ANN401
+            async with semaphore:
+                return await self.run_node(
+                    plan=plan,
+                    index=index,
+                    inputs=[outputs[item] for item in plan.predecessors[index]],
+                    context=context,
+                )
+
+        def start(index: int) -> None:
+            pending[asyncio.create_task(run_node(index=index))] = index
+
+        for index, count in remaining.items():
+            if count == 0:
+                start(index=index)
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index = pending.pop(task)
+                    outputs[index] = task.result()
+
+                    for successor in remaining.keys() & plan.successors[index]:
+                        remaining[successor] -= 1
+                        if remaining[successor] == 0:
+                            start(index=successor)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return self._collect(plan=plan, outputs=outputs)
+
+    @staticmethod
+    def _collect(plan: ExecutionPlan, outputs: dict[int, Any]) -> dict[str, Any]:
+        """Build the execution output from node outputs.
+
+        Args:
+            plan: The execution plan.
+            outputs: The node outputs by index.
+
+        Returns:
+            The execution output keyed by OUTPUT node.
+
+        """
+        return {
+            str(plan.node_data[index].get("key", plan.node_ids[index])): outputs[index]
+            for index in plan.outputs
+        }
+
+    async def run_node(
+        self,
+        plan: ExecutionPlan,
+        index: int,
+        inputs: list[Any],
+        context: ExecutionContext,
+    ) -> Any:  # noqa: ANN401
+        """Run a single node.
+
+        Args:
+            plan: The execution plan.
+            index: The node index in the plan.
+            inputs: The upstream outputs.
+            context: The execution context.
+
+        Returns:
+            The node output.
+
+        Raises:
+            NodeExecutionError: If the node fails.
+
+        """
+        node_id = plan.node_ids[index]
+        await self._events.publish(
+            execution_id=context.execution_id,
+            type=ExecutionEventType.NODE_STARTED,
+            node_id=node_id,
+        )
+
+        try:
+            output = await NODE_HANDLERS[plan.node_types[index]](
+                node_id, plan.node_data[index], inputs, context
+            )
+        except BaseError as e:
+            await self._publish_failure(
+                context=context, node_id=node_id, error=e.message
+            )
+            raise
+        except Exception as e:
+            error = NodeExecutionError(message=f"Node {node_id} failed: {e}")
+            await self._publish_failure(
+                context=context, node_id=node_id, error=error.message
+            )
+            raise error from e
+
+        await self._events.publish(
+            execution_id=context.execution_id,
+            type=ExecutionEventType.NODE_COMPLETED,
+            node_id=node_id,
+            data={"output": output},
+        )
+
+        return output
+
+    async def _publish_failure(
+        self, context: ExecutionContext, node_id: int, error: str
+    ) -> None:
+        """Publish a node failure event.
+
+        Args:
+            context: The execution context.
+            node_id: The node ID.
+            error: The error message.
+
+        """
+        await self._events.publish(
+            execution_id=context.execution_id,
+            type=ExecutionEventType.NODE_FAILED,
+            node_id=node_id,
+            data={"error": error},
+        )
+
+
+execution_engine = ExecutionEngine()
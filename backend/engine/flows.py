@@ -0,0 +1,288 @@
+"""Prefect flows running workflow executions on the configured work pool.
+
+The API process only creates flow runs; the Prefect workers pick them up, so
+executions scale horizontally with the number of worker replicas.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from prefect import flow, task
+from prefect.cache_policies import NONE
+from prefect.client.orchestration import PrefectClient, get_client
+from prefect.futures import PrefectFuture, wait
+
+from engine.context import ExecutionContext
+from engine.executor import ExecutionEngine
+from engine.plan import ExecutionPlan
+from llm import llm_clients
+from settings import prefect_settings
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+FLOW_NAME = "execute-workflow"
+
+
+class PrefectExecutionEngine(ExecutionEngine):
+    """Run the nodes of an execution as Prefect tasks.
+
+    Every node becomes one task run whose upstream futures are passed as its
+    inputs, so Prefect orders the tasks by the DAG and runs independent
+    branches concurrently on the flow's task runner.
+    """
+
+    async def _execute(
+        self,
+        plan: ExecutionPlan,
+        context: ExecutionContext,
+        outputs: dict[int, Any],
+    ) -> dict[str, Any]:
+        """Submit the required nodes of a plan as tasks and wait for them.
+
+        Args:
+            plan: The execution plan.
+            context: The execution context.
+            outputs: The known node outputs by index, filled in as nodes
+                finish.
+
+        Returns:
+            The execution output keyed by OUTPUT node.
+
+        """
+        futures: dict[int, PrefectFuture] = {}
+        for index in plan.required(available=set(outputs)):
+            futures[index] = run_node.with_options(
+                task_run_name=f"node-{plan.node_ids[index]}"
+            ).submit(
+                plan=plan,
+                index=index,
+                inputs=[
+                    futures[item] if item in futures else outputs[item]
+                    for item in plan.predecessors[index]
+                ],
+                context=context,
+            )
+
+        await asyncio.to_thread(wait, list(futures.values()))
+
+        failed: PrefectFuture | None = None
+        for index, future in futures.items():
+            if future.state.is_completed():
+                outputs[index] = future.result()
+            elif failed is None:
+                failed = future
+
+        if failed is not None:
+            # Futures are in topological order, so this is the node that
+            # failed first rather than one skipped because of it.
+            failed.result()
+
+        return self._collect(plan=plan, outputs=outputs)
+
+    async def dispatch(
+        self, executions: list[tuple[int, datetime]], user_id: int
+    ) -> None:
+        """Create flow runs for executions promoted from the admission queue.
+
+        The current flow run ends right after, so runs are created here
+        instead of through the batching submitter.
+
+        Args:
+            executions: The execution IDs and start times.
+            user_id: The owner user ID.
+
+        """
+        if executions:
+            await flow_run_submitter.create(
+                executions=[
+                    (execution_id, started_at, user_id)
+                    for execution_id, started_at in executions
+                ]
+            )
+
+
+prefect_execution_engine = PrefectExecutionEngine()
+
+
+@task(cache_policy=NONE)
+async def run_node(
+    plan: ExecutionPlan, index: int, inputs: list[Any], context: ExecutionContext
+) -> Any:  # noqa: ANN401
+    """Run a single node of an execution.
+
+    Args:
+        plan: The execution plan.
+        index: The node index in the plan.
+        inputs: The upstream outputs.
+        context: The execution context.
+
+    Returns:
+        The node output.
+
+    """
+    # Prefect runs every async task on an event loop of its own, so the
+    # clients opened on it are closed along with it.
+    try:
+        return await prefect_execution_engine.run_node(
+            plan=plan, index=index, inputs=inputs, context=context
+        )
+    finally:
+        await asyncio.gather(llm_clients.close(), redis_client.aclose())
+
+
+@flow(name=FLOW_NAME)
+async def execute_workflow(
+    execution_id: int, started_at: datetime, user_id: int
+) -> None:
+    """Run a workflow execution.
+
+    Args:
+        execution_id: The execution ID.
+        started_at: The execution start time, which locates its partition.
+        user_id: The owner user ID holding the admission slot.
+
+    """
+    try:
+        await prefect_execution_engine.run(
+            execution_id=execution_id, started_at=started_at, user_id=user_id
+        )
+    finally:
+        await redis_client.aclose()
+
+
+class FlowRunSubmitter:
+    """Create flow runs for executions in batches.
+
+    Prefect has no bulk flow-run endpoint, so a burst of executions is
+    collected for a short window and created through one client: the
+    connection and the deployment lookup are shared and the runs are created
+    concurrently instead of one request round-trip per API call.
+    """
+
+    def __init__(self, engine: ExecutionEngine = prefect_execution_engine) -> None:
+        """Initialize the submitter.
+
+        Args:
+            engine: The engine used to mark executions that cannot be submitted.
+
+        """
+        self._engine = engine
+        self._queue: asyncio.Queue[tuple[int, datetime, int]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._deployment_id: UUID | None = None
+
+    def submit(self, execution_id: int, started_at: datetime, user_id: int) -> None:
+        """Queue an execution for the next batch.
+
+        Args:
+            execution_id: The execution ID.
+            started_at: The execution start time.
+            user_id: The owner user ID holding the admission slot.
+
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="flow-run-submitter")
+
+        self._queue.put_nowait((execution_id, started_at, user_id))
+
+    async def close(self) -> None:
+        """Flush queued executions and stop the background worker."""
+        if self._worker is None:
+            return
+
+        await self._queue.join()
+        self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
+        self._worker = None
+
+    async def _run(self) -> None:
+        """Collect queued executions into batches and submit them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + prefect_settings.submit_batch_window
+            while len(batch) < prefect_settings.submit_batch_size:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(
+                            self._queue.get(), timeout=deadline - loop.time()
+                        )
+                    )
+                except TimeoutError:
+                    break
+
+            try:
+                await self.create(executions=batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def create(self, executions: list[tuple[int, datetime, int]]) -> None:
+        """Create flow runs for a batch of executions.
+
+        Args:
+            executions: The execution IDs, start times and owner user IDs.
+
+        """
+        try:
+            async with get_client() as client:
+                deployment_id = await self._get_deployment_id(client=client)
+                results = await asyncio.gather(
+                    *(
+                        client.create_flow_run_from_deployment(
+                            deployment_id=deployment_id,
+                            parameters={
+                                "execution_id": execution_id,
+                                "started_at": started_at,
+                                "user_id": user_id,
+                            },
+                            idempotency_key=f"execution-{execution_id}",
+                        )
+                        for execution_id, started_at, user_id in executions
+                    ),
+                    return_exceptions=True,
+                )
+        except Exception as e:  # noqa: BLE001
+            self._deployment_id = None
+            results = [e] * len(executions)
+
+        for (execution_id, started_at, user_id), result in zip(
+            executions, results, strict=True
+        ):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to submit execution %s",
+                    execution_id,
+                    exc_info=result,
+                )
+                await self._engine.fail(
+                    execution_id=execution_id,
+                    started_at=started_at,
+                    user_id=user_id,
+                    error=f"Failed to submit execution: {result}",
+                )
+
+    async def _get_deployment_id(self, client: PrefectClient) -> UUID:
+        """Resolve the deployment running workflow executions.
+
+        Args:
+            client: The Prefect client.
+
+        Returns:
+            The deployment ID.
+
+        """
+        if self._deployment_id is None:
+            deployment = await client.read_deployment_by_name(
+                name=f"{FLOW_NAME}/{prefect_settings.deployment_name}"
+            )
+            self._deployment_id = deployment.id
+
+        return self._deployment_id
+
+
+flow_run_submitter = FlowRunSubmitter()
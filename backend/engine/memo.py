@@ -0,0 +1,76 @@
+"""Merkle hashes addressing memoized node outputs."""
+
+import hashlib
+import json
+
+from engine.context import ExecutionContext
+from engine.nodes import select_input
+from engine.plan import ExecutionPlan
+from enums import NodeType
+from exceptions import LLMProviderNotFoundError
+
+MEMOIZED_NODE_TYPES = frozenset({NodeType.LLM})
+
+
+def memoized_nodes(plan: ExecutionPlan) -> list[int]:
+    """Select the nodes whose outputs are memoized.
+
+    Only nodes that opt in through `cache` are memoized, the same contract
+    as the LLM response cache: their output is assumed to depend on their
+    inputs alone, which does not hold when sampling with a temperature.
+
+    Args:
+        plan: The execution plan.
+
+    Returns:
+        The indexes of the memoized nodes.
+
+    """
+    return [
+        index
+        for index, node_type in enumerate(plan.node_types)
+        if node_type in MEMOIZED_NODE_TYPES and plan.node_data[index].get("cache")
+    ]
+
+
+def node_hashes(plan: ExecutionPlan, context: ExecutionContext) -> list[str]:
+    """Hash every node over its configuration and its upstream hashes.
+
+    A hash changes whenever anything that can affect the node output changes:
+    its type, its data, the execution input it reads, the provider an LLM
+    node resolves to, or the hash of any upstream node. Editing one node
+    therefore changes the hashes of exactly that node and its descendants.
+
+    Args:
+        plan: The execution plan.
+        context: The execution context.
+
+    Returns:
+        The hex digests by node index.
+
+    """
+    hashes = [""] * len(plan.node_ids)
+    for index in plan.order:
+        node_type, data = plan.node_types[index], plan.node_data[index]
+        content = {
+            "type": node_type,
+            "data": data,
+            "upstream": [hashes[item] for item in plan.predecessors[index]],
+        }
+        if node_type == NodeType.INPUT:
+            content["input"] = select_input(data=data, input_data=context.input_data)
+        elif node_type == NodeType.LLM:
+            try:
+                content["provider_id"] = context.get_provider(
+                    provider_id=data.get("provider_id")
+                ).id
+            except LLMProviderNotFoundError:
+                content["provider_id"] = None
+
+        hashes[index] = hashlib.sha256(
+            json.dumps(
+                content, sort_keys=True, separators=(",", ":"), default=str
+            ).encode()
+        ).hexdigest()
+
+    return hashes
@@ -0,0 +1,228 @@
+"""Node handlers for the workflow execution engine.
+
+Each handler receives the node configuration (`Node.data`), the outputs of its
+upstream nodes in edge order, and the execution context, and returns the node
+output. Supported configuration keys:
+
+- INPUT: `key` selects a single field of the execution input; without it the
+  whole input is forwarded.
+- LLM: `model` (required), `prompt` (a template where `{input}` is replaced by
+  the upstream outputs), `system`, `options` (Ollama generation options),
+  `provider_id` (defaults to the owner's default provider) and `cache`
+  (reuse responses to identical requests and share one model call between
+  identical concurrent ones; meant for deterministic nodes, e.g. with
+  temperature 0).
+- OUTPUT: `key` names the entry in the execution output; the node forwards its
+  single input, or a list when it has several.
+"""
+
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from engine.context import ExecutionContext
+from engine.events import execution_events
+from enums import ExecutionEventType, NodeType
+from exceptions import NodeExecutionError
+from llm import OllamaError, llm_cache, llm_clients, llm_singleflight
+
+type NodeHandler = Callable[[int, dict, list[Any], ExecutionContext], Awaitable[Any]]
+
+INPUT_PLACEHOLDER = "{input}"
+
+
+def render_prompt(template: str, inputs: list[Any]) -> str:
+    """Render an LLM prompt template with upstream outputs.
+
+    Args:
+        template: The prompt template.
+        inputs: The upstream node outputs.
+
+    Returns:
+        The rendered prompt.
+
+    """
+    text = "\n\n".join(
+        value if isinstance(value, str) else json.dumps(value) for value in inputs
+    )
+
+    if INPUT_PLACEHOLDER in template:
+        return template.replace(INPUT_PLACEHOLDER, text)
+
+    return "\n\n".join(part for part in (template, text) if part)
+
+
+def select_input(data: dict, input_data: dict) -> Any:  # noqa: ANN401
+    """Select the part of the execution input an INPUT node forwards.
+
+    Args:
+        data: The node configuration.
+        input_data: The execution input.
+
+    Returns:
+        The selected execution input.
+
+    """
+    key = data.get("key")
+    if key is None:
+        return input_data
+
+    return input_data.get(key)
+
+
+async def run_input_node(
+    node_id: int,  # noqa: ARG001
+    data: dict,
+    inputs: list[Any],  # noqa: ARG001
+    context: ExecutionContext,
+) -> Any:  # noqa: ANN401
+    """Forward the execution input.
+
+    Args:
+        node_id: The node ID.
+        data: The node configuration.
+        inputs: The upstream outputs.
+        context: The execution context.
+
+    Returns:
+        The selected execution input.
+
+    """
+    return select_input(data=data, input_data=context.input_data)
+
+
+async def run_llm_node(
+    node_id: int,
+    data: dict,
+    inputs: list[Any],
+    context: ExecutionContext,
+) -> str:
+    """Generate a completion with the node's LLM provider.
+
+    The completion is streamed and every token is published as an execution
+    event as soon as it arrives.
+
+    Args:
+        node_id: The node ID.
+        data: The node configuration.
+        inputs: The upstream outputs.
+        context: The execution context.
+
+    Returns:
+        The generated text.
+
+    Raises:
+        NodeExecutionError: If the node is misconfigured or the model fails.
+
+    """
+    model = data.get("model")
+    if not model:
+        raise NodeExecutionError(message=f"Node {node_id}: model is required")
+
+    provider = context.get_provider(provider_id=data.get("provider_id"))
+    if not provider.base_url:
+        raise NodeExecutionError(message=f"Node {node_id}: provider has no base URL")
+
+    payload = {
+        "model": model,
+        "prompt": render_prompt(template=data.get("prompt", ""), inputs=inputs),
+        "options": data.get("options") or {},
+    }
+    if data.get("system"):
+        payload["system"] = data["system"]
+
+    async def publish_token(token: str) -> None:
+        await execution_events.publish(
+            execution_id=context.execution_id,
+            type=ExecutionEventType.TOKEN,
+            node_id=node_id,
+            data=token,
+        )
+
+    async def generate() -> str:
+        try:
+            return await llm_clients.get(base_url=provider.base_url).generate(
+                payload=payload, api_key=provider.api_key, on_token=publish_token
+            )
+        except OllamaError as e:
+            raise NodeExecutionError(message=f"Node {node_id}: {e}") from e
+
+    if not data.get("cache"):
+        return await generate()
+
+    return await _generate_cached(
+        key=llm_cache.key(provider_id=provider.id, payload=payload),
+        generate=generate,
+        publish_token=publish_token,
+    )
+
+
+async def _generate_cached(
+    key: str,
+    generate: Callable[[], Awaitable[str]],
+    publish_token: Callable[[str], Awaitable[None]],
+) -> str:
+    """Answer from the response cache, coalescing identical misses.
+
+    A response that was not streamed by this node (a cache hit, or a call
+    made by another request) is published as a single token.
+
+    Args:
+        key: The content-addressed request key.
+        generate: Calls the model and streams its tokens.
+        publish_token: Publishes a token event.
+
+    Returns:
+        The generated text.
+
+    """
+    response = await llm_cache.get(key=key)
+    if response is not None:
+        await publish_token(response)
+        return response
+
+    streamed = False
+
+    async def generate_and_cache() -> str:
+        nonlocal streamed
+        streamed = True
+        response = await generate()
+        await llm_cache.set(key=key, response=response)
+        return response
+
+    response = await llm_singleflight.do(key=key, call=generate_and_cache)
+    if not streamed:
+        await publish_token(response)
+
+    return response
+
+
+async def run_output_node(
+    node_id: int,  # noqa: ARG001
+    data: dict,  # noqa: ARG001
+    inputs: list[Any],
+    context: ExecutionContext,  # noqa: ARG001
+) -> Any:  # noqa: ANN401
+    """Collect upstream outputs into an execution output.
+
+    Args:
+        node_id: The node ID.
+        data: The node configuration.
+        inputs: The upstream outputs.
+        context: The execution context.
+
+    Returns:
+        The single upstream output, or all of them as a list.
+
+    """
+    if len(inputs) == 1:
+        return inputs[0]
+
+    return inputs
+
+
+NODE_HANDLERS: dict[NodeType, NodeHandler] = {
+    NodeType.INPUT: run_input_node,
+    NodeType.LLM: run_llm_node,
+    NodeType.OUTPUT: run_output_node,
+}
@@ -0,0 +1,129 @@
+"""Compiled execution plans."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from enums import NodeType
+from exceptions import WorkflowCycleError
+from models import Edge, Node
+
+
+class ExecutionPlan(BaseModel):
+    """Immutable, integer-indexed form of a workflow graph.
+
+    Nodes are addressed by their position in `node_ids`; every other array is
+    indexed the same way, so the engine never has to look nodes up by ID.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    workflow_id: int = Field(default=..., description="Workflow ID")
+    version: int = Field(default=..., description="Workflow version")
+    node_ids: tuple[int, ...] = Field(default=..., description="Node IDs by index")
+    node_types: tuple[NodeType, ...] = Field(default=..., description="Node types")
+    node_data: tuple[dict, ...] = Field(default=..., description="Node configuration")
+    predecessors: tuple[tuple[int, ...], ...] = Field(
+        default=..., description="Upstream node indexes in input order"
+    )
+    successors: tuple[tuple[int, ...], ...] = Field(
+        default=..., description="Downstream node indexes"
+    )
+    order: tuple[int, ...] = Field(default=..., description="Topological order")
+    levels: tuple[tuple[int, ...], ...] = Field(
+        default=..., description="Node indexes grouped by depth"
+    )
+
+    @property
+    def outputs(self) -> tuple[int, ...]:
+        """Return the indexes of OUTPUT nodes."""
+        return tuple(
+            index
+            for index, node_type in enumerate(self.node_types)
+            if node_type == NodeType.OUTPUT
+        )
+
+    def required(self, available: set[int]) -> list[int]:
+        """Return the nodes that must run to produce every OUTPUT node.
+
+        Walks upstream from the OUTPUT nodes and stops at nodes whose output
+        is already available, so their ancestors are skipped as well.
+
+        Args:
+            available: The indexes of nodes whose output is already known.
+
+        Returns:
+            The indexes of the nodes to run, in topological order.
+
+        """
+        required: set[int] = set()
+        stack = [index for index in self.outputs if index not in available]
+        while stack:
+            index = stack.pop()
+            if index in required:
+                continue
+
+            required.add(index)
+            stack.extend(
+                item for item in self.predecessors[index] if item not in available
+            )
+
+        return [index for index in self.order if index in required]
+
+
+def compile_plan(
+    workflow_id: int, version: int, nodes: list[Node], edges: list[Edge]
+) -> ExecutionPlan:
+    """Compile a workflow graph into an execution plan.
+
+    Args:
+        workflow_id: The workflow ID.
+        version: The workflow version the graph was read at.
+        nodes: The workflow nodes.
+        edges: The workflow edges.
+
+    Returns:
+        The execution plan.
+
+    Raises:
+        WorkflowCycleError: If the graph contains a cycle.
+
+    """
+    nodes = sorted(nodes, key=lambda node: node.id)
+    index = {node.id: position for position, node in enumerate(nodes)}
+
+    predecessors: list[list[int]] = [[] for _ in nodes]
+    successors: list[list[int]] = [[] for _ in nodes]
+    for edge in sorted(edges, key=lambda edge: edge.id):
+        source, target = index[edge.source_node_id], index[edge.target_node_id]
+        predecessors[target].append(source)
+        successors[source].append(target)
+
+    remaining = [len(upstream) for upstream in predecessors]
+    level = [position for position, count in enumerate(remaining) if count == 0]
+    order: list[int] = []
+    levels: list[tuple[int, ...]] = []
+    while level:
+        order.extend(level)
+        levels.append(tuple(level))
+
+        next_level = []
+        for position in level:
+            for successor in successors[position]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    next_level.append(successor)
+        level = next_level
+
+    if len(order) != len(nodes):
+        raise WorkflowCycleError
+
+    return ExecutionPlan(
+        workflow_id=workflow_id,
+        version=version,
+        node_ids=tuple(node.id for node in nodes),
+        node_types=tuple(node.type for node in nodes),
+        node_data=tuple(node.data for node in nodes),
+        predecessors=tuple(tuple(upstream) for upstream in predecessors),
+        successors=tuple(tuple(downstream) for downstream in successors),
+        order=tuple(order),
+        levels=tuple(levels),
+    )
@@ -1,11 +1,15 @@
 """Enum exports for the backend domain."""
 
-from enums.execution import ExecutionStatus
+from enums.execution import ExecutionEventType, ExecutionMode, ExecutionStatus
 from enums.llm_provider import LLMProviderType
 from enums.node import NodeType
+from enums.pagination import SortOrder
 
 __all__ = [
+    "ExecutionEventType",
+    "ExecutionMode",
     "ExecutionStatus",
     "LLMProviderType",
     "NodeType",
+    "SortOrder",
 ]
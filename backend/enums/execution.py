@@ -10,3 +10,22 @@ class ExecutionStatus(StrEnum):
     RUNNING = auto()
     SUCCESS = auto()
     FAILED = auto()
+
+
+class ExecutionMode(StrEnum):
+    """Where workflow executions run."""
+
+    LOCAL = auto()
+    PREFECT = auto()
+
+
+class ExecutionEventType(StrEnum):
+    """Kinds of events streamed while an execution runs."""
+
+    STATUS = auto()
+    NODE_STARTED = auto()
+    NODE_COMPLETED = auto()
+    NODE_FAILED = auto()
+    TOKEN = auto()
+    FINISHED = auto()
+    HEARTBEAT = auto()
@@ -0,0 +1,10 @@
+"""Pagination enums."""
+
+from enum import StrEnum, auto
+
+
+class SortOrder(StrEnum):
+    """Direction a list is sorted and paged in."""
+
+    ASC = auto()
+    DESC = auto()
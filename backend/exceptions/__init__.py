@@ -1,23 +1,47 @@
 """Custom exception types for the API."""
 
-from exceptions.auth import AuthCredentialsError
+from exceptions.api_key import ApiKeyNotFoundError
+from exceptions.auth import (
+    AuthBusyError,
+    AuthCredentialsError,
+    AuthUnavailableError,
+)
 from exceptions.base import BaseError
 from exceptions.edge import EdgeNodeMismatchError, EdgeNotFoundError
-from exceptions.execution import ExecutionNotFoundError
+from exceptions.execution import (
+    ExecutionLimitError,
+    ExecutionNotFoundError,
+    NodeExecutionError,
+    PayloadUnavailableError,
+)
 from exceptions.llm_provider import LLMProviderNotFoundError
 from exceptions.node import NodeNotFoundError
+from exceptions.pagination import InvalidCursorError
 from exceptions.user import UserAlreadyExistsError, UserNotFoundError
-from exceptions.workflow import WorkflowNotFoundError
+from exceptions.workflow import (
+    WorkflowCycleError,
+    WorkflowGraphError,
+    WorkflowNotFoundError,
+)
 
 __all__ = [
+    "ApiKeyNotFoundError",
+    "AuthBusyError",
     "AuthCredentialsError",
+    "AuthUnavailableError",
     "BaseError",
     "EdgeNodeMismatchError",
     "EdgeNotFoundError",
+    "ExecutionLimitError",
     "ExecutionNotFoundError",
+    "InvalidCursorError",
     "LLMProviderNotFoundError",
+    "NodeExecutionError",
     "NodeNotFoundError",
+    "PayloadUnavailableError",
     "UserAlreadyExistsError",
     "UserNotFoundError",
+    "WorkflowCycleError",
+    "WorkflowGraphError",
     "WorkflowNotFoundError",
 ]
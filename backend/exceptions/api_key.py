@@ -0,0 +1,17 @@
+"""API key-related exceptions."""
+
+from http import HTTPStatus
+
+from exceptions.base import BaseError
+
+
+class ApiKeyNotFoundError(BaseError):
+    """Raised when an API key cannot be found."""
+
+    def __init__(
+        self,
+        message: str = "API key not found",
+        status_code: HTTPStatus = HTTPStatus.NOT_FOUND,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message=message, status_code=status_code)
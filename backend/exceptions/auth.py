@@ -15,3 +15,32 @@ class AuthCredentialsError(BaseError):
     ) -> None:
         """Initialize the error."""
         super().__init__(message=message, status_code=status_code)
+
+
+class AuthBusyError(BaseError):
+    """Raised when too many password checks are already queued."""
+
+    def __init__(
+        self,
+        retry_after: int,
+        message: str = "Too many authentication attempts in progress",
+        status_code: HTTPStatus = HTTPStatus.SERVICE_UNAVAILABLE,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(
+            message=message,
+            status_code=status_code,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class AuthUnavailableError(BaseError):
+    """Raised when cached credentials cannot be invalidated."""
+
+    def __init__(
+        self,
+        message: str = "Credentials cannot be revoked right now, try again later",
+        status_code: HTTPStatus = HTTPStatus.SERVICE_UNAVAILABLE,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message=message, status_code=status_code)
@@ -15,3 +15,44 @@ class ExecutionNotFoundError(BaseError):
     ) -> None:
         """Initialize the error."""
         super().__init__(message=message, status_code=status_code)
+
+
+class NodeExecutionError(BaseError):
+    """Raised when a node fails during an execution."""
+
+    def __init__(
+        self,
+        message: str = "Node execution failed",
+        status_code: HTTPStatus = HTTPStatus.UNPROCESSABLE_ENTITY,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message=message, status_code=status_code)
+
+
+class ExecutionLimitError(BaseError):
+    """Raised when a user exceeds their execution admission limits."""
+
+    def __init__(
+        self,
+        retry_after: int,
+        message: str = "Too many executions",
+        status_code: HTTPStatus = HTTPStatus.TOO_MANY_REQUESTS,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(
+            message=message,
+            status_code=status_code,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class PayloadUnavailableError(BaseError):
+    """Raised when an offloaded execution payload cannot be read back."""
+
+    def __init__(
+        self,
+        message: str = "Execution payload unavailable",
+        status_code: HTTPStatus = HTTPStatus.SERVICE_UNAVAILABLE,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message=message, status_code=status_code)
@@ -0,0 +1,17 @@
+"""Pagination-related exceptions."""
+
+from http import HTTPStatus
+
+from exceptions.base import BaseError
+
+
+class InvalidCursorError(BaseError):
+    """Raised when a page cursor cannot be decoded."""
+
+    def __init__(
+        self,
+        message: str = "Invalid page cursor",
+        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message=message, status_code=status_code)
@@ -15,3 +15,27 @@ class WorkflowNotFoundError(BaseError):
     ) -> None:
         """Initialize the error."""
         super().__init__(message=message, status_code=status_code)
+
+
+class WorkflowCycleError(BaseError):
+    """Raised when a workflow graph contains a cycle."""
+
+    def __init__(
+        self,
+        message: str = "Workflow graph contains a cycle",
+        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message=message, status_code=status_code)
+
+
+class WorkflowGraphError(BaseError):
+    """Raised when a submitted workflow graph is inconsistent."""
+
+    def __init__(
+        self,
+        message: str = "Invalid workflow graph",
+        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message=message, status_code=status_code)
@@ -0,0 +1,17 @@
+"""Clients for LLM providers."""
+
+from llm.cache import LLMResponseCache, llm_cache
+from llm.ollama import OllamaClient, OllamaError
+from llm.registry import LLMClientRegistry, llm_clients
+from llm.singleflight import SingleFlight, llm_singleflight
+
+__all__ = [
+    "LLMClientRegistry",
+    "LLMResponseCache",
+    "OllamaClient",
+    "OllamaError",
+    "SingleFlight",
+    "llm_cache",
+    "llm_clients",
+    "llm_singleflight",
+]
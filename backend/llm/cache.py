@@ -0,0 +1,99 @@
+"""Two-tier cache for LLM responses."""
+
+import hashlib
+import json
+import logging
+from collections import Counter
+
+import redis.asyncio as redis
+
+from settings import llm_settings
+from utils.cache import LRUCache
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """Cache completions in process and in Redis, keyed by request content.
+
+    The key hashes everything that determines the completion, so identical
+    requests share an entry no matter which execution sent them. Only nodes
+    that opt in are cached: sampling with a non-zero temperature is not
+    reproducible, and caching it would silently remove the randomness.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._local: LRUCache[str, str] = LRUCache(
+            maxsize=llm_settings.cache_size, ttl=llm_settings.cache_ttl
+        )
+        self.stats: Counter[str] = Counter()
+
+    @staticmethod
+    def key(provider_id: int, payload: dict) -> str:
+        """Build the content-addressed key of a request.
+
+        Args:
+            provider_id: The provider ID.
+            payload: The generate request.
+
+        Returns:
+            The cache key.
+
+        """
+        content = json.dumps(
+            {"provider_id": provider_id, **payload},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+
+        return f"llm:response:{hashlib.sha256(content.encode()).hexdigest()}"
+
+    async def get(self, key: str) -> str | None:
+        """Get a cached completion.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The completion, or None on a miss.
+
+        """
+        response = self._local.get(key=key)
+        if response is not None:
+            self.stats["local_hits"] += 1
+            return response
+
+        try:
+            response = await redis_client.get(key)
+        except redis.RedisError:
+            logger.warning("LLM cache unavailable", exc_info=True)
+            response = None
+
+        if response is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["redis_hits"] += 1
+        self._local.set(key=key, value=response)
+        return response
+
+    async def set(self, key: str, response: str) -> None:
+        """Cache a completion in both tiers.
+
+        Args:
+            key: The cache key.
+            response: The completion.
+
+        """
+        self._local.set(key=key, value=response)
+
+        try:
+            await redis_client.set(key, response, ex=llm_settings.cache_ttl)
+        except redis.RedisError:
+            logger.warning("LLM cache unavailable", exc_info=True)
+
+
+llm_cache = LLMResponseCache()
@@ -0,0 +1,98 @@
+"""Ollama HTTP client."""
+
+import json
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from settings import llm_settings
+
+type TokenCallback = Callable[[str], Awaitable[None]]
+
+
+class OllamaError(Exception):
+    """Raised when Ollama reports an error while generating."""
+
+
+class OllamaClient:
+    """Keep-alive connection pool to one Ollama server."""
+
+    def __init__(self, base_url: str) -> None:
+        """Initialize the client.
+
+        Args:
+            base_url: The Ollama server URL.
+
+        """
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=llm_settings.max_connections,
+                max_keepalive_connections=llm_settings.max_keepalive_connections,
+                keepalive_expiry=llm_settings.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=llm_settings.connect_timeout,
+                read=llm_settings.read_timeout,
+                write=llm_settings.write_timeout,
+                pool=llm_settings.pool_timeout,
+            ),
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        """Return whether the client has been closed."""
+        return self._client.is_closed
+
+    async def generate(
+        self,
+        payload: dict,
+        api_key: str | None = None,
+        on_token: TokenCallback | None = None,
+    ) -> str:
+        """Stream a completion from `/api/generate`.
+
+        Args:
+            payload: The generate request without the `stream` flag.
+            api_key: The bearer token, if the server requires one.
+            on_token: Called with every token as soon as it arrives.
+
+        Returns:
+            The generated text.
+
+        Raises:
+            OllamaError: If Ollama reports an error mid-stream.
+
+        """
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+        tokens: list[str] = []
+        async with self._client.stream(
+            "POST",
+            "/api/generate",
+            json={**payload, "stream": True},
+            headers=headers,
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise OllamaError(chunk["error"])
+
+                if chunk.get("response"):
+                    tokens.append(chunk["response"])
+                    if on_token:
+                        await on_token(chunk["response"])
+
+                if chunk.get("done"):
+                    break
+
+        return "".join(tokens)
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        await self._client.aclose()
@@ -0,0 +1,54 @@
+"""Shared LLM clients, one per provider base URL."""
+
+import asyncio
+from weakref import WeakKeyDictionary
+
+from llm.ollama import OllamaClient
+
+
+class LLMClientRegistry:
+    """Hand out long-lived pooled clients keyed by provider base URL.
+
+    Every execution in a worker shares the same client per Ollama server, so
+    node calls reuse keep-alive connections instead of opening new ones.
+    Connections belong to the event loop that opened them, so clients are
+    kept per loop: the API has a single loop, while Prefect runs every async
+    task on a loop of its own.
+
+    Clients are created lazily rather than warmed up at startup: providers
+    are only known from the database, and the loop of a Prefect task only
+    exists while the task runs. Whoever owns a loop closes its clients, the
+    API lifespan for the API loop and `run_node` for task loops.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._clients: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, OllamaClient]
+        ] = WeakKeyDictionary()
+
+    def get(self, base_url: str) -> OllamaClient:
+        """Get the client of a provider, creating it on first use.
+
+        Args:
+            base_url: The provider base URL.
+
+        Returns:
+            The client.
+
+        """
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+
+        client = clients.get(base_url)
+        if client is None or client.is_closed:
+            client = clients[base_url] = OllamaClient(base_url=base_url)
+
+        return client
+
+    async def close(self) -> None:
+        """Close the clients of the current event loop."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        await asyncio.gather(*(client.close() for client in clients.values()))
+
+
+llm_clients = LLMClientRegistry()
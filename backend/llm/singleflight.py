@@ -0,0 +1,220 @@
+"""Coalescing of identical in-flight LLM requests."""
+
+import asyncio
+import logging
+import secrets
+from collections.abc import Awaitable, Callable
+from weakref import WeakKeyDictionary
+
+import redis.asyncio as redis
+
+from settings import llm_settings
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS: lock. ARGV: owner token, lease in ms. Extends the lease if still owned.
+EXTEND_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS: lock. ARGV: owner token. Releases the lock if still owned.
+RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """Share one upstream call between concurrent identical requests.
+
+    Inside a worker, callers with the same key await the future of the first
+    one. Across workers, the first caller takes a Redis lock whose short
+    lease it keeps renewing while the call runs, and publishes the result
+    under the key; other workers poll for it. A follower takes over when the
+    leader's lease lapses without a result, and falls back to calling
+    upstream itself when Redis is unavailable or the wait times out.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scripts."""
+        self._flights: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Future[str]]
+        ] = WeakKeyDictionary()
+        self._extend = redis_client.register_script(script=EXTEND_SCRIPT)
+        self._release = redis_client.register_script(script=RELEASE_SCRIPT)
+
+    async def do(self, key: str, call: Callable[[], Awaitable[str]]) -> str:
+        """Run a call unless an identical one is already in flight.
+
+        Args:
+            key: The request key.
+            call: The upstream call.
+
+        Returns:
+            The result of this call or of the one it joined.
+
+        """
+        flights = self._flights.setdefault(asyncio.get_running_loop(), {})
+
+        flight = flights.get(key)
+        if flight is not None:
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            # The leader was cancelled; its followers start over.
+            return await self.do(key=key, call=call)
+
+        flight = flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await self._lead_or_follow(key=key, call=call)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            flights.pop(key, None)
+
+    async def _lead_or_follow(
+        self, key: str, call: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Coordinate a call with the other workers.
+
+        Args:
+            key: The request key.
+            call: The upstream call.
+
+        Returns:
+            The result of the call, made here or by another worker.
+
+        """
+        lock_key, result_key = f"singleflight:{key}:lock", f"singleflight:{key}:result"
+        token = secrets.token_hex(16)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + llm_settings.singleflight_wait
+
+        while loop.time() < deadline:
+            try:
+                acquired = await redis_client.set(
+                    lock_key,
+                    token,
+                    nx=True,
+                    px=int(llm_settings.singleflight_lease * 1000),
+                )
+                if acquired:
+                    return await self._lead(
+                        lock_key=lock_key,
+                        result_key=result_key,
+                        token=token,
+                        call=call,
+                    )
+
+                result = await self._follow(
+                    lock_key=lock_key, result_key=result_key, deadline=deadline
+                )
+            except redis.RedisError:
+                logger.warning("Request coalescing unavailable", exc_info=True)
+                break
+
+            if result is not None:
+                return result
+
+        return await call()
+
+    async def _lead(
+        self,
+        lock_key: str,
+        result_key: str,
+        token: str,
+        call: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Run the call while holding the lock and publish its result.
+
+        Args:
+            lock_key: The lock key.
+            result_key: The key the result is published under.
+            token: The lock owner token.
+            call: The upstream call.
+
+        Returns:
+            The result of the call.
+
+        """
+        renewal = asyncio.create_task(self._renew(lock_key=lock_key, token=token))
+        try:
+            result = await call()
+            try:
+                await redis_client.set(
+                    result_key,
+                    result,
+                    px=int(llm_settings.singleflight_result_ttl * 1000),
+                )
+            except redis.RedisError:
+                logger.warning("Request coalescing unavailable", exc_info=True)
+
+            return result
+        finally:
+            renewal.cancel()
+            try:
+                await self._release(keys=[lock_key], args=[token])
+            except redis.RedisError:
+                logger.warning("Request coalescing unavailable", exc_info=True)
+
+    async def _renew(self, lock_key: str, token: str) -> None:
+        """Keep extending the lock lease until cancelled.
+
+        Args:
+            lock_key: The lock key.
+            token: The lock owner token.
+
+        """
+        lease = int(llm_settings.singleflight_lease * 1000)
+        while True:
+            await asyncio.sleep(llm_settings.singleflight_lease / 3)
+            try:
+                if not await self._extend(keys=[lock_key], args=[token, lease]):
+                    return
+            except redis.RedisError:
+                logger.warning("Request coalescing unavailable", exc_info=True)
+                return
+
+    @staticmethod
+    async def _follow(lock_key: str, result_key: str, deadline: float) -> str | None:
+        """Wait for another worker to publish the result.
+
+        Args:
+            lock_key: The lock key.
+            result_key: The key the result is published under.
+            deadline: The loop time to stop waiting at.
+
+        Returns:
+            The result, or None once the lock is gone without one.
+
+        """
+        loop = asyncio.get_running_loop()
+        while loop.time() < deadline:
+            result, owner = await redis_client.mget(result_key, lock_key)
+            if result is not None:
+                return result
+            if owner is None:
+                return None
+
+            await asyncio.sleep(llm_settings.singleflight_poll_interval)
+
+        return None
+
+
+llm_singleflight = SingleFlight()
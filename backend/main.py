@@ -1,10 +1,16 @@
 """Graph AI Backend entrypoint."""
 
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from engine import execution_engine, flow_run_submitter
 from exceptions import BaseError
+from llm import llm_clients
 from routers import (
+    api_key,
     auth,
     edge,
     execution,
@@ -14,8 +20,68 @@ from routers import (
     user,
     workflow,
 )
+from sessions import async_session
+from settings import execution_settings
+from usecases import AuthUsecase, ExecutionArchiveUsecase, ExecutionUsecase
+from utils.crypto import password_hasher
+from utils.jobs import PeriodicJob
+from utils.rate_limit import RateLimitMiddleware
+from utils.redis import redis_client
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
+    """Manage application-wide resources.
+
+    Args:
+        _: The application.
+
+    Yields:
+        Control while the application is running.
+
+    """
+    async with async_session() as session:
+        await AuthUsecase().sync_revocations(session=session)
+
+    archive_usecase = ExecutionArchiveUsecase()
+    execution_usecase = ExecutionUsecase()
+    jobs = [
+        PeriodicJob(
+            name="executions:partitions",
+            interval=execution_settings.maintenance_interval,
+            job=archive_usecase.create_partitions,
+        ),
+        PeriodicJob(
+            name="executions:archive",
+            interval=execution_settings.maintenance_interval,
+            job=archive_usecase.archive_partitions,
+        ),
+        PeriodicJob(
+            name="executions:queue",
+            interval=execution_settings.maintenance_interval,
+            job=execution_usecase.expire_queued,
+        ),
+        PeriodicJob(
+            name="node_results:expire",
+            interval=execution_settings.maintenance_interval,
+            job=execution_usecase.expire_node_results,
+        ),
+    ]
+    for job in jobs:
+        job.start()
+
+    yield
+    for job in jobs:
+        await job.stop()
+    await flow_run_submitter.close()
+    await execution_engine.drain()
+    await llm_clients.close()
+    await redis_client.aclose()
+    password_hasher.shutdown()
+
 
-app = FastAPI(title="Graph AI Backend")
+app = FastAPI(title="Graph AI Backend", lifespan=lifespan)
+app.add_middleware(middleware_class=RateLimitMiddleware)
 
 
 @app.exception_handler(exc_class_or_status_code=BaseError)
@@ -27,15 +93,20 @@ async def handle_base_error(_: Request, exc: BaseError) -> JSONResponse:
         exc: The domain error.
 
     Returns:
-        A JSON response with the error detail.
+        A JSON response with the error detail and headers.
 
     """
-    return JSONResponse(status_code=exc.status_code, content={"detail": exc.message})
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.message},
+        headers=exc.headers,
+    )
 
 
 app.include_router(router=health.router)
 app.include_router(router=auth.router)
 app.include_router(router=user.router)
+app.include_router(router=api_key.router)
 app.include_router(router=workflow.router)
 app.include_router(router=node.router)
 app.include_router(router=edge.router)
@@ -8,6 +8,7 @@ from sqlalchemy.engine.base import Connection
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from models import Base
+from sessions import engine_options
 from settings import postgres_settings
 
 config = context.config
@@ -67,7 +68,7 @@ async def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = create_async_engine(url=postgres_settings.url)
+    connectable = create_async_engine(url=postgres_settings.url, **engine_options())
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
@@ -0,0 +1,46 @@
+"""Add blob references for offloaded execution payloads.
+
+Revision ID: 0b7d3e9a5c42
+Revises: f4a9b2d6c813
+Create Date: 2026-10-17 17:11:38.204519
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b7d3e9a5c42"
+down_revision: str | None = "f4a9b2d6c813"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the payload reference columns."""
+    op.add_column(
+        "executions",
+        sa.Column(
+            "input_ref",
+            sa.String(length=64),
+            nullable=True,
+            comment="Blob reference of input data too large to keep inline",
+        ),
+    )
+    op.add_column(
+        "executions",
+        sa.Column(
+            "output_ref",
+            sa.String(length=64),
+            nullable=True,
+            comment="Blob reference of output data too large to keep inline",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the payload reference columns."""
+    op.drop_column("executions", "output_ref")
+    op.drop_column("executions", "input_ref")
@@ -0,0 +1,45 @@
+"""Add tombstones of deleted users.
+
+Revision ID: 3c7a9e1d5b28
+Revises: 6a3f8d2c9e17
+Create Date: 2026-10-19 14:27:05.318462
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c7a9e1d5b28"
+down_revision: str | None = "6a3f8d2c9e17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the revoked_users table."""
+    op.create_table(
+        "revoked_users",
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            autoincrement=False,
+            nullable=False,
+            comment="ID of the deleted user",
+        ),
+        sa.Column(
+            "revoked_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Deletion time",
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the revoked_users table."""
+    op.drop_table("revoked_users")
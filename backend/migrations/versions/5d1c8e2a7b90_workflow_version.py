@@ -0,0 +1,37 @@
+"""Add workflow graph version.
+
+Revision ID: 5d1c8e2a7b90
+Revises: 96078f6fa6ee
+Create Date: 2026-10-17 09:12:41.503118
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1c8e2a7b90"
+down_revision: str | None = "96078f6fa6ee"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the version column to workflows."""
+    op.add_column(
+        "workflows",
+        sa.Column(
+            "version",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Graph version, bumped on every node or edge change",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the version column from workflows."""
+    op.drop_column("workflows", "version")
@@ -0,0 +1,40 @@
+"""Index execution payload references for the blob sweep.
+
+Revision ID: 6a3f8d2c9e17
+Revises: b5e9c3a7d214
+Create Date: 2026-10-19 10:04:31.772905
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6a3f8d2c9e17"
+down_revision: str | None = "b5e9c3a7d214"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create partial indexes on the input and output references."""
+    op.create_index(
+        "ix_executions_input_ref",
+        "executions",
+        ["input_ref"],
+        postgresql_where=sa.text("input_ref IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_executions_output_ref",
+        "executions",
+        ["output_ref"],
+        postgresql_where=sa.text("output_ref IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the reference indexes."""
+    op.drop_index("ix_executions_output_ref", table_name="executions")
+    op.drop_index("ix_executions_input_ref", table_name="executions")
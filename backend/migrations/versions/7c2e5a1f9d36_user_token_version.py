@@ -0,0 +1,37 @@
+"""Add the user token version.
+
+Revision ID: 7c2e5a1f9d36
+Revises: 0b7d3e9a5c42
+Create Date: 2026-10-17 18:24:51.630172
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e5a1f9d36"
+down_revision: str | None = "0b7d3e9a5c42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the token_version column."""
+    op.add_column(
+        "users",
+        sa.Column(
+            "token_version",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Version of the access tokens, bumped to revoke all of them",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the token_version column."""
+    op.drop_column("users", "token_version")
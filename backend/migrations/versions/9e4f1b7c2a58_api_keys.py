@@ -0,0 +1,66 @@
+"""Add API keys.
+
+Revision ID: 9e4f1b7c2a58
+Revises: 7c2e5a1f9d36
+Create Date: 2026-10-17 19:03:12.745920
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4f1b7c2a58"
+down_revision: str | None = "7c2e5a1f9d36"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the api_keys table."""
+    op.create_table(
+        "api_keys",
+        sa.Column("user_id", sa.Integer(), nullable=False, comment="Owner user ID"),
+        sa.Column(
+            "name", sa.String(length=128), nullable=False, comment="Key display name"
+        ),
+        sa.Column(
+            "prefix",
+            sa.String(length=16),
+            nullable=False,
+            comment="Public part of the key used to look it up",
+        ),
+        sa.Column(
+            "digest",
+            sa.String(length=64),
+            nullable=False,
+            comment="HMAC-SHA256 digest of the key",
+        ),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False, comment="ID"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Created at",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Updated at",
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("prefix"),
+    )
+    op.create_index(op.f("ix_api_keys_user_id"), "api_keys", ["user_id"])
+
+
+def downgrade() -> None:
+    """Drop the api_keys table."""
+    op.drop_index(op.f("ix_api_keys_user_id"), table_name="api_keys")
+    op.drop_table("api_keys")
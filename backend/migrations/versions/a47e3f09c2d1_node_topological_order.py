@@ -0,0 +1,109 @@
+"""Add node topological order.
+
+Revision ID: a47e3f09c2d1
+Revises: 5d1c8e2a7b90
+Create Date: 2026-10-17 10:04:18.220571
+
+"""
+
+from collections import defaultdict, deque
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a47e3f09c2d1"
+down_revision: str | None = "5d1c8e2a7b90"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+nodes = sa.table(
+    "nodes",
+    sa.column("id", sa.Integer),
+    sa.column("workflow_id", sa.Integer),
+    sa.column("topological_order", sa.Integer),
+)
+edges = sa.table(
+    "edges",
+    sa.column("id", sa.Integer),
+    sa.column("source_node_id", sa.Integer),
+    sa.column("target_node_id", sa.Integer),
+)
+
+
+def _rank_nodes(connection: sa.Connection) -> list[dict[str, int]]:
+    """Compute an initial topological order of every workflow.
+
+    Nodes left over by a pre-existing cycle are ranked last, in ID order.
+
+    Args:
+        connection: The migration connection.
+
+    Returns:
+        The rank of every node.
+
+    """
+    workflow_nodes: defaultdict[int, list[int]] = defaultdict(list)
+    for node_id, workflow_id in connection.execute(
+        sa.select(nodes.c.id, nodes.c.workflow_id).order_by(nodes.c.id)
+    ):
+        workflow_nodes[workflow_id].append(node_id)
+
+    successors: defaultdict[int, list[int]] = defaultdict(list)
+    indegree: defaultdict[int, int] = defaultdict(int)
+    for source, target in connection.execute(
+        sa.select(edges.c.source_node_id, edges.c.target_node_id)
+    ):
+        successors[source].append(target)
+        indegree[target] += 1
+
+    ranks = []
+    for node_ids in workflow_nodes.values():
+        ready = deque(node_id for node_id in node_ids if indegree[node_id] == 0)
+        ordered: list[int] = []
+        while ready:
+            node_id = ready.popleft()
+            ordered.append(node_id)
+            for successor in successors[node_id]:
+                indegree[successor] -= 1
+                if indegree[successor] == 0:
+                    ready.append(successor)
+
+        seen = set(ordered)
+        ordered.extend(node_id for node_id in node_ids if node_id not in seen)
+        ranks.extend(
+            {"node_id": node_id, "rank": rank}
+            for rank, node_id in enumerate(ordered, start=1)
+        )
+
+    return ranks
+
+
+def upgrade() -> None:
+    """Add and backfill the topological_order column of nodes."""
+    op.add_column(
+        "nodes",
+        sa.Column(
+            "topological_order",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Rank in the workflow topological order",
+        ),
+    )
+
+    connection = op.get_bind()
+    ranks = _rank_nodes(connection=connection)
+    if ranks:
+        connection.execute(
+            nodes.update()
+            .where(nodes.c.id == sa.bindparam("node_id"))
+            .values(topological_order=sa.bindparam("rank")),
+            ranks,
+        )
+
+
+def downgrade() -> None:
+    """Drop the topological_order column of nodes."""
+    op.drop_column("nodes", "topological_order")
@@ -0,0 +1,27 @@
+"""Index memoized node results by creation time.
+
+Revision ID: b5e9c3a7d214
+Revises: d2a6f8c41b37
+Create Date: 2026-10-18 09:12:44.506173
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e9c3a7d214"
+down_revision: str | None = "d2a6f8c41b37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the created_at index."""
+    op.create_index("ix_node_results_created_at", "node_results", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop the created_at index."""
+    op.drop_index("ix_node_results_created_at", table_name="node_results")
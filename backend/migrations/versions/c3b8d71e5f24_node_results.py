@@ -0,0 +1,64 @@
+"""Add memoized node results.
+
+Revision ID: c3b8d71e5f24
+Revises: a47e3f09c2d1
+Create Date: 2026-10-17 13:05:27.318904
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c3b8d71e5f24"
+down_revision: str | None = "a47e3f09c2d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the node_results table."""
+    op.create_table(
+        "node_results",
+        sa.Column(
+            "workflow_id", sa.Integer(), nullable=False, comment="Parent workflow ID"
+        ),
+        sa.Column(
+            "node_hash",
+            sa.String(length=64),
+            nullable=False,
+            comment="Hash of the node configuration and its upstream hashes",
+        ),
+        sa.Column(
+            "output",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Node output",
+        ),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False, comment="ID"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Created at",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Updated at",
+        ),
+        sa.ForeignKeyConstraint(["workflow_id"], ["workflows.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("workflow_id", "node_hash"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the node_results table."""
+    op.drop_table("node_results")
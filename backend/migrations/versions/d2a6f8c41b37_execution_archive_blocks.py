@@ -0,0 +1,38 @@
+"""Add the block index of execution archive files.
+
+Revision ID: d2a6f8c41b37
+Revises: 9e4f1b7c2a58
+Create Date: 2026-10-17 21:42:05.318274
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a6f8c41b37"
+down_revision: str | None = "9e4f1b7c2a58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the blocks column."""
+    op.add_column(
+        "execution_archives",
+        sa.Column(
+            "blocks",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default="[]",
+            nullable=False,
+            comment="First execution ID and file offset of each gzip member",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the blocks column."""
+    op.drop_column("execution_archives", "blocks")
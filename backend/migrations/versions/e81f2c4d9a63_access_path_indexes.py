@@ -0,0 +1,47 @@
+"""Add foreign key and access path indexes.
+
+Revision ID: e81f2c4d9a63
+Revises: c3b8d71e5f24
+Create Date: 2026-10-17 14:21:09.482615
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e81f2c4d9a63"
+down_revision: str | None = "c3b8d71e5f24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the indexes."""
+    op.create_index(op.f("ix_workflows_owner_id"), "workflows", ["owner_id"])
+    op.create_index(op.f("ix_llm_providers_user_id"), "llm_providers", ["user_id"])
+    op.create_index(
+        "ix_nodes_workflow_id_topological_order",
+        "nodes",
+        ["workflow_id", "topological_order"],
+    )
+    op.create_index(op.f("ix_edges_workflow_id"), "edges", ["workflow_id"])
+    op.create_index(op.f("ix_edges_source_node_id"), "edges", ["source_node_id"])
+    op.create_index(op.f("ix_edges_target_node_id"), "edges", ["target_node_id"])
+    op.create_index(
+        "ix_executions_workflow_id_started_at",
+        "executions",
+        ["workflow_id", "started_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the indexes."""
+    op.drop_index("ix_executions_workflow_id_started_at", table_name="executions")
+    op.drop_index(op.f("ix_edges_target_node_id"), table_name="edges")
+    op.drop_index(op.f("ix_edges_source_node_id"), table_name="edges")
+    op.drop_index(op.f("ix_edges_workflow_id"), table_name="edges")
+    op.drop_index("ix_nodes_workflow_id_topological_order", table_name="nodes")
+    op.drop_index(op.f("ix_llm_providers_user_id"), table_name="llm_providers")
+    op.drop_index(op.f("ix_workflows_owner_id"), table_name="workflows")
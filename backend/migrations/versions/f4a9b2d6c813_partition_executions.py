@@ -0,0 +1,232 @@
+"""Partition executions by month and add execution archives.
+
+Revision ID: f4a9b2d6c813
+Revises: e81f2c4d9a63
+Create Date: 2026-10-17 16:02:44.917362
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a9b2d6c813"
+down_revision: str | None = "e81f2c4d9a63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Creates a partition for every month from the oldest execution to three
+# months ahead, so the existing rows do not all land in the default one.
+CREATE_MONTHLY_PARTITIONS = """
+DO $$
+DECLARE
+    month timestamp;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            (
+                SELECT date_trunc('month', coalesce(min(started_at), localtimestamp))
+                FROM executions_unpartitioned
+            ),
+            date_trunc('month', localtimestamp) + interval '3 months',
+            interval '1 month'
+        )
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF executions FOR VALUES FROM (%L) TO (%L)',
+            'executions_p' || to_char(month, 'YYYY_MM'),
+            month,
+            month + interval '1 month'
+        );
+    END LOOP;
+END
+$$
+"""
+
+COLUMNS = (
+    "id, workflow_id, status, input_data, output_data, error, started_at, finished_at"
+)
+
+
+def _execution_columns() -> list[sa.Column]:
+    """Build the columns of the executions table.
+
+    Returns:
+        The columns, with the ID drawn from the existing sequence.
+
+    """
+    return [
+        sa.Column(
+            "workflow_id", sa.Integer(), nullable=False, comment="Parent workflow ID"
+        ),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "CREATED",
+                "RUNNING",
+                "SUCCESS",
+                "FAILED",
+                name="executionstatus",
+                create_type=False,
+            ),
+            nullable=False,
+            comment="Execution status",
+        ),
+        sa.Column(
+            "input_data",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Input data for execution",
+        ),
+        sa.Column(
+            "output_data",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Output data from execution",
+        ),
+        sa.Column("error", sa.Text(), nullable=True, comment="Error message if failed"),
+        sa.Column(
+            "started_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Execution start time",
+        ),
+        sa.Column(
+            "finished_at", sa.DateTime(), nullable=True, comment="Execution end time"
+        ),
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('executions_id_seq')"),
+            nullable=False,
+            comment="ID",
+        ),
+        sa.ForeignKeyConstraint(["workflow_id"], ["workflows.id"], ondelete="CASCADE"),
+    ]
+
+
+def _swap_executions(primary_key: list[str], **kwargs: str) -> None:
+    """Rebuild the executions table and move the rows into it.
+
+    Args:
+        primary_key: The primary key columns of the new table.
+        **kwargs: The dialect options of the new table.
+
+    """
+    op.execute("ALTER SEQUENCE executions_id_seq OWNED BY NONE")
+    op.drop_index("ix_executions_workflow_id_started_at", table_name="executions")
+    op.rename_table("executions", "executions_unpartitioned")
+    op.execute(
+        "ALTER TABLE executions_unpartitioned "
+        "RENAME CONSTRAINT executions_pkey TO executions_unpartitioned_pkey"
+    )
+
+    op.create_table(
+        "executions",
+        *_execution_columns(),
+        sa.PrimaryKeyConstraint(*primary_key, name="executions_pkey"),
+        **kwargs,
+    )
+
+
+def _finish_swap() -> None:
+    """Copy the rows over, drop the old table and restore the index."""
+    op.execute(
+        f"INSERT INTO executions ({COLUMNS}) "  # noqa: S608
+        f"SELECT {COLUMNS} FROM executions_unpartitioned"
+    )
+    op.drop_table("executions_unpartitioned")
+    op.execute("ALTER SEQUENCE executions_id_seq OWNED BY executions.id")
+    op.create_index(
+        "ix_executions_workflow_id_started_at",
+        "executions",
+        ["workflow_id", "started_at"],
+    )
+
+
+def upgrade() -> None:
+    """Partition the executions table and create the execution_archives table."""
+    _swap_executions(
+        primary_key=["id", "started_at"],
+        postgresql_partition_by="RANGE (started_at)",
+    )
+    op.execute("CREATE TABLE executions_default PARTITION OF executions DEFAULT")
+    op.execute(CREATE_MONTHLY_PARTITIONS)
+    _finish_swap()
+
+    op.create_table(
+        "execution_archives",
+        sa.Column(
+            "partition",
+            sa.String(length=63),
+            nullable=False,
+            comment="Name of the archived partition",
+        ),
+        sa.Column(
+            "path",
+            sa.String(length=1024),
+            nullable=False,
+            comment="Path of the archive file",
+        ),
+        sa.Column(
+            "range_start",
+            sa.DateTime(),
+            nullable=False,
+            comment="Earliest start time the partition covered",
+        ),
+        sa.Column(
+            "range_end",
+            sa.DateTime(),
+            nullable=False,
+            comment="Start time the partition covered up to, exclusive",
+        ),
+        sa.Column(
+            "min_id",
+            sa.Integer(),
+            nullable=True,
+            comment="Lowest archived execution ID",
+        ),
+        sa.Column(
+            "max_id",
+            sa.Integer(),
+            nullable=True,
+            comment="Highest archived execution ID",
+        ),
+        sa.Column(
+            "row_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of archived executions",
+        ),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False, comment="ID"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Created at",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Updated at",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("partition"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the execution_archives table and merge the executions partitions.
+
+    Archived executions are not restored.
+    """
+    op.drop_table("execution_archives")
+    _swap_executions(primary_key=["id"])
+    _finish_swap()
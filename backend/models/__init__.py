@@ -1,21 +1,32 @@
 """Model exports for the backend."""
 
+# Loaded first, since the models import their bases from this package.
 from models.base import Base, BaseWithDate, BaseWithID
+
+# isort: split
+from models.api_key import ApiKey
 from models.edge import Edge
 from models.execution import Execution
+from models.execution_archive import ExecutionArchive
 from models.llm_provider import LLMProvider
 from models.node import Node
+from models.node_result import NodeResult
+from models.revoked_user import RevokedUser
 from models.user import User
 from models.workflow import Workflow
 
 __all__ = [
+    "ApiKey",
     "Base",
     "BaseWithDate",
     "BaseWithID",
     "Edge",
     "Execution",
+    "ExecutionArchive",
     "LLMProvider",
     "Node",
+    "NodeResult",
+    "RevokedUser",
     "User",
     "Workflow",
 ]
@@ -0,0 +1,36 @@
+"""API key model."""
+
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models import BaseWithDate, BaseWithID
+
+
+class ApiKey(BaseWithID, BaseWithDate):
+    """Long-lived credential for machine clients."""
+
+    __tablename__ = "api_keys"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Owner user ID",
+    )
+
+    name: Mapped[str] = mapped_column(
+        String(128),
+        nullable=False,
+        comment="Key display name",
+    )
+    prefix: Mapped[str] = mapped_column(
+        String(16),
+        unique=True,
+        nullable=False,
+        comment="Public part of the key used to look it up",
+    )
+    digest: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="HMAC-SHA256 digest of the key",
+    )
@@ -14,15 +14,18 @@ class Edge(BaseWithID):
     workflow_id: Mapped[int] = mapped_column(
         ForeignKey("workflows.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         comment="Parent workflow ID",
     )
     source_node_id: Mapped[int] = mapped_column(
         ForeignKey("nodes.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         comment="Source node ID",
     )
     target_node_id: Mapped[int] = mapped_column(
         ForeignKey("nodes.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         comment="Target node ID",
     )
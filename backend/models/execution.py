@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, Text, func
+from sqlalchemy import DDL, Enum, ForeignKey, Index, String, Text, event, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,9 +11,23 @@ from models import BaseWithID
 
 
 class Execution(BaseWithID):
-    """Workflow execution record."""
+    """Workflow execution record, range partitioned by month of start."""
 
     __tablename__ = "executions"
+    __table_args__ = (
+        Index("ix_executions_workflow_id_started_at", "workflow_id", "started_at"),
+        Index(
+            "ix_executions_input_ref",
+            "input_ref",
+            postgresql_where=text("input_ref IS NOT NULL"),
+        ),
+        Index(
+            "ix_executions_output_ref",
+            "output_ref",
+            postgresql_where=text("output_ref IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (started_at)"},
+    )
 
     workflow_id: Mapped[int] = mapped_column(
         ForeignKey("workflows.id", ondelete="CASCADE"),
@@ -34,10 +48,30 @@ class Execution(BaseWithID):
         JSONB,
         comment="Output data from execution",
     )
+    input_ref: Mapped[str | None] = mapped_column(
+        String(64),
+        comment="Blob reference of input data too large to keep inline",
+    )
+    output_ref: Mapped[str | None] = mapped_column(
+        String(64),
+        comment="Blob reference of output data too large to keep inline",
+    )
     error: Mapped[str | None] = mapped_column(Text, comment="Error message if failed")
 
     started_at: Mapped[datetime] = mapped_column(
+        primary_key=True,
         server_default=func.now(),
         comment="Execution start time",
     )
     finished_at: Mapped[datetime | None] = mapped_column(comment="Execution end time")
+
+
+# Rows outside the monthly partitions land here, so inserts never fail while
+# the maintenance job has not created a partition yet.
+event.listen(
+    Execution.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS executions_default PARTITION OF executions DEFAULT"
+    ),
+)
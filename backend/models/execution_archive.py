@@ -0,0 +1,56 @@
+"""Execution archive model."""
+
+from datetime import datetime
+
+from sqlalchemy import Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models import BaseWithDate, BaseWithID
+
+
+class ExecutionArchive(BaseWithID, BaseWithDate):
+    """Compressed file holding the executions of a detached partition."""
+
+    __tablename__ = "execution_archives"
+
+    partition: Mapped[str] = mapped_column(
+        String(63),
+        unique=True,
+        nullable=False,
+        comment="Name of the archived partition",
+    )
+    path: Mapped[str] = mapped_column(
+        String(1024),
+        nullable=False,
+        comment="Path of the archive file",
+    )
+    range_start: Mapped[datetime] = mapped_column(
+        nullable=False,
+        comment="Earliest start time the partition covered",
+    )
+    range_end: Mapped[datetime] = mapped_column(
+        nullable=False,
+        comment="Start time the partition covered up to, exclusive",
+    )
+    min_id: Mapped[int | None] = mapped_column(
+        Integer,
+        comment="Lowest archived execution ID",
+    )
+    max_id: Mapped[int | None] = mapped_column(
+        Integer,
+        comment="Highest archived execution ID",
+    )
+    row_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Number of archived executions",
+    )
+    blocks: Mapped[list[list[int]]] = mapped_column(
+        JSONB,
+        default=list,
+        server_default="[]",
+        nullable=False,
+        comment="First execution ID and file offset of each gzip member",
+    )
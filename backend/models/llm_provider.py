@@ -15,6 +15,7 @@ class LLMProvider(BaseWithID):
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         comment="Owner user ID",
     )
 
@@ -1,6 +1,6 @@
 """Node models."""
 
-from sqlalchemy import Enum, Float, ForeignKey
+from sqlalchemy import Enum, Float, ForeignKey, Index, Integer
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,6 +12,11 @@ class Node(BaseWithID):
     """Base node in a workflow graph."""
 
     __tablename__ = "nodes"
+    __table_args__ = (
+        Index(
+            "ix_nodes_workflow_id_topological_order", "workflow_id", "topological_order"
+        ),
+    )
 
     workflow_id: Mapped[int] = mapped_column(
         ForeignKey("workflows.id", ondelete="CASCADE"),
@@ -43,3 +48,10 @@ class Node(BaseWithID):
         default=0.0,
         comment="Y position on canvas",
     )
+    topological_order: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Rank in the workflow topological order",
+    )
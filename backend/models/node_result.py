@@ -0,0 +1,31 @@
+"""Memoized node output model."""
+
+from typing import Any
+
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models import BaseWithDate, BaseWithID
+
+
+class NodeResult(BaseWithID, BaseWithDate):
+    """Output of a node run, addressed by the node's Merkle hash."""
+
+    __tablename__ = "node_results"
+    __table_args__ = (
+        UniqueConstraint("workflow_id", "node_hash"),
+        Index("ix_node_results_created_at", "created_at"),
+    )
+
+    workflow_id: Mapped[int] = mapped_column(
+        ForeignKey("workflows.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Parent workflow ID",
+    )
+    node_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="Hash of the node configuration and its upstream hashes",
+    )
+    output: Mapped[Any] = mapped_column(JSONB, comment="Node output")
@@ -0,0 +1,24 @@
+"""Revoked user model."""
+
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models import Base
+
+
+class RevokedUser(Base):
+    """Tombstone of a deleted user, whose tokens stay revoked for good."""
+
+    __tablename__ = "revoked_users"
+
+    user_id: Mapped[int] = mapped_column(
+        primary_key=True,
+        autoincrement=False,
+        comment="ID of the deleted user",
+    )
+    revoked_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(),
+        comment="Deletion time",
+    )
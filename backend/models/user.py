@@ -1,6 +1,6 @@
 """User model."""
 
-from sqlalchemy import String
+from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from models import BaseWithDate, BaseWithID
@@ -22,3 +22,10 @@ class User(BaseWithID, BaseWithDate):
         nullable=False,
         comment="Hashed password",
     )
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Version of the access tokens, bumped to revoke all of them",
+    )
@@ -1,6 +1,6 @@
 """Workflow model."""
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from models import BaseWithDate, BaseWithID
@@ -14,6 +14,7 @@ class Workflow(BaseWithID, BaseWithDate):
     owner_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         comment="Owner user ID",
     )
 
@@ -22,3 +23,10 @@ class Workflow(BaseWithID, BaseWithDate):
         nullable=False,
         comment="Workflow name",
     )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Graph version, bumped on every node or edge change",
+    )
@@ -1,17 +1,25 @@
 """Repository interfaces for database access."""
 
+from repositories.api_key import ApiKeyRepository
 from repositories.edge import EdgeRepository
 from repositories.execution import ExecutionRepository
+from repositories.execution_archive import ExecutionArchiveRepository
+from repositories.execution_partition import ExecutionPartitionRepository
 from repositories.llm_provider import LLMProviderRepository
 from repositories.node import NodeRepository
+from repositories.node_result import NodeResultRepository
 from repositories.user import UserRepository
 from repositories.workflow import WorkflowRepository
 
 __all__ = [
+    "ApiKeyRepository",
     "EdgeRepository",
+    "ExecutionArchiveRepository",
+    "ExecutionPartitionRepository",
     "ExecutionRepository",
     "LLMProviderRepository",
     "NodeRepository",
+    "NodeResultRepository",
     "UserRepository",
     "WorkflowRepository",
 ]
@@ -0,0 +1,36 @@
+"""Repository for API keys."""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import ApiKey, User
+from repositories.base import BaseRepository
+
+
+class ApiKeyRepository(BaseRepository[ApiKey]):
+    """Repository for ApiKey model operations."""
+
+    def __init__(self) -> None:
+        """Initialize the repository with the ApiKey model."""
+        super().__init__(model=ApiKey)
+
+    async def get_owner(
+        self, session: AsyncSession, prefix: str
+    ) -> tuple[str, User] | None:
+        """Get the digest of a key and its owner in one indexed lookup.
+
+        Args:
+            session: The async session.
+            prefix: The key prefix.
+
+        Returns:
+            The key digest and the owner, or None if no key has the prefix.
+
+        """
+        result = await session.execute(
+            statement=select(ApiKey.digest, User)
+            .join(User, User.id == ApiKey.user_id)
+            .where(ApiKey.prefix == prefix)
+        )
+
+        return result.tuples().one_or_none()
@@ -1,10 +1,15 @@
 """Base repository abstraction for SQLAlchemy models."""
 
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from enums import SortOrder
+from utils.pagination import Page, decode_cursor, encode_cursor
+
 
 class BaseRepository[Model: object]:
     """Generic repository providing CRUD operations."""
@@ -14,7 +19,7 @@ class BaseRepository[Model: object]:
         self.model = model
 
     async def create(self, session: AsyncSession, data: dict[str, Any]) -> Model:
-        """Create a new model instance.
+        """Create a new model instance with INSERT ... RETURNING.
 
         Args:
             session: The async session.
@@ -24,36 +29,109 @@ class BaseRepository[Model: object]:
             The created model instance.
 
         """
-        instance = self.model(**data)
-
-        session.add(instance)
+        result = await session.execute(
+            statement=insert(self.model).values(**data).returning(self.model)
+        )
+        instance = result.scalar_one()
         await session.commit()
-        await session.refresh(instance)
 
         return instance
 
     async def create_many(
         self, session: AsyncSession, data: list[dict[str, Any]]
     ) -> list[Model]:
-        """Create multiple model instances.
+        """Create multiple model instances in one multi-row statement.
 
         Args:
             session: The async session.
             data: The list of data to create model instances.
 
         Returns:
-            The list of created model instances.
+            The list of created model instances, in the order of `data`.
 
         """
-        instances = [self.model(**data) for data in data]
-        session.add_all(instances)
+        instances = await self.insert_many(session=session, data=data)
         await session.commit()
 
-        for instance in instances:
-            await session.refresh(instance)
+        return instances
+
+    async def insert_many(
+        self, session: AsyncSession, data: list[dict[str, Any]]
+    ) -> list[Model]:
+        """Insert rows in one multi-row statement without committing.
+
+        Args:
+            session: The async session.
+            data: The rows to insert.
+
+        Returns:
+            The inserted model instances, in the order of `data`.
+
+        """
+        if not data:
+            return []
+
+        result = await session.execute(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            data,
+        )
+        return list(result.scalars().all())
+
+    async def upsert(
+        self,
+        session: AsyncSession,
+        data: list[dict[str, Any]],
+        index_elements: list[str],
+        update_fields: list[str] | None = None,
+    ) -> list[Model]:
+        """Insert rows, resolving unique conflicts with ON CONFLICT.
+
+        Args:
+            session: The async session.
+            data: The rows to insert.
+            index_elements: The columns of the unique constraint to resolve.
+            update_fields: The columns to overwrite on conflict; existing rows
+                are kept as they are when empty.
+
+        Returns:
+            The inserted or updated model instances.
+
+        """
+        if not data:
+            return []
+
+        statement = pg_insert(self.model).values(data)
+        if update_fields:
+            statement = statement.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={field: statement.excluded[field] for field in update_fields},
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=index_elements)
+
+        result = await session.execute(
+            statement=statement.returning(self.model).execution_options(
+                populate_existing=True
+            )
+        )
+        instances = list(result.scalars().all())
+        await session.commit()
 
         return instances
 
+    async def delete_many(self, session: AsyncSession, ids: list[int]) -> None:
+        """Delete rows by ID in one statement without committing.
+
+        Args:
+            session: The async session.
+            ids: The IDs to delete.
+
+        """
+        if ids:
+            await session.execute(
+                statement=delete(self.model).where(self.model.id.in_(ids))
+            )
+
     async def get_all(
         self,
         session: AsyncSession,
@@ -75,9 +153,100 @@ class BaseRepository[Model: object]:
 
         return list(result.scalars().all())
 
+    async def get_by_ids(
+        self, session: AsyncSession, ids: list[int]
+    ) -> dict[int, Model]:
+        """Get model instances by ID in one query.
+
+        Args:
+            session: The async session.
+            ids: The IDs.
+
+        Returns:
+            The model instances by ID, for the IDs that exist.
+
+        """
+        result = await session.execute(
+            statement=select(self.model).where(self.model.id.in_(ids))
+        )
+        return {instance.id: instance for instance in result.scalars().all()}
+
+    async def get_page(
+        self,
+        session: AsyncSession,
+        page: Page,
+        sort_by: str = "id",
+        where: Sequence[ColumnElement[bool]] = (),
+        **filters: object,
+    ) -> tuple[list[Model], str | None]:
+        """Get one page of model instances with keyset pagination.
+
+        Rows are ordered by the sort column with the ID as tie-breaker, and a
+        page starts right after the key of the previous page's last row, so
+        its cost does not grow with the offset.
+
+        Args:
+            session: The async session.
+            page: The requested page.
+            sort_by: The column to sort by.
+            where: Conditions other than equality to apply to the query.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The model instances and the cursor of the next page, if any.
+
+        Raises:
+            InvalidCursorError: If the page cursor is malformed or was issued
+                for another sort.
+
+        """
+        keys = [getattr(self.model, sort_by)]
+        if sort_by != "id":
+            keys.append(self.model.id)
+
+        statement = select(self.model).filter_by(**filters).where(*where)
+        if page.cursor:
+            values = decode_cursor(
+                cursor=page.cursor,
+                types=[key.type.python_type for key in keys],
+                sort_by=sort_by,
+                order=page.order,
+            )
+            if page.order == SortOrder.ASC:
+                # The leading bound lets an index on the sort column seek.
+                statement = statement.where(
+                    keys[0] >= values[0], tuple_(*keys) > tuple_(*values)
+                )
+            else:
+                statement = statement.where(
+                    keys[0] <= values[0], tuple_(*keys) < tuple_(*values)
+                )
+
+        result = await session.execute(
+            statement=statement.order_by(
+                *(
+                    key.asc() if page.order == SortOrder.ASC else key.desc()
+                    for key in keys
+                )
+            ).limit(page.limit + 1)
+        )
+        instances = list(result.scalars().all())
+        if len(instances) <= page.limit:
+            return instances, None
+
+        instances = instances[: page.limit]
+        return instances, encode_cursor(
+            values=[getattr(instances[-1], key.key) for key in keys],
+            sort_by=sort_by,
+            order=page.order,
+        )
+
     async def get_by(self, session: AsyncSession, **filters: object) -> Model | None:
         """Get a model instance by filters.
 
+        An instance already in the session is refreshed from the row, since
+        other sessions, such as the execution engine's, may have changed it.
+
         Args:
             session: The async session.
             **filters: The filters to apply to the query.
@@ -87,14 +256,16 @@ class BaseRepository[Model: object]:
 
         """
         result = await session.execute(
-            statement=select(self.model).filter_by(**filters)
+            statement=select(self.model)
+            .filter_by(**filters)
+            .execution_options(populate_existing=True)
         )
         return result.scalar_one_or_none()
 
     async def update_by(
         self, session: AsyncSession, data: dict[str, Any], **filters: object
     ) -> Model | None:
-        """Update a model instance by filters.
+        """Update a model instance by filters with UPDATE ... RETURNING.
 
         Args:
             session: The async session.
@@ -105,19 +276,38 @@ class BaseRepository[Model: object]:
             The updated model instance.
 
         """
-        instance = await self.get_by(session=session, **filters)
+        instances = await self.update_all(session=session, data=data, **filters)
 
-        if instance:
-            for key, value in data.items():
-                setattr(instance, key, value)
+        return instances[0] if instances else None
 
-            await session.commit()
-            await session.refresh(instance)
+    async def update_all(
+        self, session: AsyncSession, data: dict[str, Any], **filters: object
+    ) -> list[Model]:
+        """Update all model instances by filters in one statement.
 
-        return instance
+        Args:
+            session: The async session.
+            data: The data to update the model instances.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The updated model instances.
+
+        """
+        result = await session.execute(
+            statement=update(self.model)
+            .filter_by(**filters)
+            .values(**data)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        instances = list(result.scalars().all())
+        await session.commit()
+
+        return instances
 
     async def delete_by(self, session: AsyncSession, **filters: object) -> bool:
-        """Delete a model instance by filters.
+        """Delete a model instance by filters with DELETE ... RETURNING.
 
         Args:
             session: The async session.
@@ -127,33 +317,35 @@ class BaseRepository[Model: object]:
             True if the model instance was deleted, False otherwise.
 
         """
-        instance = await self.get_by(session=session, **filters)
-
-        if instance:
-            await session.delete(instance)
-            await session.commit()
+        result = await session.execute(
+            statement=delete(self.model).filter_by(**filters).returning(self.model.id)
+        )
+        deleted = result.first() is not None
+        await session.commit()
 
-            return True
+        return deleted
 
-        return False
+    async def delete_all(self, session: AsyncSession, **filters: object) -> int:
+        """Delete all model instances by filters in one statement.
 
-    async def delete_all(self, session: AsyncSession, **filters: object) -> bool:
-        """Delete all model instances by filters.
+        Rows that reference them go with them through the foreign key
+        cascades, so a workflow's nodes or executions are removed without
+        loading any of them.
 
         Args:
             session: The async session.
             **filters: The filters to apply to the query.
 
         Returns:
-            True if the model instances were deleted, False otherwise.
+            The number of deleted model instances.
 
         """
-        for instance in await self.get_all(session=session, **filters):
-            await session.delete(instance)
-
+        result = await session.execute(
+            statement=delete(self.model).filter_by(**filters)
+        )
         await session.commit()
 
-        return True
+        return result.rowcount
 
     async def get_count(self, session: AsyncSession, **filters: object) -> int:
         """Get the count of model instances by filters.
@@ -1,12 +1,42 @@
 """Repository for edges."""
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from models import Edge
-from repositories.base import BaseRepository
+from repositories.scoped import WorkflowScopedRepository
 
 
-class EdgeRepository(BaseRepository[Edge]):
+class EdgeRepository(WorkflowScopedRepository[Edge]):
     """Repository for Edge model operations."""
 
     def __init__(self) -> None:
         """Initialize the repository with the Edge model."""
         super().__init__(model=Edge)
+
+    async def get_pairs_between(
+        self,
+        session: AsyncSession,
+        node_ids: list[int],
+        exclude_id: int | None = None,
+    ) -> list[tuple[int, int]]:
+        """Get the edges whose endpoints are both in a node set.
+
+        Args:
+            session: The async session.
+            node_ids: The node IDs.
+            exclude_id: An edge ID to leave out.
+
+        Returns:
+            The (source node ID, target node ID) pairs.
+
+        """
+        statement = select(Edge.source_node_id, Edge.target_node_id).where(
+            Edge.source_node_id.in_(node_ids),
+            Edge.target_node_id.in_(node_ids),
+        )
+        if exclude_id is not None:
+            statement = statement.where(Edge.id != exclude_id)
+
+        result = await session.execute(statement=statement)
+        return list(result.tuples().all())
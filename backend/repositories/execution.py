@@ -1,12 +1,67 @@
 """Repository for executions."""
 
-from models import Execution
-from repositories.base import BaseRepository
+from datetime import datetime
 
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
 
-class ExecutionRepository(BaseRepository[Execution]):
+from enums import ExecutionStatus
+from models import Execution, Workflow
+from repositories.scoped import WorkflowScopedRepository
+
+
+class ExecutionRepository(WorkflowScopedRepository[Execution]):
     """Repository for Execution model operations."""
 
     def __init__(self) -> None:
         """Initialize the repository with the Execution model."""
         super().__init__(model=Execution)
+
+    async def get_waiting(
+        self, session: AsyncSession, started_since: datetime, started_before: datetime
+    ) -> list[tuple[int, datetime, int]]:
+        """Get the executions created in a time range that have not started.
+
+        Args:
+            session: The async session.
+            started_since: The inclusive lower bound of the creation time.
+            started_before: The exclusive upper bound of the creation time.
+
+        Returns:
+            The execution IDs, creation times and owner user IDs.
+
+        """
+        result = await session.execute(
+            statement=select(Execution.id, Execution.started_at, Workflow.owner_id)
+            .join(Workflow, Workflow.id == Execution.workflow_id)
+            .where(
+                Execution.status == ExecutionStatus.CREATED,
+                Execution.started_at >= started_since,
+                Execution.started_at < started_before,
+            )
+        )
+        return [(row.id, row.started_at, row.owner_id) for row in result]
+
+    async def get_referenced(self, session: AsyncSession, refs: list[str]) -> set[str]:
+        """Get which of some blob references are held by any execution.
+
+        Both lookups are served by the partial indexes on the references.
+
+        Args:
+            session: The async session.
+            refs: The blob references to look up.
+
+        Returns:
+            The references held as an input or output.
+
+        """
+        if not refs:
+            return set()
+
+        result = await session.execute(
+            statement=union(
+                select(Execution.input_ref).where(Execution.input_ref.in_(refs)),
+                select(Execution.output_ref).where(Execution.output_ref.in_(refs)),
+            )
+        )
+        return set(result.scalars())
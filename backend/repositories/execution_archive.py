@@ -0,0 +1,108 @@
+"""Repository for archived executions."""
+
+import asyncio
+import bisect
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import ExecutionArchive
+from repositories.base import BaseRepository
+
+
+def _scan(path: Path, offset: int, execution_id: int) -> dict[str, Any] | None:
+    """Find an execution in the block of an archive file at an offset.
+
+    Each line holds an execution ID and the execution as JSON, separated by
+    a tab, in ID order, so the scan stops at the first greater ID instead of
+    reading on to the end of the file.
+
+    Args:
+        path: The archive file.
+        offset: The offset of the gzip member that may hold the execution.
+        execution_id: The execution ID.
+
+    Returns:
+        The archived execution, or None if the file does not hold it.
+
+    """
+    with path.open(mode="rb") as raw:
+        raw.seek(offset)
+        with gzip.open(raw, mode="rt", encoding="utf-8") as archive:
+            for line in archive:
+                key, _, payload = line.partition("\t")
+                if int(key) == execution_id:
+                    return json.loads(payload)
+                if int(key) > execution_id:
+                    break
+
+    return None
+
+
+class ExecutionArchiveRepository(BaseRepository[ExecutionArchive]):
+    """Repository for ExecutionArchive model operations.
+
+    An archive file is a series of gzip members, one per block of
+    executions. The archive row records the first execution ID and the
+    file offset of each block, so a lookup decompresses a single block.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the repository with the ExecutionArchive model."""
+        super().__init__(model=ExecutionArchive)
+
+    @staticmethod
+    def encode_block(executions: list[tuple[int, str]]) -> bytes:
+        """Encode a block of executions as one gzip member.
+
+        Args:
+            executions: The execution IDs and JSON documents, in ID order.
+
+        Returns:
+            The compressed block.
+
+        """
+        lines = "".join(
+            f"{execution_id}\t{document}\n" for execution_id, document in executions
+        )
+        return gzip.compress(lines.encode())
+
+    async def find_execution(
+        self, session: AsyncSession, execution_id: int
+    ) -> dict[str, Any] | None:
+        """Read an execution back from the archive files.
+
+        Args:
+            session: The async session.
+            execution_id: The execution ID.
+
+        Returns:
+            The archived execution, or None if it is not archived.
+
+        """
+        result = await session.execute(
+            statement=select(ExecutionArchive.path, ExecutionArchive.blocks)
+            .where(
+                ExecutionArchive.min_id <= execution_id,
+                ExecutionArchive.max_id >= execution_id,
+            )
+            .order_by(ExecutionArchive.range_start.desc())
+        )
+        for path, blocks in result.tuples():
+            index = bisect.bisect_right(
+                blocks, execution_id, key=lambda block: block[0]
+            )
+            execution = await asyncio.to_thread(
+                _scan,
+                path=Path(path),
+                offset=blocks[index - 1][1] if index else 0,
+                execution_id=execution_id,
+            )
+            if execution is not None:
+                return execution
+
+        return None
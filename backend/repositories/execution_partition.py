@@ -0,0 +1,153 @@
+"""Repository for the monthly partitions of the executions table."""
+
+from collections.abc import AsyncGenerator
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Execution
+from utils.partitions import add_months, partition_month, partition_name
+
+ATTACHED_QUERY = """
+SELECT c.relname
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+WHERE i.inhparent = 'executions'::regclass
+"""
+
+DETACHED_QUERY = """
+SELECT c.relname
+FROM pg_class c
+WHERE c.relkind = 'r'
+    AND c.relname LIKE 'executions\\_p%'
+    AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid)
+"""
+
+
+def _checked(name: str) -> str:
+    """Make sure a table name is a monthly partition before it reaches DDL.
+
+    Args:
+        name: The table name.
+
+    Returns:
+        The table name.
+
+    Raises:
+        ValueError: If the name is not a monthly partition name.
+
+    """
+    if partition_month(name=name) is None:
+        message = f"Not an executions partition: {name}"
+        raise ValueError(message)
+
+    return name
+
+
+class ExecutionPartitionRepository:
+    """Create, detach and read monthly execution partitions.
+
+    Statements are not committed; the caller commits.
+    """
+
+    async def create(self, session: AsyncSession, month: datetime) -> None:
+        """Create the partition of a month unless it exists.
+
+        Args:
+            session: The async session.
+            month: The start of the month.
+
+        """
+        end = add_months(month=month, months=1)
+        await session.execute(
+            statement=text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(month=month)} "
+                "PARTITION OF executions FOR VALUES "
+                f"FROM ('{month:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+            )
+        )
+
+    async def get_attached(self, session: AsyncSession) -> list[str]:
+        """Get the monthly partitions attached to the executions table.
+
+        Args:
+            session: The async session.
+
+        Returns:
+            The partition names.
+
+        """
+        result = await session.execute(statement=text(ATTACHED_QUERY))
+        return [name for name in result.scalars() if partition_month(name=name)]
+
+    async def get_detached(self, session: AsyncSession) -> list[str]:
+        """Get the monthly partitions detached but not yet dropped.
+
+        Args:
+            session: The async session.
+
+        Returns:
+            The partition names.
+
+        """
+        result = await session.execute(statement=text(DETACHED_QUERY))
+        return [name for name in result.scalars() if partition_month(name=name)]
+
+    async def detach(self, session: AsyncSession, name: str) -> None:
+        """Detach a partition from the executions table.
+
+        Args:
+            session: The async session.
+            name: The partition name.
+
+        """
+        await session.execute(
+            statement=text(f"ALTER TABLE executions DETACH PARTITION {_checked(name)}")
+        )
+
+    async def stream_rows(
+        self, session: AsyncSession, name: str, batch_size: int = 1000
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Read the rows of a detached partition in batches.
+
+        Args:
+            session: The async session.
+            name: The partition name.
+            batch_size: The rows per batch.
+
+        Yields:
+            Batches of rows in ID order, typed like the executions table.
+
+        """
+        partition = table(
+            _checked(name), *(column(c.name, c.type) for c in Execution.__table__.c)
+        )
+        statement = select(partition).order_by(partition.c.id).limit(batch_size)
+        last_id = None
+        while True:
+            # Batches follow the ID rather than a server-side cursor, which
+            # would keep the table in use until the transaction ends and so
+            # block the DROP that follows in it.
+            result = await session.execute(
+                statement=statement
+                if last_id is None
+                else statement.where(partition.c.id > last_id)
+            )
+            rows = [dict(row) for row in result.mappings()]
+            if not rows:
+                return
+
+            yield rows
+            last_id = rows[-1]["id"]
+
+    async def drop(self, session: AsyncSession, name: str) -> None:
+        """Drop a detached partition.
+
+        Args:
+            session: The async session.
+            name: The partition name.
+
+        """
+        await session.execute(statement=text(f"DROP TABLE {_checked(name)}"))
@@ -1,12 +1,127 @@
 """Repository for nodes."""
 
+from typing import Any
+
+from sqlalchemy import (
+    Float,
+    Integer,
+    ScalarSelect,
+    column,
+    func,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from models import Node
-from repositories.base import BaseRepository
+from repositories.scoped import WorkflowScopedRepository
 
 
-class NodeRepository(BaseRepository[Node]):
+class NodeRepository(WorkflowScopedRepository[Node]):
     """Repository for Node model operations."""
 
     def __init__(self) -> None:
         """Initialize the repository with the Node model."""
         super().__init__(model=Node)
+
+    @staticmethod
+    def next_topological_order(workflow_id: int) -> ScalarSelect[int]:
+        """Build an expression ranking a new node after all others.
+
+        Callers lock the workflow first, or two concurrent inserts could read
+        the same highest rank.
+
+        Args:
+            workflow_id: The workflow ID.
+
+        Returns:
+            The rank expression, evaluated on insert.
+
+        """
+        return (
+            select(func.coalesce(func.max(Node.topological_order), 0) + 1)
+            .where(Node.workflow_id == workflow_id)
+            .scalar_subquery()
+        )
+
+    async def get_topological_orders(
+        self, session: AsyncSession, workflow_id: int, lower: int, upper: int
+    ) -> dict[int, int]:
+        """Get the ranks of the nodes ranked within a range.
+
+        Args:
+            session: The async session.
+            workflow_id: The workflow ID.
+            lower: The lowest rank, inclusive.
+            upper: The highest rank, inclusive.
+
+        Returns:
+            The node ranks by node ID.
+
+        """
+        result = await session.execute(
+            statement=select(Node.id, Node.topological_order).where(
+                Node.workflow_id == workflow_id,
+                Node.topological_order.between(lower, upper),
+            )
+        )
+        return dict(result.tuples().all())
+
+    async def set_topological_orders(
+        self, session: AsyncSession, orders: dict[int, int]
+    ) -> None:
+        """Update node ranks without committing.
+
+        The caller commits, so the new ranks land atomically with the edge
+        that required them.
+
+        Args:
+            session: The async session.
+            orders: The new ranks by node ID.
+
+        """
+        await session.execute(
+            update(Node),
+            [
+                {"id": node_id, "topological_order": order}
+                for node_id, order in orders.items()
+            ],
+        )
+
+    async def update_many(
+        self, session: AsyncSession, data: list[dict[str, Any]]
+    ) -> list[Node]:
+        """Update nodes from a VALUES list in one statement without committing.
+
+        Args:
+            session: The async session.
+            data: The rows, each with the node ID and every updatable column.
+
+        Returns:
+            The updated nodes.
+
+        """
+        if not data:
+            return []
+
+        columns = ("type", "data", "position_x", "position_y", "topological_order")
+        rows = values(
+            column("id", Integer),
+            column("type", Node.type.type),
+            column("data", JSONB),
+            column("position_x", Float),
+            column("position_y", Float),
+            column("topological_order", Integer),
+            name="rows",
+        ).data([(item["id"], *(item[key] for key in columns)) for item in data])
+
+        result = await session.execute(
+            statement=update(Node)
+            .where(Node.id == rows.c.id)
+            .values({key: rows.c[key] for key in columns})
+            .returning(Node)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return list(result.scalars().all())
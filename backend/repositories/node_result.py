@@ -0,0 +1,93 @@
+"""Repository for memoized node outputs."""
+
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import NodeResult
+from repositories.base import BaseRepository
+
+
+class NodeResultRepository(BaseRepository[NodeResult]):
+    """Repository for NodeResult model operations."""
+
+    def __init__(self) -> None:
+        """Initialize the repository with the NodeResult model."""
+        super().__init__(model=NodeResult)
+
+    async def get_outputs(
+        self, session: AsyncSession, workflow_id: int, node_hashes: list[str]
+    ) -> dict[str, Any]:
+        """Get the stored outputs of a set of node hashes in one query.
+
+        Args:
+            session: The async session.
+            workflow_id: The workflow ID.
+            node_hashes: The node hashes.
+
+        Returns:
+            The outputs by node hash, for the hashes that have one.
+
+        """
+        result = await session.execute(
+            statement=select(NodeResult.node_hash, NodeResult.output).where(
+                NodeResult.workflow_id == workflow_id,
+                NodeResult.node_hash.in_(node_hashes),
+            )
+        )
+        return dict(result.tuples().all())
+
+    async def save_outputs(
+        self, session: AsyncSession, workflow_id: int, outputs: dict[str, Any]
+    ) -> None:
+        """Store node outputs, keeping existing entries for the same hash.
+
+        Args:
+            session: The async session.
+            workflow_id: The workflow ID.
+            outputs: The outputs by node hash.
+
+        """
+        await self.upsert(
+            session=session,
+            data=[
+                {"workflow_id": workflow_id, "node_hash": node_hash, "output": output}
+                for node_hash, output in outputs.items()
+            ],
+            index_elements=["workflow_id", "node_hash"],
+        )
+
+    async def delete_expired(
+        self, session: AsyncSession, max_age: timedelta, batch_size: int = 1000
+    ) -> int:
+        """Delete the outputs stored longer ago than a maximum age, in batches.
+
+        Every batch is committed on its own, so a large backlog does not
+        hold locks or grow one transaction for the whole run.
+
+        Args:
+            session: The async session.
+            max_age: The age, by the database clock, past which outputs go.
+            batch_size: The rows deleted per statement.
+
+        Returns:
+            The number of deleted outputs.
+
+        """
+        expired = (
+            select(NodeResult.id)
+            .where(NodeResult.created_at < func.localtimestamp() - max_age)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        deleted = 0
+        while True:
+            result = await session.execute(
+                statement=delete(NodeResult).where(NodeResult.id.in_(expired))
+            )
+            await session.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
@@ -0,0 +1,50 @@
+"""Base repository for models that belong to a workflow."""
+
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Workflow
+from repositories.base import BaseRepository
+
+
+class WorkflowScopedRepository[Model: object](BaseRepository[Model]):
+    """Repository for models owned through their parent workflow.
+
+    Ownership is recorded on the workflow, so lookups on behalf of a user
+    join to it and check the owner in the same statement instead of fetching
+    the workflow in a second round trip.
+    """
+
+    async def get_owned(
+        self,
+        session: AsyncSession,
+        owner_id: int,
+        where: Sequence[ColumnElement[bool]] = (),
+        **filters: object,
+    ) -> Model | None:
+        """Get a model instance by filters if its workflow belongs to a user.
+
+        An instance already in the session is refreshed from the row.
+
+        Args:
+            session: The async session.
+            owner_id: The owner user ID.
+            where: Conditions other than equality to apply to the query.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The model instance, or None if it is missing or owned by someone
+            else.
+
+        """
+        result = await session.execute(
+            statement=select(self.model)
+            .filter_by(**filters)
+            .where(*where)
+            .join(Workflow, Workflow.id == self.model.workflow_id)
+            .where(Workflow.owner_id == owner_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
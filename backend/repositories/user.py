@@ -1,6 +1,9 @@
 """Repository for users."""
 
-from models import User
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import RevokedUser, User
 from repositories.base import BaseRepository
 
 
@@ -10,3 +13,77 @@ class UserRepository(BaseRepository[User]):
     def __init__(self) -> None:
         """Initialize the repository with the User model."""
         super().__init__(model=User)
+
+    async def bump_token_version(
+        self, session: AsyncSession, user_id: int
+    ) -> int | None:
+        """Increment the token version of a user.
+
+        Args:
+            session: The async session.
+            user_id: The user ID.
+
+        Returns:
+            The new version, or None if the user is not found.
+
+        """
+        version = await session.scalar(
+            statement=update(User)
+            .where(User.id == user_id)
+            .values(token_version=User.token_version + 1)
+            .returning(User.token_version)
+        )
+        await session.commit()
+
+        return version
+
+    async def delete_revoked(self, session: AsyncSession, user_id: int) -> bool:
+        """Delete a user and record a tombstone in the same transaction.
+
+        The tombstone outlives the row, so the user's tokens can be revoked
+        again after Redis loses its copy of the revocation.
+
+        Args:
+            session: The async session.
+            user_id: The user ID.
+
+        Returns:
+            True if the user was deleted, False if not found.
+
+        """
+        deleted = await session.scalar(
+            statement=delete(User).where(User.id == user_id).returning(User.id)
+        )
+        if deleted is not None:
+            await session.execute(statement=insert(RevokedUser).values(user_id=user_id))
+        await session.commit()
+
+        return deleted is not None
+
+    async def get_deleted_ids(self, session: AsyncSession) -> list[int]:
+        """Get the IDs of the deleted users.
+
+        Args:
+            session: The async session.
+
+        Returns:
+            The user IDs recorded by tombstones.
+
+        """
+        return list(await session.scalars(statement=select(RevokedUser.user_id)))
+
+    async def get_token_versions(self, session: AsyncSession) -> dict[int, int]:
+        """Get the token versions of the users that revoked their tokens.
+
+        Args:
+            session: The async session.
+
+        Returns:
+            The token versions keyed by user ID.
+
+        """
+        result = await session.execute(
+            statement=select(User.id, User.token_version).where(User.token_version > 0)
+        )
+
+        return dict(result.tuples().all())
@@ -1,12 +1,180 @@
 """Repository for workflows."""
 
-from models import Workflow
+from enum import Enum
+
+from sqlalchemy import (
+    ColumnElement,
+    Text,
+    case,
+    cast,
+    func,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from models import Edge, Node, Workflow
 from repositories.base import BaseRepository
 
 
+def json_object(*columns: InstrumentedAttribute) -> ColumnElement:
+    """Build a JSON object of columns keyed by their attribute names.
+
+    Enum columns store member names, so they are mapped to member values to
+    match what the API schemas serialize.
+
+    Args:
+        *columns: The columns.
+
+    Returns:
+        The json_build_object expression.
+
+    """
+    arguments: list[ColumnElement] = []
+    for column in columns:
+        value: ColumnElement = column
+        enum_class = getattr(column.type, "enum_class", None)
+        if enum_class is not None and issubclass(enum_class, Enum):
+            value = case(
+                {member.name: member.value for member in enum_class},
+                value=cast(column, Text),
+            )
+        arguments.extend((literal_column(f"'{column.key}'"), value))
+
+    return func.json_build_object(*arguments)
+
+
+def json_array(
+    *columns: InstrumentedAttribute, order_by: list[ColumnElement]
+) -> ColumnElement:
+    """Aggregate rows into an ordered JSON array, empty when there are none.
+
+    Args:
+        *columns: The columns of each element.
+        order_by: The element order.
+
+    Returns:
+        The json_agg expression.
+
+    """
+    return func.coalesce(
+        func.json_agg(aggregate_order_by(json_object(*columns), *order_by)),
+        literal_column("'[]'::json"),
+    )
+
+
 class WorkflowRepository(BaseRepository[Workflow]):
     """Repository for Workflow model operations."""
 
     def __init__(self) -> None:
         """Initialize the repository with the Workflow model."""
         super().__init__(model=Workflow)
+
+    async def bump_version(self, session: AsyncSession, workflow_id: int) -> int:
+        """Increment the graph version of a workflow without committing.
+
+        The update locks the workflow row, so it is issued before the graph
+        change it versions and both land with the caller's commit.
+
+        Args:
+            session: The async session.
+            workflow_id: The workflow ID.
+
+        Returns:
+            The new version.
+
+        """
+        return await session.scalar(
+            statement=update(Workflow)
+            .where(Workflow.id == workflow_id)
+            .values(version=Workflow.version + 1)
+            .returning(Workflow.version)
+        )
+
+    async def get_for_update(
+        self, session: AsyncSession, **filters: object
+    ) -> Workflow | None:
+        """Get a workflow by filters and lock it until the next commit.
+
+        Args:
+            session: The async session.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The workflow.
+
+        """
+        result = await session.execute(
+            statement=select(Workflow).filter_by(**filters).with_for_update()
+        )
+        return result.scalar_one_or_none()
+
+    async def get_graph_json(
+        self, session: AsyncSession, workflow_id: int, owner_id: int
+    ) -> str | None:
+        """Get a workflow with its nodes and edges as one JSON document.
+
+        The document is assembled by Postgres in a single query, so no ORM
+        objects are loaded and the result can be sent as it is.
+
+        Args:
+            session: The async session.
+            workflow_id: The workflow ID.
+            owner_id: The owner user ID.
+
+        Returns:
+            The JSON document, or None if the workflow is not found.
+
+        """
+        nodes = (
+            select(
+                json_array(
+                    Node.id,
+                    Node.workflow_id,
+                    Node.type,
+                    Node.data,
+                    Node.position_x,
+                    Node.position_y,
+                    order_by=[Node.topological_order, Node.id],
+                )
+            )
+            .where(Node.workflow_id == Workflow.id)
+            .scalar_subquery()
+        )
+        edges = (
+            select(
+                json_array(
+                    Edge.id,
+                    Edge.workflow_id,
+                    Edge.source_node_id,
+                    Edge.target_node_id,
+                    order_by=[Edge.id],
+                )
+            )
+            .where(Edge.workflow_id == Workflow.id)
+            .scalar_subquery()
+        )
+        document = func.json_build_object(
+            literal_column("'workflow'"),
+            json_object(
+                Workflow.id,
+                Workflow.owner_id,
+                Workflow.name,
+                Workflow.version,
+                Workflow.created_at,
+                Workflow.updated_at,
+            ),
+            literal_column("'nodes'"),
+            nodes,
+            literal_column("'edges'"),
+            edges,
+        )
+
+        return await session.scalar(
+            statement=select(cast(document, Text)).where(
+                Workflow.id == workflow_id, Workflow.owner_id == owner_id
+            )
+        )
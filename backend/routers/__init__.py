@@ -1,6 +1,7 @@
 """API router package."""
 
 from routers import (
+    api_key,
     auth,
     edge,
     execution,
@@ -12,6 +13,7 @@ from routers import (
 )
 
 __all__ = [
+    "api_key",
     "auth",
     "edge",
     "execution",
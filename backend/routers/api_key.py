@@ -0,0 +1,68 @@
+"""API key routes."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dependencies import api_key, auth, pagination, replica
+from schemas import ApiKeyCreate, ApiKeyCreateResponse, ApiKeyResponse, UserResponse
+from utils.pagination import Page
+
+router = APIRouter(prefix="/api-keys", tags=["API Keys"])
+
+
+@router.post(path="")
+async def create_api_key(
+    data: Annotated[ApiKeyCreate, Body(description="Data for creating an API key")],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
+    usecase: Annotated[
+        api_key.ApiKeyUsecase, Depends(dependency=api_key.get_api_key_usecase)
+    ],
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+) -> ApiKeyCreateResponse:
+    """Create a new API key, returning the key once."""
+    created, key = await usecase.create_api_key(
+        session=session, user_id=current_user.id, **data.model_dump()
+    )
+
+    return ApiKeyCreateResponse(
+        **ApiKeyResponse.model_validate(created).model_dump(), key=key
+    )
+
+
+@router.get(path="")
+async def list_api_keys(
+    page: Annotated[Page, Depends(dependency=pagination.get_page)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
+    usecase: Annotated[
+        api_key.ApiKeyUsecase, Depends(dependency=api_key.get_api_key_usecase)
+    ],
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+) -> list[ApiKeyResponse]:
+    """List API keys for the current user."""
+    api_keys, next_cursor = await usecase.get_api_keys(
+        session=session, user_id=current_user.id, page=page
+    )
+    page.set_next_cursor(cursor=next_cursor)
+
+    return [ApiKeyResponse.model_validate(item) for item in api_keys]
+
+
+@router.delete(path="/{api_key_id}")
+async def delete_api_key(
+    api_key_id: Annotated[int, Path(description="API key ID", gt=0)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
+    usecase: Annotated[
+        api_key.ApiKeyUsecase, Depends(dependency=api_key.get_api_key_usecase)
+    ],
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+) -> JSONResponse:
+    """Revoke an API key by ID."""
+    await usecase.delete_api_key(
+        session=session, api_key_id=api_key_id, user_id=current_user.id
+    )
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED, content={"detail": "API key revoked"}
+    )
@@ -2,7 +2,8 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from dependencies import auth, db
@@ -35,3 +36,17 @@ async def register(
     return UserResponse.model_validate(
         await usecase.register(session=session, **data.model_dump(exclude_none=True))
     )
+
+
+@router.post(path="/logout-all")
+async def logout_all(
+    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    usecase: Annotated[auth.AuthUsecase, Depends(dependency=auth.get_auth_usecase)],
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+) -> JSONResponse:
+    """Revoke every access token of the current user."""
+    await usecase.logout_all(session=session, user_id=current_user.id)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={"detail": "Logged out of all sessions"},
+    )
@@ -6,8 +6,9 @@ from fastapi import APIRouter, Body, Depends, Path, Query, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dependencies import auth, db, edge
+from dependencies import auth, edge, pagination, replica
 from schemas import EdgeCreate, EdgeResponse, EdgeUpdate, UserResponse
+from utils.pagination import Page
 
 router = APIRouter(prefix="/edges", tags=["Edges"])
 
@@ -15,7 +16,7 @@ router = APIRouter(prefix="/edges", tags=["Edges"])
 @router.post(path="")
 async def create_edge(
     data: Annotated[EdgeCreate, Body(description="Data for creating an edge")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         edge.EdgeUsecase,
         Depends(dependency=edge.get_edge_usecase),
@@ -33,7 +34,8 @@ async def create_edge(
 @router.get(path="")
 async def list_edges(
     workflow_id: Annotated[int, Query(gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    page: Annotated[Page, Depends(dependency=pagination.get_page)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         edge.EdgeUsecase,
         Depends(dependency=edge.get_edge_usecase),
@@ -41,18 +43,18 @@ async def list_edges(
     current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
 ) -> list[EdgeResponse]:
     """List edges, optionally filtered by workflow."""
-    return [
-        EdgeResponse.model_validate(edge)
-        for edge in await usecase.get_edges(
-            session=session, user_id=current_user.id, workflow_id=workflow_id
-        )
-    ]
+    edges, next_cursor = await usecase.get_edges(
+        session=session, user_id=current_user.id, workflow_id=workflow_id, page=page
+    )
+    page.set_next_cursor(cursor=next_cursor)
+
+    return [EdgeResponse.model_validate(edge) for edge in edges]
 
 
 @router.get(path="/{edge_id}")
 async def get_edge(
     edge_id: Annotated[int, Path(description="Edge ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         edge.EdgeUsecase,
         Depends(dependency=edge.get_edge_usecase),
@@ -71,7 +73,7 @@ async def get_edge(
 async def update_edge(
     edge_id: Annotated[int, Path(description="Edge ID", gt=0)],
     data: Annotated[EdgeUpdate, Body(description="Data for updating an edge")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         edge.EdgeUsecase,
         Depends(dependency=edge.get_edge_usecase),
@@ -92,7 +94,7 @@ async def update_edge(
 @router.delete(path="/{edge_id}")
 async def delete_edge(
     edge_id: Annotated[int, Path(description="Edge ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         edge.EdgeUsecase,
         Depends(dependency=edge.get_edge_usecase),
@@ -1,12 +1,26 @@
 """Execution API routes."""
 
+import asyncio
+from contextlib import aclosing
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Path,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dependencies import auth, db, execution
+from dependencies import auth, db, execution, pagination, replica
+from exceptions import BaseError
 from schemas import ExecutionCreate, ExecutionResponse, UserResponse
+from utils.pagination import Page
 
 router = APIRouter(prefix="/executions", tags=["Executions"])
 
@@ -16,7 +30,7 @@ async def create_execution(
     data: Annotated[
         ExecutionCreate, Body(description="Data for creating an execution")
     ],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         execution.ExecutionUsecase,
         Depends(dependency=execution.get_execution_usecase),
@@ -34,37 +48,118 @@ async def create_execution(
 
 
 @router.get(path="")
-async def list_executions(
+async def list_executions(  # noqa: PLR0913
+    *,
     workflow_id: Annotated[int, Query(gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    page: Annotated[Page, Depends(dependency=pagination.get_page)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         execution.ExecutionUsecase,
         Depends(dependency=execution.get_execution_usecase),
     ],
     current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+    include_payloads: Annotated[
+        bool, Query(description="Inline payloads stored as blobs")
+    ] = False,
 ) -> list[ExecutionResponse]:
     """List executions, optionally filtered by workflow."""
-    return [
-        ExecutionResponse.model_validate(execution)
-        for execution in await usecase.get_executions(
-            session=session, user_id=current_user.id, workflow_id=workflow_id
-        )
+    executions, next_cursor = await usecase.get_executions(
+        session=session, user_id=current_user.id, workflow_id=workflow_id, page=page
+    )
+    page.set_next_cursor(cursor=next_cursor)
+
+    responses = [
+        ExecutionResponse.model_validate(execution) for execution in executions
     ]
+    if include_payloads:
+        responses = list(
+            await asyncio.gather(
+                *(usecase.load_payloads(execution=response) for response in responses)
+            )
+        )
+
+    return responses
 
 
 @router.get(path="/{execution_id}")
 async def get_execution(
+    *,
     execution_id: Annotated[int, Path(description="Execution ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         execution.ExecutionUsecase,
         Depends(dependency=execution.get_execution_usecase),
     ],
     current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+    include_payloads: Annotated[
+        bool, Query(description="Inline payloads stored as blobs")
+    ] = False,
 ) -> ExecutionResponse:
     """Fetch an execution by ID."""
-    return ExecutionResponse.model_validate(
+    response = ExecutionResponse.model_validate(
         await usecase.get_execution(
             session=session, execution_id=execution_id, user_id=current_user.id
         )
     )
+    if include_payloads:
+        response = await usecase.load_payloads(execution=response)
+
+    return response
+
+
+@router.get(path="/{execution_id}/stream")
+async def stream_execution(
+    execution_id: Annotated[int, Path(description="Execution ID", gt=0)],
+    # The status snapshot must not lag the events, so it is read from the
+    # primary.
+    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    usecase: Annotated[
+        execution.ExecutionUsecase,
+        Depends(dependency=execution.get_execution_usecase),
+    ],
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+) -> StreamingResponse:
+    """Stream execution events as server-sent events."""
+    events = await usecase.stream_execution(
+        session=session, execution_id=execution_id, user_id=current_user.id
+    )
+
+    return StreamingResponse(
+        content=(
+            f"event: {event.type}\ndata: {event.model_dump_json()}\n\n"
+            async for event in events
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket(path="/{execution_id}/stream")
+async def stream_execution_websocket(
+    websocket: WebSocket,
+    execution_id: Annotated[int, Path(description="Execution ID", gt=0)],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    usecase: Annotated[
+        execution.ExecutionUsecase,
+        Depends(dependency=execution.get_execution_usecase),
+    ],
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_websocket_user)],
+) -> None:
+    """Stream execution events over a WebSocket."""
+    try:
+        events = await usecase.stream_execution(
+            session=session, execution_id=execution_id, user_id=current_user.id
+        )
+    except BaseError as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=e.message)
+        return
+
+    await websocket.accept()
+    async with aclosing(events):
+        try:
+            async for event in events:
+                await websocket.send_text(event.model_dump_json())
+        except WebSocketDisconnect:
+            return
+
+    await websocket.close()
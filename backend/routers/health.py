@@ -6,8 +6,14 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 
 from dependencies import health
-from schemas import HealthResponse, ServiceHealthResponse
+from schemas import (
+    HealthResponse,
+    LLMCacheStatsResponse,
+    ReplicaLagResponse,
+    ServiceHealthResponse,
+)
 from usecases import HealthUsecase
+from utils.replica import read_routing
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -30,3 +36,21 @@ async def readiness(
             for name, status in health.items()
         ]
     )
+
+
+@router.get(path="/replica")
+async def replica(
+    usecase: Annotated[HealthUsecase, Depends(health.get_health_usecase)],
+) -> ReplicaLagResponse:
+    """Return the replication lag of the read replica."""
+    return ReplicaLagResponse(
+        enabled=read_routing.enabled, lag_seconds=await usecase.replica_lag()
+    )
+
+
+@router.get(path="/llm-cache")
+async def llm_cache(
+    usecase: Annotated[HealthUsecase, Depends(health.get_health_usecase)],
+) -> LLMCacheStatsResponse:
+    """Return the LLM response cache counters of the serving worker."""
+    return LLMCacheStatsResponse(**usecase.llm_cache_stats())
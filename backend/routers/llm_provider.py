@@ -6,13 +6,14 @@ from fastapi import APIRouter, Body, Depends, Path, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dependencies import auth, db, llm_provider
+from dependencies import auth, llm_provider, pagination, replica
 from schemas import (
     LLMProviderCreate,
     LLMProviderResponse,
     LLMProviderUpdate,
     UserResponse,
 )
+from utils.pagination import Page
 
 router = APIRouter(prefix="/llm-providers", tags=["LLM Providers"])
 
@@ -22,7 +23,7 @@ async def create_llm_provider(
     data: Annotated[
         LLMProviderCreate, Body(description="Data for creating an LLM provider")
     ],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         llm_provider.LLMProviderUsecase,
         Depends(dependency=llm_provider.get_llm_provider_usecase),
@@ -39,7 +40,8 @@ async def create_llm_provider(
 
 @router.get(path="")
 async def list_llm_providers(
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    page: Annotated[Page, Depends(dependency=pagination.get_page)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         llm_provider.LLMProviderUsecase,
         Depends(dependency=llm_provider.get_llm_provider_usecase),
@@ -47,18 +49,21 @@ async def list_llm_providers(
     current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
 ) -> list[LLMProviderResponse]:
     """List LLM providers for the current user."""
+    llm_providers, next_cursor = await usecase.get_llm_providers(
+        session=session, user_id=current_user.id, page=page
+    )
+    page.set_next_cursor(cursor=next_cursor)
+
     return [
         LLMProviderResponse.model_validate(llm_provider)
-        for llm_provider in await usecase.get_llm_providers(
-            session=session, user_id=current_user.id
-        )
+        for llm_provider in llm_providers
     ]
 
 
 @router.get(path="/{provider_id}")
 async def get_llm_provider(
     provider_id: Annotated[int, Path(description="LLM provider ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         llm_provider.LLMProviderUsecase,
         Depends(dependency=llm_provider.get_llm_provider_usecase),
@@ -79,7 +84,7 @@ async def update_llm_provider(
     data: Annotated[
         LLMProviderUpdate, Body(description="Data for updating an LLM provider")
     ],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         llm_provider.LLMProviderUsecase,
         Depends(dependency=llm_provider.get_llm_provider_usecase),
@@ -100,7 +105,7 @@ async def update_llm_provider(
 @router.delete(path="/{provider_id}")
 async def delete_llm_provider(
     provider_id: Annotated[int, Path(description="LLM provider ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         llm_provider.LLMProviderUsecase,
         Depends(dependency=llm_provider.get_llm_provider_usecase),
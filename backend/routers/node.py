@@ -6,8 +6,9 @@ from fastapi import APIRouter, Body, Depends, Path, Query, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dependencies import auth, db, node
+from dependencies import auth, node, pagination, replica
 from schemas import NodeCreate, NodeResponse, NodeUpdate, UserResponse
+from utils.pagination import Page
 
 router = APIRouter(prefix="/nodes", tags=["Nodes"])
 
@@ -15,7 +16,7 @@ router = APIRouter(prefix="/nodes", tags=["Nodes"])
 @router.post(path="")
 async def create_node(
     data: Annotated[NodeCreate, Body(description="Data for creating a node")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         node.NodeUsecase,
         Depends(dependency=node.get_node_usecase),
@@ -33,7 +34,8 @@ async def create_node(
 @router.get(path="")
 async def list_nodes(
     workflow_id: Annotated[int, Query(gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    page: Annotated[Page, Depends(dependency=pagination.get_page)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         node.NodeUsecase,
         Depends(dependency=node.get_node_usecase),
@@ -41,18 +43,18 @@ async def list_nodes(
     current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
 ) -> list[NodeResponse]:
     """List nodes, optionally filtered by workflow."""
-    return [
-        NodeResponse.model_validate(node)
-        for node in await usecase.get_nodes(
-            session=session, user_id=current_user.id, workflow_id=workflow_id
-        )
-    ]
+    nodes, next_cursor = await usecase.get_nodes(
+        session=session, user_id=current_user.id, workflow_id=workflow_id, page=page
+    )
+    page.set_next_cursor(cursor=next_cursor)
+
+    return [NodeResponse.model_validate(node) for node in nodes]
 
 
 @router.get(path="/{node_id}")
 async def get_node(
     node_id: Annotated[int, Path(description="Node ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         node.NodeUsecase,
         Depends(dependency=node.get_node_usecase),
@@ -71,7 +73,7 @@ async def get_node(
 async def update_node(
     node_id: Annotated[int, Path(description="Node ID", gt=0)],
     data: Annotated[NodeUpdate, Body(description="Data for updating a node")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         node.NodeUsecase,
         Depends(dependency=node.get_node_usecase),
@@ -92,7 +94,7 @@ async def update_node(
 @router.delete(path="/{node_id}")
 async def delete_node(
     node_id: Annotated[int, Path(description="Node ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         node.NodeUsecase,
         Depends(dependency=node.get_node_usecase),
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dependencies import auth, db, user
+from dependencies import auth, replica, user
 from schemas import UserResponse
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -23,7 +23,7 @@ async def get_me(
 @router.delete(path="/me")
 async def delete_user(
     usecase: Annotated[user.UserUsecase, Depends(dependency=user.get_user_usecase)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
 ) -> JSONResponse:
     """Delete the current user."""
@@ -2,12 +2,21 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Path, Response, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from dependencies import auth, db, workflow
-from schemas import UserResponse, WorkflowCreate, WorkflowResponse, WorkflowUpdate
+from dependencies import auth, pagination, replica, workflow
+from schemas import (
+    UserResponse,
+    WorkflowCreate,
+    WorkflowGraphDetailResponse,
+    WorkflowGraphResponse,
+    WorkflowGraphUpdate,
+    WorkflowResponse,
+    WorkflowUpdate,
+)
+from utils.pagination import Page
 
 router = APIRouter(prefix="/workflows", tags=["Workflows"])
 
@@ -15,7 +24,7 @@ router = APIRouter(prefix="/workflows", tags=["Workflows"])
 @router.post(path="")
 async def create_workflow(
     data: Annotated[WorkflowCreate, Body(description="Data for creating a workflow")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         workflow.WorkflowUsecase,
         Depends(dependency=workflow.get_workflow_usecase),
@@ -32,7 +41,8 @@ async def create_workflow(
 
 @router.get(path="")
 async def list_workflows(
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    page: Annotated[Page, Depends(dependency=pagination.get_page)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         workflow.WorkflowUsecase,
         Depends(dependency=workflow.get_workflow_usecase),
@@ -40,18 +50,18 @@ async def list_workflows(
     current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
 ) -> list[WorkflowResponse]:
     """List workflows for the current user."""
-    return [
-        WorkflowResponse.model_validate(workflow)
-        for workflow in await usecase.get_workflows(
-            session=session, user_id=current_user.id
-        )
-    ]
+    workflows, next_cursor = await usecase.get_workflows(
+        session=session, user_id=current_user.id, page=page
+    )
+    page.set_next_cursor(cursor=next_cursor)
+
+    return [WorkflowResponse.model_validate(workflow) for workflow in workflows]
 
 
 @router.get(path="/{workflow_id}")
 async def get_workflow(
     workflow_id: Annotated[int, Path(description="Workflow ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
     usecase: Annotated[
         workflow.WorkflowUsecase,
         Depends(dependency=workflow.get_workflow_usecase),
@@ -70,7 +80,7 @@ async def get_workflow(
 async def update_workflow(
     workflow_id: Annotated[int, Path(description="Workflow ID", gt=0)],
     data: Annotated[WorkflowUpdate, Body(description="Data for updating a workflow")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         workflow.WorkflowUsecase,
         Depends(dependency=workflow.get_workflow_usecase),
@@ -88,10 +98,53 @@ async def update_workflow(
     )
 
 
+@router.get(path="/{workflow_id}/graph", response_model=WorkflowGraphDetailResponse)
+async def get_workflow_graph(
+    workflow_id: Annotated[int, Path(description="Workflow ID", gt=0)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_read_session)],
+    usecase: Annotated[
+        workflow.WorkflowUsecase,
+        Depends(dependency=workflow.get_workflow_usecase),
+    ],
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+) -> Response:
+    """Fetch a workflow with all of its nodes and edges in one request."""
+    return Response(
+        content=await usecase.get_graph(
+            session=session, workflow_id=workflow_id, user_id=current_user.id
+        ),
+        media_type="application/json",
+    )
+
+
+@router.put(path="/{workflow_id}/graph")
+async def save_workflow_graph(
+    workflow_id: Annotated[int, Path(description="Workflow ID", gt=0)],
+    data: Annotated[
+        WorkflowGraphUpdate, Body(description="The complete graph of the workflow")
+    ],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
+    usecase: Annotated[
+        workflow.WorkflowUsecase,
+        Depends(dependency=workflow.get_workflow_usecase),
+    ],
+    current_user: Annotated[UserResponse, Depends(dependency=auth.get_current_user)],
+) -> WorkflowGraphResponse:
+    """Replace the nodes and edges of a workflow atomically."""
+    return WorkflowGraphResponse.model_validate(
+        await usecase.save_graph(
+            session=session,
+            workflow_id=workflow_id,
+            user_id=current_user.id,
+            **data.model_dump(),
+        )
+    )
+
+
 @router.delete(path="/{workflow_id}")
 async def delete_workflow(
     workflow_id: Annotated[int, Path(description="Workflow ID", gt=0)],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=replica.get_write_session)],
     usecase: Annotated[
         workflow.WorkflowUsecase,
         Depends(dependency=workflow.get_workflow_usecase),
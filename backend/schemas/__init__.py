@@ -1,9 +1,15 @@
 """Pydantic schemas for API inputs and outputs."""
 
+from schemas.api_key import ApiKeyCreate, ApiKeyCreateResponse, ApiKeyResponse
 from schemas.auth import Login, Token
 from schemas.edge import EdgeCreate, EdgeResponse, EdgeUpdate
-from schemas.execution import ExecutionCreate, ExecutionResponse
-from schemas.health import HealthResponse, ServiceHealthResponse
+from schemas.execution import ExecutionCreate, ExecutionEvent, ExecutionResponse
+from schemas.health import (
+    HealthResponse,
+    LLMCacheStatsResponse,
+    ReplicaLagResponse,
+    ServiceHealthResponse,
+)
 from schemas.llm_provider import (
     LLMProviderCreate,
     LLMProviderResponse,
@@ -15,15 +21,29 @@ from schemas.node import (
     NodeUpdate,
 )
 from schemas.user import UserCreate, UserResponse
-from schemas.workflow import WorkflowCreate, WorkflowResponse, WorkflowUpdate
+from schemas.workflow import (
+    WorkflowCreate,
+    WorkflowGraphDetailResponse,
+    WorkflowGraphEdge,
+    WorkflowGraphNode,
+    WorkflowGraphResponse,
+    WorkflowGraphUpdate,
+    WorkflowResponse,
+    WorkflowUpdate,
+)
 
 __all__ = [
+    "ApiKeyCreate",
+    "ApiKeyCreateResponse",
+    "ApiKeyResponse",
     "EdgeCreate",
     "EdgeResponse",
     "EdgeUpdate",
     "ExecutionCreate",
+    "ExecutionEvent",
     "ExecutionResponse",
     "HealthResponse",
+    "LLMCacheStatsResponse",
     "LLMProviderCreate",
     "LLMProviderResponse",
     "LLMProviderUpdate",
@@ -31,11 +51,17 @@ __all__ = [
     "NodeCreate",
     "NodeResponse",
     "NodeUpdate",
+    "ReplicaLagResponse",
     "ServiceHealthResponse",
     "Token",
     "UserCreate",
     "UserResponse",
     "WorkflowCreate",
+    "WorkflowGraphDetailResponse",
+    "WorkflowGraphEdge",
+    "WorkflowGraphNode",
+    "WorkflowGraphResponse",
+    "WorkflowGraphUpdate",
     "WorkflowResponse",
     "WorkflowUpdate",
 ]
@@ -0,0 +1,28 @@
+"""Schemas for API key payloads."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ApiKeyCreate(BaseModel):
+    """Payload for creating an API key."""
+
+    name: str = Field(default=..., description="Key name", max_length=128)
+
+
+class ApiKeyResponse(BaseModel):
+    """Response model for API keys."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(default=..., description="Key ID", gt=0)
+    name: str = Field(default=..., description="Key name")
+    prefix: str = Field(default=..., description="Public part of the key")
+    created_at: datetime = Field(default=..., description="Created at")
+
+
+class ApiKeyCreateResponse(ApiKeyResponse):
+    """Response model for a created API key."""
+
+    key: str = Field(default=..., description="The key, only ever shown once")
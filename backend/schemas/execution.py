@@ -1,10 +1,11 @@
 """Schemas for execution API payloads."""
 
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from enums import ExecutionStatus
+from enums import ExecutionEventType, ExecutionStatus
 
 
 class ExecutionCreate(BaseModel):
@@ -24,6 +25,20 @@ class ExecutionResponse(BaseModel):
     status: ExecutionStatus = Field(default=..., description="Execution status")
     input_data: dict | None = Field(default=None, description="Execution input")
     output_data: dict | None = Field(default=None, description="Execution output")
+    input_ref: str | None = Field(
+        default=None, description="Blob reference of an offloaded input"
+    )
+    output_ref: str | None = Field(
+        default=None, description="Blob reference of an offloaded output"
+    )
     error: str | None = Field(default=None, description="Error message")
     started_at: datetime = Field(default=..., description="Started at")
     finished_at: datetime | None = Field(default=None, description="Finished at")
+
+
+class ExecutionEvent(BaseModel):
+    """Event streamed while an execution runs."""
+
+    type: ExecutionEventType = Field(default=..., description="Event type")
+    node_id: int | None = Field(default=None, description="Node ID")
+    data: Any = Field(default=None, description="Event payload")
@@ -21,3 +21,22 @@ class HealthResponse(BaseModel):
     def status(self) -> bool:
         """Return aggregated health status."""
         return all(service.status for service in self.services)
+
+
+class ReplicaLagResponse(BaseModel):
+    """Response model for read replica lag."""
+
+    enabled: bool = Field(description="Whether a read replica is configured")
+    lag_seconds: float | None = Field(
+        default=None, description="Replication lag in seconds, if measurable"
+    )
+
+
+class LLMCacheStatsResponse(BaseModel):
+    """Response model for the LLM response cache counters of a worker."""
+
+    local_hits: int = Field(
+        default=0, description="Completions served from the in-process cache"
+    )
+    redis_hits: int = Field(default=0, description="Completions served from Redis")
+    misses: int = Field(default=0, description="Lookups that found no completion")
@@ -1,9 +1,14 @@
 """Schemas for workflow API payloads."""
 
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from enums import NodeType
+from schemas.edge import EdgeResponse
+from schemas.node import NodeResponse
+
 
 class WorkflowCreate(BaseModel):
     """Payload for creating a workflow."""
@@ -25,5 +30,62 @@ class WorkflowResponse(BaseModel):
     id: int = Field(default=..., description="Workflow ID", gt=0)
     owner_id: int = Field(default=..., description="Owner user ID", gt=0)
     name: str = Field(default=..., description="Workflow name")
+    version: int = Field(default=..., description="Graph version")
     created_at: datetime = Field(default=..., description="Created at")
     updated_at: datetime = Field(default=..., description="Updated at")
+
+
+class WorkflowGraphNode(BaseModel):
+    """Desired state of one node in a graph save."""
+
+    key: str = Field(
+        default=..., description="Client-side node key referenced by edges"
+    )
+    id: int | None = Field(
+        default=None, description="Existing node ID, omitted for new nodes", gt=0
+    )
+    type: NodeType = Field(default=..., description="Node type")
+    data: dict[str, Any] = Field(
+        default_factory=dict, description="Node configuration data"
+    )
+    position_x: float = Field(default=0.0, description="X position on canvas")
+    position_y: float = Field(default=0.0, description="Y position on canvas")
+
+
+class WorkflowGraphEdge(BaseModel):
+    """Desired edge in a graph save."""
+
+    source: str = Field(default=..., description="Source node key")
+    target: str = Field(default=..., description="Target node key")
+
+
+class WorkflowGraphUpdate(BaseModel):
+    """Payload replacing the whole graph of a workflow."""
+
+    nodes: list[WorkflowGraphNode] = Field(
+        default_factory=list, description="All nodes of the workflow"
+    )
+    edges: list[WorkflowGraphEdge] = Field(
+        default_factory=list, description="All edges of the workflow"
+    )
+
+
+class WorkflowGraphResponse(BaseModel):
+    """Response model for a saved workflow graph."""
+
+    id: int = Field(default=..., description="Workflow ID", gt=0)
+    version: int = Field(default=..., description="Graph version")
+    nodes: list[NodeResponse] = Field(
+        default=..., description="Nodes in the order they were submitted"
+    )
+    edges: list[EdgeResponse] = Field(default=..., description="Edges")
+
+
+class WorkflowGraphDetailResponse(BaseModel):
+    """Response model for a workflow with its whole graph."""
+
+    workflow: WorkflowResponse = Field(default=..., description="Workflow")
+    nodes: list[NodeResponse] = Field(
+        default=..., description="Nodes in topological order"
+    )
+    edges: list[EdgeResponse] = Field(default=..., description="Edges")
@@ -1,17 +1,47 @@
 """Database session and engine setup."""
 
+from typing import Any
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from settings import postgres_settings
 
-async_engine = create_async_engine(
-    url=postgres_settings.url,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_timeout=30,
-    pool_recycle=1800,
-)
+
+def engine_options() -> dict[str, Any]:
+    """Build the engine options for the configured connection mode.
+
+    Behind PgBouncer in transaction pooling mode, consecutive transactions
+    may run on different server connections. The bouncer does the pooling,
+    so the engine keeps no connections of its own, and prepared statements
+    are neither cached nor given reusable names, since a statement prepared
+    on one server connection does not exist on the next.
+
+    Returns:
+        The keyword arguments of `create_async_engine`.
+
+    """
+    if postgres_settings.pgbouncer:
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        }
+
+    return {
+        "pool_size": postgres_settings.pool_size,
+        "max_overflow": postgres_settings.max_overflow,
+        "pool_pre_ping": True,
+        "pool_timeout": postgres_settings.pool_timeout,
+        "pool_recycle": postgres_settings.pool_recycle,
+    }
+
+
+async_engine = create_async_engine(url=postgres_settings.url, **engine_options())
 
 async_session = async_sessionmaker(
     bind=async_engine,
@@ -19,3 +49,17 @@ async_session = async_sessionmaker(
     autocommit=False,
     autoflush=False,
 )
+
+# Without a configured replica, reads share the primary engine.
+replica_engine = (
+    create_async_engine(url=postgres_settings.replica_url, **engine_options())
+    if postgres_settings.replica_url
+    else async_engine
+)
+
+replica_session = async_sessionmaker(
+    bind=replica_engine,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
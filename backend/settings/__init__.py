@@ -2,14 +2,24 @@
 
 from settings.auth import auth_settings
 from settings.chroma import chroma_settings
+from settings.execution import execution_settings
+from settings.llm import llm_settings
+from settings.pagination import pagination_settings
+from settings.payload import payload_settings
 from settings.postgres import postgres_settings
 from settings.prefect import prefect_settings
+from settings.rate_limit import rate_limit_settings
 from settings.redis import redis_settings
 
 __all__ = [
     "auth_settings",
     "chroma_settings",
+    "execution_settings",
+    "llm_settings",
+    "pagination_settings",
+    "payload_settings",
     "postgres_settings",
     "prefect_settings",
+    "rate_limit_settings",
     "redis_settings",
 ]
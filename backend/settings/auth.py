@@ -17,6 +17,31 @@ class AuthSettings(BaseSettings):
         default=30, title="Access token expire minutes"
     )
     token_type: str = Field(default="Bearer", title="Token type")
+    api_key_prefix: str = Field(default="gai", title="Prefix identifying API keys")
+    bcrypt_rounds: int = Field(
+        default=12, ge=4, le=31, title="bcrypt cost factor of new password hashes"
+    )
+    hash_workers: int = Field(
+        default=4, title="Threads per worker hashing and verifying passwords"
+    )
+    hash_queue_size: int = Field(
+        default=64, title="Password operations allowed to wait for a thread"
+    )
+    hash_retry_after: int = Field(
+        default=1, title="Retry-After in seconds when the password queue is full"
+    )
+    revocation_sync_interval: float = Field(
+        default=1.0, title="Seconds between syncs of revoked token versions"
+    )
+    principal_cache_size: int = Field(
+        default=10000, title="Authenticated principals cached per worker"
+    )
+    principal_cache_ttl: int = Field(
+        default=300, title="Seconds an authenticated principal is cached in Redis"
+    )
+    principal_local_ttl: float = Field(
+        default=5.0, title="Seconds an authenticated principal is cached per worker"
+    )
 
 
 auth_settings = AuthSettings()
@@ -0,0 +1,69 @@
+"""Workflow execution settings."""
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from enums import ExecutionMode
+from settings.base import BaseSettings
+
+
+class ExecutionSettings(BaseSettings):
+    """Configuration for the workflow execution engine."""
+
+    model_config = SettingsConfigDict(env_prefix="execution_")
+
+    mode: ExecutionMode = Field(
+        default=ExecutionMode.LOCAL, title="Where executions run"
+    )
+    max_concurrency: int = Field(
+        default=16, title="Maximum concurrently running nodes per execution"
+    )
+    plan_cache_size: int = Field(default=256, title="In-process plan cache size")
+    plan_cache_ttl: int = Field(default=86400, title="Redis plan cache TTL in seconds")
+    user_max_running: int = Field(
+        default=4, title="Maximum concurrently running executions per user"
+    )
+    user_start_rate: float = Field(
+        default=1.0, title="Sustained execution starts per second per user"
+    )
+    user_start_burst: int = Field(
+        default=10, title="Execution starts a user may burst above the rate"
+    )
+    user_queue_size: int = Field(
+        default=100, title="Executions queued per user once at the limit, 0 rejects"
+    )
+    lease_ttl: int = Field(
+        default=3600, title="Seconds a running slot is held after its last renewal"
+    )
+    lease_renew_interval: float = Field(
+        default=300.0, title="Seconds between lease renewals of running executions"
+    )
+    queue_ttl: int = Field(
+        default=86400,
+        title="Seconds an idle admission queue is kept, and an execution may wait",
+    )
+    stream_heartbeat: float = Field(
+        default=15.0, title="Seconds between keep-alive events on idle streams"
+    )
+    limit_retry_after: int = Field(
+        default=5, title="Retry-After in seconds when the running limit is hit"
+    )
+    node_result_ttl: int = Field(
+        default=2592000, title="Seconds a memoized node output is kept"
+    )
+    partition_months_ahead: int = Field(
+        default=3, title="Future monthly partitions kept created"
+    )
+    retention_months: int = Field(
+        default=6, title="Full months of executions kept in Postgres"
+    )
+    archive_dir: str = Field(
+        default="/var/lib/graph-ai/archive",
+        title="Directory detached partitions are archived to, shared by all hosts",
+    )
+    maintenance_interval: float = Field(
+        default=3600.0, title="Seconds between partition maintenance runs"
+    )
+
+
+execution_settings = ExecutionSettings()
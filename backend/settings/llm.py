@@ -0,0 +1,47 @@
+"""Settings for outbound LLM provider connections."""
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from settings.base import BaseSettings
+
+
+class LLMSettings(BaseSettings):
+    """Configuration for the pooled LLM provider clients."""
+
+    model_config = SettingsConfigDict(env_prefix="llm_")
+
+    max_connections: int = Field(
+        default=100, title="Maximum open connections per provider"
+    )
+    max_keepalive_connections: int = Field(
+        default=20, title="Maximum idle keep-alive connections per provider"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, title="Seconds an idle connection is kept open"
+    )
+    connect_timeout: float = Field(default=5.0, title="Connect timeout in seconds")
+    read_timeout: float = Field(
+        default=300.0, title="Timeout between received chunks in seconds"
+    )
+    write_timeout: float = Field(default=30.0, title="Write timeout in seconds")
+    pool_timeout: float = Field(
+        default=30.0, title="Seconds to wait for a free pooled connection"
+    )
+    cache_size: int = Field(default=1024, title="In-process response cache size")
+    cache_ttl: int = Field(default=3600, title="Response cache TTL in seconds")
+    singleflight_lease: float = Field(
+        default=10.0, title="Seconds a coalescing lock lives without renewal"
+    )
+    singleflight_poll_interval: float = Field(
+        default=0.1, title="Seconds between checks for another worker's result"
+    )
+    singleflight_wait: float = Field(
+        default=600.0, title="Seconds to wait for another worker's result"
+    )
+    singleflight_result_ttl: float = Field(
+        default=60.0, title="Seconds a coalesced result stays readable"
+    )
+
+
+llm_settings = LLMSettings()
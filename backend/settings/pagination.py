@@ -0,0 +1,18 @@
+"""List pagination settings."""
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from settings.base import BaseSettings
+
+
+class PaginationSettings(BaseSettings):
+    """Configuration for keyset pagination of list endpoints."""
+
+    model_config = SettingsConfigDict(env_prefix="pagination_")
+
+    default_limit: int = Field(default=50, title="Items per page when not given")
+    max_limit: int = Field(default=200, title="Largest page a client may request")
+
+
+pagination_settings = PaginationSettings()
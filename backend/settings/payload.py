@@ -0,0 +1,31 @@
+"""Settings for the execution payload store."""
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from settings.base import BaseSettings
+
+
+class PayloadSettings(BaseSettings):
+    """Configuration for offloading large execution payloads."""
+
+    model_config = SettingsConfigDict(env_prefix="payload_")
+
+    inline_limit: int = Field(
+        default=65536, title="Largest payload in bytes kept inline in the row"
+    )
+    dir: str = Field(
+        default="/var/lib/graph-ai/payloads", title="Directory payload blobs live in"
+    )
+    compression_level: int = Field(
+        default=6, ge=0, le=9, title="zlib compression level of payload blobs"
+    )
+    orphan_grace: int = Field(
+        default=86400, title="Seconds an unreferenced blob is kept before deletion"
+    )
+    sweep_batch_size: int = Field(
+        default=1000, title="Blobs checked against executions per sweep query"
+    )
+
+
+payload_settings = PayloadSettings()
@@ -17,18 +17,58 @@ class PostgresSettings(BaseSettings):
     user: str = Field(default="postgres", title="Postgres user")
     password: str = Field(default="postgres", title="Postgres password")
     db: str = Field(default="postgres", title="Postgres db")
+    replica_host: str | None = Field(
+        default=None, title="Read replica host, reads go to the primary when unset"
+    )
+    replica_port: int = Field(default=5432, title="Read replica port")
+    replica_sticky_ttl: int = Field(
+        default=5, title="Seconds a user's reads stay on the primary after a write"
+    )
+    replica_max_lag: float = Field(
+        default=30.0, title="Replica lag in seconds above which it reports unready"
+    )
+    pgbouncer: bool = Field(
+        default=False,
+        title="Connect through PgBouncer in transaction pooling mode",
+    )
+    pool_size: int = Field(default=10, title="Connections kept open per engine")
+    max_overflow: int = Field(
+        default=20, title="Connections opened above the pool size under load"
+    )
+    pool_timeout: float = Field(
+        default=30.0, title="Seconds to wait for a free pooled connection"
+    )
+    pool_recycle: int = Field(
+        default=1800, title="Seconds after which a pooled connection is replaced"
+    )
+
+    def _build_url(self, host: str, port: int) -> str:
+        """Build an async SQLAlchemy connection URL.
+
+        Args:
+            host: The server host.
+            port: The server port.
+
+        Returns:
+            The connection URL.
+
+        """
+        return (
+            f"postgresql+asyncpg://{self.user}:{self.password}@{host}:{port}/{self.db}"
+        )
 
     @property
     def url(self) -> str:
         """Build the async SQLAlchemy connection URL."""
-        return (
-            f"postgresql+asyncpg://"
-            f"{self.user}:"
-            f"{self.password}@"
-            f"{self.host}:"
-            f"{self.port}/"
-            f"{self.db}"
-        )
+        return self._build_url(host=self.host, port=self.port)
+
+    @property
+    def replica_url(self) -> str | None:
+        """Build the read replica connection URL, if a replica is configured."""
+        if self.replica_host is None:
+            return None
+
+        return self._build_url(host=self.replica_host, port=self.replica_port)
 
 
 postgres_settings = PostgresSettings()
@@ -17,6 +17,15 @@ class PrefectSettings(BaseSettings):
     host: str = Field(default="prefect-server", title="Prefect server host")
     port: int = Field(default=4200, title="Prefect server port")
     pool_name: str = Field(default="local-pool", title="Prefect pool name")
+    deployment_name: str = Field(
+        default="graph-ai", title="Deployment running workflow executions"
+    )
+    submit_batch_size: int = Field(
+        default=100, title="Maximum flow runs created per batch"
+    )
+    submit_batch_window: float = Field(
+        default=0.05, title="Seconds to wait for a batch to fill"
+    )
 
     @property
     def url(self) -> str:
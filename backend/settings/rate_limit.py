@@ -0,0 +1,28 @@
+"""Rate limiting settings."""
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from settings.base import BaseSettings
+
+
+class RateLimitSettings(BaseSettings):
+    """Configuration for the per-user, per-route rate limits."""
+
+    model_config = SettingsConfigDict(env_prefix="rate_limit_")
+
+    enabled: bool = Field(default=True, title="Enforce rate limits")
+    window: int = Field(default=60, gt=0, title="Sliding window length in seconds")
+    default_limit: int = Field(
+        default=600, gt=0, title="Requests per window per client and route"
+    )
+    route_limits: dict[str, int] = Field(
+        default={"GET /executions": 120, "GET /executions/{execution_id}": 120},
+        title="Per-route limits keyed by method and path template",
+    )
+    exempt_paths: list[str] = Field(
+        default=["/health"], title="Path prefixes that are never limited"
+    )
+
+
+rate_limit_settings = RateLimitSettings()
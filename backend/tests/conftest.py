@@ -1,8 +1,12 @@
 """Pytest fixtures for backend tests."""
 
+import contextlib
 from collections.abc import AsyncGenerator
+from functools import partial
 
 import pytest_asyncio
+import redis.asyncio as redis
+from fakeredis import FakeAsyncRedis, FakeServer
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -13,9 +17,12 @@ from sqlalchemy.ext.asyncio import (
 from testcontainers.postgres import PostgresContainer
 
 from dependencies import db
+from engine import execution_engine, plan_cache
 from main import app
 from models import Base
 from settings import postgres_settings
+from utils.redis import redis_client
+from utils.revocation import VERSIONS_KEY, token_revocation
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -25,6 +32,26 @@ async def postgres_container() -> AsyncGenerator[PostgresContainer, None]:
         yield postgres
 
 
+@pytest_asyncio.fixture(scope="function")
+async def fake_redis() -> AsyncGenerator[FakeAsyncRedis, None]:
+    """Point the shared Redis client at an empty in-memory server.
+
+    Every event loop gets a client of the same fake server, so registered
+    Lua scripts and commands from Prefect task loops run against it as well.
+    """
+    server = FakeServer()
+    factory = redis_client.use(
+        factory=partial(FakeAsyncRedis, server=server, decode_responses=True)
+    )
+    fake = FakeAsyncRedis(server=server, decode_responses=True)
+
+    yield fake
+
+    await redis_client.aclose()
+    redis_client.use(factory=factory)
+    await fake.aclose()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_engine(
     postgres_container: PostgresContainer,
@@ -58,7 +85,9 @@ async def test_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession,
 
 
 @pytest_asyncio.fixture(scope="function")
-async def test_client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def test_client(
+    test_engine: AsyncEngine, test_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
     """Provide an HTTP client with the test session injected."""
 
     def override_get_session() -> AsyncSession:
@@ -67,9 +96,21 @@ async def test_client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient,
 
     app.dependency_overrides[db.get_session] = override_get_session
 
+    session_factory = execution_engine.session_factory
+    execution_engine.session_factory = async_sessionmaker(
+        test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
     ) as client:
         yield client
 
+    await execution_engine.drain()
+    execution_engine.session_factory = session_factory
     app.dependency_overrides.clear()
+    # IDs restart in every test database, so cached state must not leak.
+    await plan_cache.clear()
+    token_revocation.clear()
+    with contextlib.suppress(redis.RedisError):
+        await redis_client.delete(VERSIONS_KEY)
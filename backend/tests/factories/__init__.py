@@ -4,6 +4,7 @@ from tests.factories.edge import EdgeFactory
 from tests.factories.execution import ExecutionFactory
 from tests.factories.llm_provider import LLMProviderFactory
 from tests.factories.node import NodeFactory
+from tests.factories.node_result import NodeResultFactory
 from tests.factories.user import UserFactory
 from tests.factories.workflow import WorkflowFactory
 
@@ -12,6 +13,7 @@ __all__ = [
     "ExecutionFactory",
     "LLMProviderFactory",
     "NodeFactory",
+    "NodeResultFactory",
     "UserFactory",
     "WorkflowFactory",
 ]
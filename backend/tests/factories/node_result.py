@@ -0,0 +1,17 @@
+"""Node result model factory."""
+
+from models.node_result import NodeResult
+from tests.factories.base import AsyncSQLAlchemyModelFactory
+
+
+class NodeResultFactory(AsyncSQLAlchemyModelFactory):
+    """Factory for creating NodeResult instances."""
+
+    class Meta:
+        """Factory meta configuration."""
+
+        model = NodeResult
+
+    workflow_id = None
+    node_hash = None
+    output = None
@@ -0,0 +1,80 @@
+"""API key API tests."""
+
+from http import HTTPStatus
+
+import pytest
+
+from settings import auth_settings
+from tests.test_api.base import BaseTestCase
+
+
+class TestApiKeyCreate(BaseTestCase):
+    """Tests for POST /api-keys."""
+
+    url = "/api-keys"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        """The created key authenticates its owner."""
+        user, headers = await self.create_user_and_get_token()
+
+        response = await self.client.post(
+            url=self.url, json={"name": "ci"}, headers=headers
+        )
+
+        data = await self.assert_response_dict(response=response)
+        self.assert_has_keys(data, {"id", "name", "prefix", "created_at", "key"})
+        response = await self.client.get(
+            url="/users/me",
+            headers={"Authorization": f"{auth_settings.token_type} {data['key']}"},
+        )
+        me = await self.assert_response_dict(response=response)
+        if me["id"] != user["id"]:
+            pytest.fail("API key did not authenticate its owner")
+
+
+class TestApiKeyList(BaseTestCase):
+    """Tests for GET /api-keys."""
+
+    url = "/api-keys"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        """Listed keys never include the key itself."""
+        _, headers = await self.create_user_and_get_token()
+        await self.client.post(url=self.url, json={"name": "ci"}, headers=headers)
+
+        response = await self.client.get(url=self.url, headers=headers)
+
+        data = await self.assert_response_list(response=response)
+        if len(data) != 1:
+            pytest.fail(f"Expected 1 API key, got {len(data)}")
+        if "key" in data[0] or "digest" in data[0]:
+            pytest.fail("Listed API keys must not include the key or its digest")
+
+
+class TestApiKeyDelete(BaseTestCase):
+    """Tests for DELETE /api-keys/{api_key_id}."""
+
+    url = "/api-keys"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_ok(self) -> None:
+        """A revoked key no longer authenticates."""
+        _, headers = await self.create_user_and_get_token()
+        response = await self.client.post(
+            url=self.url, json={"name": "ci"}, headers=headers
+        )
+        created = await self.assert_response_dict(response=response)
+        key_headers = {"Authorization": f"{auth_settings.token_type} {created['key']}"}
+        await self.client.get(url="/users/me", headers=key_headers)
+
+        response = await self.client.delete(
+            url=f"{self.url}/{created['id']}", headers=headers
+        )
+
+        await self.assert_response_ok(response=response)
+        response = await self.client.get(url="/users/me", headers=key_headers)
+        if response.status_code != HTTPStatus.UNAUTHORIZED:
+            pytest.fail(f"Expected status UNAUTHORIZED, got {response.status_code}")
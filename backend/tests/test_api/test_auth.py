@@ -2,6 +2,7 @@
 
 import secrets
 import uuid
+from http import HTTPStatus
 
 import pytest
 
@@ -63,3 +64,57 @@ class TestAuthLogin(BaseTestCase):
         self.assert_has_keys(data, {"access_token", "token_type"})
         if data["token_type"] != auth_settings.token_type:
             pytest.fail("Token type did not match expected value")
+
+    @pytest.mark.asyncio
+    async def test_busy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Logins are rejected while the password queue is full."""
+        monkeypatch.setattr(auth_settings, "hash_workers", 0)
+        monkeypatch.setattr(auth_settings, "hash_queue_size", 0)
+        user_data = {
+            "email": f"john.doe-{uuid.uuid4().hex[:8]}@example.com",
+            "password": secrets.token_urlsafe(16),
+        }
+        await UserFactory.create_async(
+            session=self.session,
+            email=user_data["email"],
+            hashed_password=hash_password(user_data["password"]),
+        )
+
+        response = await self.client.post(url=self.url, json=user_data)
+
+        if response.status_code != HTTPStatus.SERVICE_UNAVAILABLE:
+            pytest.fail(
+                f"Expected status SERVICE_UNAVAILABLE, got {response.status_code}"
+            )
+        if "Retry-After" not in response.headers:
+            pytest.fail("Expected a Retry-After header")
+
+
+class TestAuthLogoutAll(BaseTestCase):
+    """Tests for POST /auth/logout-all."""
+
+    url = "/auth/logout-all"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_ok(self) -> None:
+        """Tokens issued before the logout are rejected, new ones are not."""
+        password = secrets.token_urlsafe(16)
+        user, headers = await self.create_user_and_get_token(password=password)
+
+        response = await self.client.post(url=self.url, headers=headers)
+
+        await self.assert_response_ok(response=response)
+        response = await self.client.get(url="/users/me", headers=headers)
+        if response.status_code != HTTPStatus.UNAUTHORIZED:
+            pytest.fail(f"Expected status UNAUTHORIZED, got {response.status_code}")
+
+        response = await self.client.post(
+            url="/auth/login", json={"email": user["email"], "password": password}
+        )
+        token = (await self.assert_response_dict(response=response))["access_token"]
+        response = await self.client.get(
+            url="/users/me",
+            headers={"Authorization": f"{auth_settings.token_type} {token}"},
+        )
+        await self.assert_response_ok(response=response)
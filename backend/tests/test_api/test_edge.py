@@ -50,6 +50,43 @@ class TestEdgeCreate(BaseTestCase):
         if data["workflow_id"] != workflow.id:
             pytest.fail("Edge workflow_id did not match request")
 
+    @pytest.mark.asyncio
+    async def test_cycle(self) -> None:
+        """An edge closing a cycle is rejected."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        first = await NodeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            type=NodeType.LLM,
+        )
+        second = await NodeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            type=NodeType.LLM,
+        )
+        await EdgeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            source_node_id=first.id,
+            target_node_id=second.id,
+        )
+
+        response = await self.client.post(
+            url=self.url,
+            json={
+                "workflow_id": workflow.id,
+                "source_node_id": second.id,
+                "target_node_id": first.id,
+            },
+            headers=headers,
+        )
+
+        if response.status_code != HTTPStatus.BAD_REQUEST:
+            pytest.fail("Expected cyclic edge to be rejected")
+
 
 class TestEdgeList(BaseTestCase):
     """Tests for GET /edges."""
@@ -1,10 +1,29 @@
 """Execution API tests."""
 
+import shutil
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from itertools import pairwise
+from pathlib import Path
+
 import pytest
+from fakeredis import FakeAsyncRedis
 
-from enums import ExecutionStatus
-from tests.factories import ExecutionFactory, WorkflowFactory
+from engine import ExecutionContext, compile_plan, execution_engine
+from engine.memo import node_hashes
+from enums import ExecutionStatus, NodeType
+from repositories import ExecutionPartitionRepository
+from settings import execution_settings, payload_settings
+from tests.factories import (
+    EdgeFactory,
+    ExecutionFactory,
+    NodeFactory,
+    NodeResultFactory,
+    WorkflowFactory,
+)
 from tests.test_api.base import BaseTestCase
+from usecases import ExecutionArchiveUsecase, ExecutionUsecase
+from usecases.execution import QUEUE_EXPIRED_ERROR
 
 
 class TestExecutionCreate(BaseTestCase):
@@ -33,6 +52,200 @@ class TestExecutionCreate(BaseTestCase):
         if data["status"] != ExecutionStatus.CREATED:
             pytest.fail("Execution status did not match default")
 
+    @pytest.mark.asyncio
+    async def test_runs_workflow(self) -> None:
+        """The created execution runs the graph and stores its output."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        source = await NodeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            type=NodeType.INPUT,
+            data={"key": "text"},
+        )
+        target = await NodeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            type=NodeType.OUTPUT,
+            data={"key": "result"},
+        )
+        await EdgeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            source_node_id=source.id,
+            target_node_id=target.id,
+        )
+
+        response = await self.client.post(
+            url=self.url,
+            json={"workflow_id": workflow.id, "input_data": {"text": "hello"}},
+            headers=headers,
+        )
+        created = await self.assert_response_dict(response=response)
+        await execution_engine.drain()
+
+        response = await self.client.get(
+            url=f"{self.url}/{created['id']}", headers=headers
+        )
+
+        data = await self.assert_response_dict(response=response)
+        if data["status"] != ExecutionStatus.SUCCESS:
+            pytest.fail("Execution did not finish successfully")
+        if data["output_data"] != {"result": "hello"}:
+            pytest.fail("Execution output did not match input")
+        if data["finished_at"] is None:
+            pytest.fail("Execution finished_at was not set")
+
+    @pytest.mark.asyncio
+    async def test_store_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An execution whose result cannot be stored ends FAILED."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+
+        store = execution_engine._payload_store  # noqa: SLF001
+        put = store.put
+
+        async def put_output(payload: dict | None) -> tuple[dict | None, str | None]:
+            # The request stores no input, so only the output fails.
+            if payload is None:
+                return await put(payload=payload)
+            message = "Disk full"
+            raise OSError(message)
+
+        monkeypatch.setattr(store, "put", put_output)
+        response = await self.client.post(
+            url=self.url, json={"workflow_id": workflow.id}, headers=headers
+        )
+        created = await self.assert_response_dict(response=response)
+        await execution_engine.drain()
+
+        response = await self.client.get(
+            url=f"{self.url}/{created['id']}", headers=headers
+        )
+
+        data = await self.assert_response_dict(response=response)
+        if data["status"] != ExecutionStatus.FAILED:
+            pytest.fail("Expected the execution to fail")
+        if data["error"] != "Disk full":
+            pytest.fail("Expected the storage error to be reported")
+
+    @pytest.mark.asyncio
+    async def test_reuses_memoized_outputs(self) -> None:
+        """Nodes with a stored output for their hash are not run again."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        nodes = [
+            await NodeFactory.create_async(
+                session=self.session,
+                workflow_id=workflow.id,
+                type=node_type,
+                data=data,
+            )
+            for node_type, data in (
+                (NodeType.INPUT, {"key": "text"}),
+                (
+                    NodeType.LLM,
+                    {"model": "llama3", "prompt": "Summarize {input}", "cache": True},
+                ),
+                (NodeType.OUTPUT, {"key": "summary"}),
+            )
+        ]
+        edges = [
+            await EdgeFactory.create_async(
+                session=self.session,
+                workflow_id=workflow.id,
+                source_node_id=source.id,
+                target_node_id=target.id,
+            )
+            for source, target in pairwise(nodes)
+        ]
+        hashes = node_hashes(
+            plan=compile_plan(
+                workflow_id=workflow.id, version=0, nodes=nodes, edges=edges
+            ),
+            context=ExecutionContext(
+                execution_id=0,
+                workflow_id=workflow.id,
+                owner_id=user["id"],
+                input_data={"text": "hello"},
+            ),
+        )
+        await NodeResultFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            node_hash=hashes[1],
+            output="memoized",
+        )
+
+        response = await self.client.post(
+            url=self.url,
+            json={"workflow_id": workflow.id, "input_data": {"text": "hello"}},
+            headers=headers,
+        )
+        created = await self.assert_response_dict(response=response)
+        await execution_engine.drain()
+
+        response = await self.client.get(
+            url=f"{self.url}/{created['id']}", headers=headers
+        )
+
+        data = await self.assert_response_dict(response=response)
+        if data["status"] != ExecutionStatus.SUCCESS:
+            pytest.fail("Execution did not reuse the memoized LLM output")
+        if data["output_data"] != {"summary": "memoized"}:
+            pytest.fail("Execution output did not come from the memoized node")
+
+
+class TestExecutionQueueExpiry(BaseTestCase):
+    """Executions dropped from an expired admission queue are failed."""
+
+    url = "/executions"
+
+    @pytest.mark.asyncio
+    async def test_fails_dropped(self, fake_redis: FakeAsyncRedis) -> None:
+        """Only old executions that are no longer queued are failed."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        now = datetime.now(tz=UTC).replace(tzinfo=None)
+        started_at = now - timedelta(seconds=execution_settings.queue_ttl + 60)
+        dropped, queued, recent = [
+            await ExecutionFactory.create_async(
+                session=self.session,
+                workflow_id=workflow.id,
+                status=ExecutionStatus.CREATED,
+                started_at=moment,
+            )
+            for moment in (started_at, started_at, now)
+        ]
+        await fake_redis.rpush(
+            f"executions:queued:{user['id']}",
+            f"{queued.id}:{queued.started_at.isoformat()}",
+        )
+
+        await ExecutionUsecase().expire_queued(session=self.session)
+
+        statuses = {}
+        for execution in (dropped, queued, recent):
+            response = await self.client.get(
+                url=f"{self.url}/{execution.id}", headers=headers
+            )
+            data = await self.assert_response_dict(response=response)
+            statuses[execution.id] = (data["status"], data["error"])
+        if statuses[dropped.id] != (ExecutionStatus.FAILED, QUEUE_EXPIRED_ERROR):
+            pytest.fail("The dropped execution should be failed")
+        if statuses[queued.id][0] != ExecutionStatus.CREATED:
+            pytest.fail("A still queued execution should keep waiting")
+        if statuses[recent.id][0] != ExecutionStatus.CREATED:
+            pytest.fail("A recent execution should keep waiting")
+
 
 class TestExecutionList(BaseTestCase):
     """Tests for GET /executions."""
@@ -65,6 +278,65 @@ class TestExecutionList(BaseTestCase):
         if first.id not in ids or second.id not in ids:
             pytest.fail("Expected executions to appear in list")
 
+    @pytest.mark.asyncio
+    async def test_pages(self) -> None:
+        """Pages follow the cursor from the header until the last one."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        executions = [
+            await ExecutionFactory.create_async(
+                session=self.session, workflow_id=workflow.id
+            )
+            for _ in range(3)
+        ]
+
+        params = {"workflow_id": workflow.id, "limit": 2, "order": "desc"}
+        first = await self.client.get(url=self.url, params=params, headers=headers)
+        cursor = first.headers.get("X-Next-Cursor")
+        if not cursor:
+            pytest.fail("Expected a cursor for the next page")
+
+        second = await self.client.get(
+            url=self.url, params={**params, "cursor": cursor}, headers=headers
+        )
+        if "X-Next-Cursor" in second.headers:
+            pytest.fail("Expected no cursor on the last page")
+
+        ids = [
+            item["id"]
+            for response in (first, second)
+            for item in await self.assert_response_list(response=response)
+        ]
+        if ids != [execution.id for execution in reversed(executions)]:
+            pytest.fail("Expected every execution once, newest first")
+
+    @pytest.mark.asyncio
+    async def test_cursor_order_mismatch(self) -> None:
+        """A cursor is rejected when the page asks for another sort order."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        for _ in range(2):
+            await ExecutionFactory.create_async(
+                session=self.session, workflow_id=workflow.id
+            )
+
+        params = {"workflow_id": workflow.id, "limit": 1, "order": "desc"}
+        first = await self.client.get(url=self.url, params=params, headers=headers)
+        cursor = first.headers["X-Next-Cursor"]
+
+        response = await self.client.get(
+            url=self.url,
+            params={**params, "order": "asc", "cursor": cursor},
+            headers=headers,
+        )
+
+        if response.status_code != HTTPStatus.BAD_REQUEST:
+            pytest.fail(f"Expected status BAD_REQUEST, got {response.status_code}")
+
 
 class TestExecutionGet(BaseTestCase):
     """Tests for GET /executions/{execution_id}."""
@@ -90,3 +362,160 @@ class TestExecutionGet(BaseTestCase):
         data = await self.assert_response_dict(response=response)
         if data["id"] != execution.id:
             pytest.fail("Execution id did not match")
+
+    @pytest.mark.asyncio
+    async def test_archived(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An execution past retention is read back from its archive file."""
+        monkeypatch.setattr(execution_settings, "archive_dir", str(tmp_path))
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        month = datetime(year=2020, month=1, day=1)  # noqa: DTZ001
+        await ExecutionPartitionRepository().create(session=self.session, month=month)
+        execution = await ExecutionFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            status=ExecutionStatus.SUCCESS,
+            output_data={"result": "hello"},
+            started_at=month,
+        )
+
+        await ExecutionArchiveUsecase().archive_partitions(session=self.session)
+
+        response = await self.client.get(
+            url=f"{self.url}/{execution.id}", headers=headers
+        )
+        data = await self.assert_response_dict(response=response)
+        if data["output_data"] != {"result": "hello"}:
+            pytest.fail("Archived execution output did not match")
+
+    @pytest.mark.asyncio
+    async def test_offloaded_payload(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Large input is stored as a blob and only inlined on request."""
+        monkeypatch.setattr(payload_settings, "dir", str(tmp_path))
+        monkeypatch.setattr(payload_settings, "inline_limit", 64)
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        input_data = {"text": "x" * 1024}
+        created = await self.client.post(
+            url=self.url,
+            json={"workflow_id": workflow.id, "input_data": input_data},
+            headers=headers,
+        )
+        execution_id = (await self.assert_response_dict(response=created))["id"]
+
+        response = await self.client.get(
+            url=f"{self.url}/{execution_id}", headers=headers
+        )
+        data = await self.assert_response_dict(response=response)
+        if data["input_data"] is not None or not data["input_ref"]:
+            pytest.fail("Expected the input to be offloaded")
+
+        response = await self.client.get(
+            url=f"{self.url}/{execution_id}",
+            params={"include_payloads": True},
+            headers=headers,
+        )
+        data = await self.assert_response_dict(response=response)
+        if data["input_data"] != input_data:
+            pytest.fail("Offloaded input did not match")
+
+    @pytest.mark.asyncio
+    async def test_missing_payload(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A lost blob is reported as unavailable rather than as a crash."""
+        monkeypatch.setattr(payload_settings, "dir", str(tmp_path))
+        monkeypatch.setattr(payload_settings, "inline_limit", 64)
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        created = await self.client.post(
+            url=self.url,
+            json={"workflow_id": workflow.id, "input_data": {"text": "x" * 1024}},
+            headers=headers,
+        )
+        execution_id = (await self.assert_response_dict(response=created))["id"]
+        shutil.rmtree(tmp_path)
+
+        response = await self.client.get(
+            url=f"{self.url}/{execution_id}",
+            params={"include_payloads": True},
+            headers=headers,
+        )
+
+        if response.status_code != HTTPStatus.SERVICE_UNAVAILABLE:
+            pytest.fail(f"Expected status 503, got {response.status_code}")
+
+
+class TestExecutionStream(BaseTestCase):
+    """Tests for GET /executions/{execution_id}/stream."""
+
+    url = "/executions"
+
+    @pytest.mark.asyncio
+    async def test_finished(self) -> None:
+        """A finished execution streams its result and closes."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        execution = await ExecutionFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            status=ExecutionStatus.SUCCESS,
+            output_data={"result": "hello"},
+        )
+
+        response = await self.client.get(
+            url=f"{self.url}/{execution.id}/stream", headers=headers
+        )
+
+        if response.status_code != HTTPStatus.OK:
+            pytest.fail(f"Expected status OK, got {response.status_code}")
+        if not response.headers["content-type"].startswith("text/event-stream"):
+            pytest.fail("Expected an event stream")
+        if "event: finished" not in response.text:
+            pytest.fail("Expected the stream to end with a finished event")
+        if '"result":"hello"' not in response.text:
+            pytest.fail("Expected the finished event to carry the output")
+
+    @pytest.mark.asyncio
+    async def test_archived(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An archived execution streams its final state and closes."""
+        monkeypatch.setattr(execution_settings, "archive_dir", str(tmp_path))
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        month = datetime(year=2020, month=1, day=1)  # noqa: DTZ001
+        await ExecutionPartitionRepository().create(session=self.session, month=month)
+        execution = await ExecutionFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            status=ExecutionStatus.SUCCESS,
+            output_data={"result": "hello"},
+            started_at=month,
+        )
+        await ExecutionArchiveUsecase().archive_partitions(session=self.session)
+
+        response = await self.client.get(
+            url=f"{self.url}/{execution.id}/stream", headers=headers
+        )
+
+        if response.status_code != HTTPStatus.OK:
+            pytest.fail(f"Expected status OK, got {response.status_code}")
+        if "event: finished" not in response.text:
+            pytest.fail("Expected the archived execution's finished event")
+        if '"result":"hello"' not in response.text:
+            pytest.fail("Expected the finished event to carry the archived output")
@@ -1,7 +1,10 @@
 """Health endpoint tests."""
 
+from collections import Counter
+
 import pytest
 
+from llm import llm_cache
 from tests.test_api.base import BaseTestCase
 
 
@@ -36,3 +39,35 @@ class TestHealthReadiness(BaseTestCase):
             pytest.fail("Expected services to be a list")
         if not isinstance(data["status"], bool):
             pytest.fail("Expected status to be a boolean")
+
+
+class TestHealthReplica(BaseTestCase):
+    """Replica lag checks for the health endpoint."""
+
+    url = "/health/replica"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        """Without a configured replica there is no lag to report."""
+        response = await self.client.get(url=self.url)
+
+        data = await self.assert_response_ok(response=response)
+        if data != {"enabled": False, "lag_seconds": None}:
+            pytest.fail("Expected the replica to be reported as disabled")
+
+
+class TestHealthLLMCache(BaseTestCase):
+    """LLM response cache counters of the health endpoint."""
+
+    url = "/health/llm-cache"
+
+    @pytest.mark.asyncio
+    async def test_ok(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Reports the worker's cache hits and misses."""
+        monkeypatch.setattr(llm_cache, "stats", Counter({"local_hits": 3, "misses": 1}))
+
+        response = await self.client.get(url=self.url)
+
+        data = await self.assert_response_ok(response=response)
+        if data != {"local_hits": 3, "redis_hits": 0, "misses": 1}:
+            pytest.fail(f"Unexpected cache stats: {data}")
@@ -6,7 +6,7 @@ from http import HTTPStatus
 import pytest
 
 from enums import NodeType
-from tests.factories import NodeFactory, WorkflowFactory
+from tests.factories import NodeFactory, UserFactory, WorkflowFactory
 from tests.test_api.base import BaseTestCase
 
 
@@ -42,6 +42,26 @@ class TestNodeCreate(BaseTestCase):
         if data["type"] != NodeType.INPUT:
             pytest.fail("Node type did not match request")
 
+    @pytest.mark.asyncio
+    async def test_bumps_workflow_version(self) -> None:
+        """Creating a node invalidates cached plans of the workflow."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        version = workflow.version
+
+        response = await self.client.post(
+            url=self.url,
+            json={"workflow_id": workflow.id, "type": NodeType.INPUT},
+            headers=headers,
+        )
+
+        await self.assert_response_dict(response=response)
+        await self.session.refresh(workflow)
+        if workflow.version != version + 1:
+            pytest.fail("Workflow version was not bumped")
+
 
 class TestNodeList(BaseTestCase):
     """Tests for GET /nodes."""
@@ -104,6 +124,23 @@ class TestNodeGet(BaseTestCase):
         if data["id"] != node.id:
             pytest.fail("Node id did not match")
 
+    @pytest.mark.asyncio
+    async def test_other_owner(self) -> None:
+        """A node in another user's workflow is not found."""
+        _, headers = await self.create_user_and_get_token()
+        other = await UserFactory.create_async(session=self.session)
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=other.id
+        )
+        node = await NodeFactory.create_async(
+            session=self.session, workflow_id=workflow.id
+        )
+
+        response = await self.client.get(url=f"{self.url}/{node.id}", headers=headers)
+
+        if response.status_code != HTTPStatus.NOT_FOUND:
+            pytest.fail("Expected another user's node to return 404")
+
 
 class TestNodeUpdate(BaseTestCase):
     """Tests for PATCH /nodes/{node_id}."""
@@ -0,0 +1,162 @@
+"""Rate limiting middleware tests."""
+
+from http import HTTPStatus
+
+import pytest
+import redis.asyncio as redis
+
+from main import app
+from settings import auth_settings, rate_limit_settings
+from tests.test_api.base import BaseTestCase
+from usecases import AuthUsecase
+from utils.rate_limit import RateLimitMiddleware
+
+LIMIT = 2
+
+
+def rate_limit_middleware() -> RateLimitMiddleware:
+    """Find the rate limiting middleware in the built application stack.
+
+    Returns:
+        The middleware instance.
+
+    """
+    layer = app.middleware_stack
+    while not isinstance(layer, RateLimitMiddleware):
+        layer = layer.app
+
+    return layer
+
+
+@pytest.mark.usefixtures("fake_redis")
+class TestRateLimit(BaseTestCase):
+    """Requests are counted per client and route."""
+
+    url = "/users/me"
+
+    @pytest.fixture(autouse=True)
+    def limits(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Allow a couple of requests per window."""
+        monkeypatch.setattr(rate_limit_settings, "default_limit", LIMIT)
+        monkeypatch.setattr(rate_limit_settings, "route_limits", {})
+
+    @pytest.mark.asyncio
+    async def test_headers(self) -> None:
+        """Responses report the limit, what is left of it and when it resets."""
+        _, headers = await self.create_user_and_get_token()
+
+        response = await self.client.get(url=self.url, headers=headers)
+
+        await self.assert_response_ok(response=response)
+        if response.headers["RateLimit-Limit"] != str(LIMIT):
+            pytest.fail("Expected the default limit")
+        if response.headers["RateLimit-Remaining"] != str(LIMIT - 1):
+            pytest.fail("Expected the request to be counted")
+        if int(response.headers["RateLimit-Reset"]) > rate_limit_settings.window:
+            pytest.fail("Expected the reset within the window")
+
+    @pytest.mark.asyncio
+    async def test_limited(self) -> None:
+        """Requests over the limit are rejected with Retry-After."""
+        _, headers = await self.create_user_and_get_token()
+        for _ in range(LIMIT):
+            await self.client.get(url=self.url, headers=headers)
+
+        response = await self.client.get(url=self.url, headers=headers)
+
+        if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+            pytest.fail(f"Expected status 429, got {response.status_code}")
+        if int(response.headers["Retry-After"]) <= 0:
+            pytest.fail("Expected a positive Retry-After")
+
+    @pytest.mark.asyncio
+    async def test_route_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A route's own limit applies to it, and routes count separately."""
+        monkeypatch.setattr(
+            rate_limit_settings, "route_limits", {f"GET {self.url}": LIMIT + 1}
+        )
+        _, headers = await self.create_user_and_get_token()
+
+        response = await self.client.get(url=self.url, headers=headers)
+        other = await self.client.get(url="/workflows", headers=headers)
+
+        if response.headers["RateLimit-Limit"] != str(LIMIT + 1):
+            pytest.fail("Expected the route's own limit")
+        if other.headers["RateLimit-Remaining"] != str(LIMIT - 1):
+            pytest.fail("Expected the other route to be counted on its own")
+
+    @pytest.mark.asyncio
+    async def test_invented_credentials(self) -> None:
+        """Unverifiable credentials share the budget of the client address."""
+        statuses = [
+            (
+                await self.client.get(
+                    url=self.url, headers={"Authorization": f"Bearer invented-{index}"}
+                )
+            ).status_code
+            for index in range(LIMIT + 1)
+        ]
+
+        if statuses[-1] != HTTPStatus.TOO_MANY_REQUESTS:
+            pytest.fail("Expected invented credentials to share one bucket")
+
+    @pytest.mark.asyncio
+    async def test_api_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An API key counts against the client address, not a lookup."""
+        monkeypatch.setattr(rate_limit_settings, "default_limit", LIMIT + 1)
+        _, headers = await self.create_user_and_get_token()
+        response = await self.client.post(
+            url="/api-keys", json={"name": "ci"}, headers=headers
+        )
+        key = (await self.assert_response_dict(response=response))["key"]
+        key_headers = {"Authorization": f"{auth_settings.token_type} {key}"}
+        await self.client.get(url=self.url, headers=key_headers)
+
+        await self.client.get(url=self.url, headers=headers)
+        await self.client.get(url=self.url, headers={"Authorization": "Bearer x"})
+        response = await self.client.get(url=self.url, headers=key_headers)
+
+        if response.headers["RateLimit-Remaining"] != str(LIMIT - 2):
+            pytest.fail("Expected the key to share the client address bucket")
+
+    @pytest.mark.asyncio
+    async def test_decoded_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Authentication reuses the token payload the limiter verified."""
+        _, headers = await self.create_user_and_get_token()
+        decode = AuthUsecase.get_payload
+        calls: list[str] = []
+
+        def get_payload(usecase: AuthUsecase, token: str) -> dict:
+            calls.append(token)
+            return decode(usecase, token=token)
+
+        monkeypatch.setattr(AuthUsecase, "get_payload", get_payload)
+        response = await self.client.get(url=self.url, headers=headers)
+
+        await self.assert_response_ok(response=response)
+        if len(calls) != 1:
+            pytest.fail(f"Expected the token to be decoded once, got {len(calls)}")
+
+    @pytest.mark.asyncio
+    async def test_exempt(self) -> None:
+        """Exempt paths are neither limited nor counted."""
+        response = await self.client.get(url="/health/liveness")
+
+        if "RateLimit-Limit" in response.headers:
+            pytest.fail("Expected health probes to be exempt")
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Requests go through unlimited when Redis is unavailable."""
+        _, headers = await self.create_user_and_get_token()
+        await self.client.get(url=self.url, headers=headers)
+
+        async def unavailable(**_: object) -> None:
+            raise redis.ConnectionError
+
+        monkeypatch.setattr(rate_limit_middleware(), "_check", unavailable)
+        response = await self.client.get(url=self.url, headers=headers)
+
+        await self.assert_response_ok(response=response)
+        if "RateLimit-Limit" in response.headers:
+            pytest.fail("Expected no rate limit headers without Redis")
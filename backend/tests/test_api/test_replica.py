@@ -0,0 +1,90 @@
+"""Read replica routing tests."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dependencies import replica
+from settings import postgres_settings
+from tests.factories import WorkflowFactory
+from tests.test_api.base import BaseTestCase
+
+
+class TestReadRouting(BaseTestCase):
+    """Reads go to the replica unless the user wrote recently."""
+
+    url = "/workflows"
+
+    @pytest.fixture(autouse=True)
+    def replica_session(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Configure a replica and count the sessions opened on it."""
+        monkeypatch.setattr(postgres_settings, "replica_host", "replica")
+        self.replica_reads = 0
+
+        @asynccontextmanager
+        async def replica_session() -> AsyncIterator[AsyncSession]:
+            self.replica_reads += 1
+            yield self.session
+
+        monkeypatch.setattr(replica, "replica_session", replica_session)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_reads_from_replica(self) -> None:
+        """A GET route is served by a replica session."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+
+        response = await self.client.get(url=self.url, headers=headers)
+
+        data = await self.assert_response_list(response=response)
+        if [item["id"] for item in data] != [workflow.id]:
+            pytest.fail("Replica read did not return the user's workflow")
+        if self.replica_reads != 1:
+            pytest.fail("Expected the read to use the replica session")
+
+    @pytest.mark.asyncio
+    async def test_write_pins(self, fake_redis: FakeAsyncRedis) -> None:
+        """A write route pins the user's reads to the primary."""
+        user, headers = await self.create_user_and_get_token()
+
+        response = await self.client.post(
+            url=self.url, json={"name": "pinned"}, headers=headers
+        )
+
+        await self.assert_response_dict(response=response)
+        if not await fake_redis.exists(f"replica:pin:{user['id']}"):
+            pytest.fail("Expected the write to pin the user")
+        if self.replica_reads:
+            pytest.fail("Writes must not use the replica session")
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_pinned_reads_primary(self) -> None:
+        """A user who just wrote reads their change from the primary."""
+        _, headers = await self.create_user_and_get_token()
+        await self.client.post(url=self.url, json={"name": "pinned"}, headers=headers)
+
+        response = await self.client.get(url=self.url, headers=headers)
+
+        data = await self.assert_response_list(response=response)
+        if [item["name"] for item in data] != ["pinned"]:
+            pytest.fail("Pinned read did not see the user's write")
+        if self.replica_reads:
+            pytest.fail("Expected the pinned read to use the primary")
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable(self) -> None:
+        """Without Redis, reads go to the primary."""
+        _, headers = await self.create_user_and_get_token()
+
+        response = await self.client.get(url=self.url, headers=headers)
+
+        await self.assert_response_list(response=response)
+        if self.replica_reads:
+            pytest.fail("Expected reads to fall back to the primary")
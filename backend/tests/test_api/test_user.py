@@ -1,8 +1,13 @@
 """User API tests."""
 
+from http import HTTPStatus
+
 import pytest
+from fakeredis import FakeAsyncRedis
 
 from tests.test_api.base import BaseTestCase
+from usecases import AuthUsecase
+from utils.revocation import DELETED_VERSION, VERSIONS_KEY, token_revocation
 
 
 class TestUserMe(BaseTestCase):
@@ -31,6 +36,7 @@ class TestUserMeDelete(BaseTestCase):
     url = "/users/me"
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
     async def test_ok(self) -> None:
         """Successful request deletes the current user."""
         _, headers = await self.create_user_and_get_token()
@@ -38,3 +44,42 @@ class TestUserMeDelete(BaseTestCase):
         response = await self.client.delete(url=self.url, headers=headers)
 
         await self.assert_response_ok(response=response)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_token_rejected_after_delete(self) -> None:
+        """The cached principal of a deleted user no longer authenticates."""
+        _, headers = await self.create_user_and_get_token()
+        await self.client.get(url=self.url, headers=headers)
+
+        await self.client.delete(url=self.url, headers=headers)
+        response = await self.client.get(url=self.url, headers=headers)
+
+        if response.status_code != HTTPStatus.UNAUTHORIZED:
+            pytest.fail(f"Expected status UNAUTHORIZED, got {response.status_code}")
+
+    @pytest.mark.asyncio
+    async def test_revocation_restored(self, fake_redis: FakeAsyncRedis) -> None:
+        """A deleted user's tokens are revoked again after Redis loses them."""
+        user, headers = await self.create_user_and_get_token()
+        await self.client.delete(url=self.url, headers=headers)
+        await fake_redis.delete(VERSIONS_KEY)
+        token_revocation.clear()
+
+        await AuthUsecase().sync_revocations(session=self.session)
+
+        version = await fake_redis.hget(VERSIONS_KEY, str(user["id"]))
+        if version != str(DELETED_VERSION):
+            pytest.fail(f"Expected the deletion to be republished, got {version}")
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable(self) -> None:
+        """Without Redis to invalidate cached principals, nothing is deleted."""
+        _, headers = await self.create_user_and_get_token()
+
+        response = await self.client.delete(url=self.url, headers=headers)
+
+        if response.status_code != HTTPStatus.SERVICE_UNAVAILABLE:
+            pytest.fail(f"Expected status 503, got {response.status_code}")
+        response = await self.client.get(url=self.url, headers=headers)
+        await self.assert_response_ok(response=response)
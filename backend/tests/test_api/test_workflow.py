@@ -5,7 +5,8 @@ from http import HTTPStatus
 
 import pytest
 
-from tests.factories import UserFactory, WorkflowFactory
+from enums import NodeType
+from tests.factories import EdgeFactory, NodeFactory, UserFactory, WorkflowFactory
 from tests.test_api.base import BaseTestCase
 
 
@@ -138,3 +139,98 @@ class TestWorkflowDelete(BaseTestCase):
         )
         if fetch.status_code != HTTPStatus.NOT_FOUND:
             pytest.fail("Expected deleted workflow to return 404")
+
+
+class TestWorkflowGraphGet(BaseTestCase):
+    """Tests for GET /workflows/{workflow_id}/graph."""
+
+    url = "/workflows"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        """The workflow comes back with its nodes and edges."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        source = await NodeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            type=NodeType.INPUT,
+            topological_order=1,
+        )
+        target = await NodeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            type=NodeType.OUTPUT,
+            topological_order=2,
+        )
+        edge = await EdgeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            source_node_id=source.id,
+            target_node_id=target.id,
+        )
+
+        response = await self.client.get(
+            url=f"{self.url}/{workflow.id}/graph", headers=headers
+        )
+
+        data = await self.assert_response_dict(response=response)
+        if data["workflow"]["id"] != workflow.id:
+            pytest.fail("Workflow id did not match")
+        nodes = [(node["id"], node["type"]) for node in data["nodes"]]
+        if nodes != [(source.id, NodeType.INPUT), (target.id, NodeType.OUTPUT)]:
+            pytest.fail("Expected both nodes in topological order")
+        if [item["id"] for item in data["edges"]] != [edge.id]:
+            pytest.fail("Expected the edge between the nodes")
+
+
+class TestWorkflowGraphSave(BaseTestCase):
+    """Tests for PUT /workflows/{workflow_id}/graph."""
+
+    url = "/workflows"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        """Saving a graph inserts, updates and deletes nodes in one request."""
+        user, headers = await self.create_user_and_get_token()
+        workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user["id"]
+        )
+        kept = await NodeFactory.create_async(
+            session=self.session, workflow_id=workflow.id, type=NodeType.INPUT
+        )
+        removed = await NodeFactory.create_async(
+            session=self.session, workflow_id=workflow.id, type=NodeType.OUTPUT
+        )
+        await EdgeFactory.create_async(
+            session=self.session,
+            workflow_id=workflow.id,
+            source_node_id=kept.id,
+            target_node_id=removed.id,
+        )
+
+        response = await self.client.put(
+            url=f"{self.url}/{workflow.id}/graph",
+            json={
+                "nodes": [
+                    {"key": "output", "type": NodeType.OUTPUT, "position_x": 10.0},
+                    {"key": "input", "id": kept.id, "type": NodeType.INPUT},
+                ],
+                "edges": [{"source": "input", "target": "output"}],
+            },
+            headers=headers,
+        )
+
+        data = await self.assert_response_dict(response=response)
+        output, node = data["nodes"]
+        if node["id"] != kept.id or output["id"] == removed.id:
+            pytest.fail("Expected the kept node updated and a new one inserted")
+        if output["position_x"] != 10.0:  # noqa: PLR2004
+            pytest.fail("Expected the new node to keep its position")
+        edges = [
+            (edge["source_node_id"], edge["target_node_id"]) for edge in data["edges"]
+        ]
+        if edges != [(kept.id, output["id"])]:
+            pytest.fail("Expected a single edge to the new node")
@@ -0,0 +1 @@
+"""Execution engine unit tests."""
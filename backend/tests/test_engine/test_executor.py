@@ -0,0 +1,145 @@
+"""Tests for memoization in the execution engine."""
+
+# ruff: noqa: SLF001
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from engine import ExecutionContext, ExecutionEngine, compile_plan
+from engine.memo import memoized_nodes
+from engine.plan import ExecutionPlan
+from enums import NodeType
+from exceptions import NodeExecutionError
+from models import Edge, Execution, Node
+from settings import execution_settings
+
+
+def build_plan(cache: bool) -> ExecutionPlan:  # noqa: FBT001
+    """Compile an INPUT -> LLM -> OUTPUT workflow.
+
+    Args:
+        cache: Whether the LLM node opts in to caching.
+
+    Returns:
+        The execution plan.
+
+    """
+    nodes = [
+        Node(id=1, type=NodeType.INPUT, data={"key": "text"}),
+        Node(id=2, type=NodeType.LLM, data={"model": "llama3", "cache": cache}),
+        Node(id=3, type=NodeType.OUTPUT, data={"key": "summary"}),
+    ]
+    edges = [
+        Edge(id=1, source_node_id=1, target_node_id=2),
+        Edge(id=2, source_node_id=2, target_node_id=3),
+    ]
+    return compile_plan(workflow_id=1, version=0, nodes=nodes, edges=edges)
+
+
+class TestMemoization:
+    """Only opted-in nodes are memoized, and saving never masks run errors."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Stub the engine's database access."""
+        self.engine = ExecutionEngine()
+        self.plan = build_plan(cache=True)
+        self.saved: list[dict[str, Any]] = []
+        context = ExecutionContext(
+            execution_id=1, workflow_id=1, owner_id=1, input_data={"text": "hello"}
+        )
+
+        async def load(**_: object) -> tuple[ExecutionPlan, ExecutionContext]:
+            return self.plan, context
+
+        async def get_outputs(**_: object) -> dict[str, Any]:
+            return {}
+
+        async def save_outputs(outputs: dict[str, Any], **_: object) -> None:
+            self.saved.append(outputs)
+
+        monkeypatch.setattr(self.engine, "_load", load)
+        monkeypatch.setattr(
+            self.engine._node_result_repository, "get_outputs", get_outputs
+        )
+        monkeypatch.setattr(
+            self.engine._node_result_repository, "save_outputs", save_outputs
+        )
+
+    def test_opt_in(self) -> None:
+        """LLM nodes are memoized only when they opt in through `cache`."""
+        if memoized_nodes(plan=build_plan(cache=True)) != [1]:
+            pytest.fail("The opted-in LLM node should be memoized")
+        if memoized_nodes(plan=build_plan(cache=False)):
+            pytest.fail("LLM nodes should not be memoized by default")
+
+    @pytest.mark.asyncio
+    async def test_saves_on_success(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Outputs of memoized nodes that ran are stored."""
+
+        async def execute(outputs: dict[int, Any], **_: object) -> dict[str, Any]:
+            outputs.update({0: "hello", 1: "summary", 2: "summary"})
+            return {"summary": "summary"}
+
+        monkeypatch.setattr(self.engine, "_execute", execute)
+
+        await self.engine._run_plan(session=None, execution=Execution(id=1))
+
+        if [list(outputs.values()) for outputs in self.saved] != [["summary"]]:
+            pytest.fail("Only the memoized node output should be stored")
+
+    @pytest.mark.asyncio
+    async def test_save_failure_keeps_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failing save after a failed run does not replace the run's error."""
+
+        async def execute(**_: object) -> dict[str, Any]:
+            raise NodeExecutionError(message="Node 2: model unavailable")
+
+        async def save_outputs(**_: object) -> None:
+            message = "Session is broken"
+            raise RuntimeError(message)
+
+        monkeypatch.setattr(self.engine, "_execute", execute)
+        monkeypatch.setattr(
+            self.engine._node_result_repository, "save_outputs", save_outputs
+        )
+
+        with pytest.raises(NodeExecutionError):
+            await self.engine._run_plan(session=None, execution=Execution(id=1))
+
+
+class TestLease:
+    """Running executions renew their admission lease until they finish."""
+
+    @pytest.mark.asyncio
+    async def test_renews_while_running(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The lease is renewed during the run and no longer after release."""
+        engine = ExecutionEngine()
+        calls: list[str] = []
+
+        async def run(**_: object) -> None:
+            await asyncio.sleep(0.05)
+
+        async def renew(**_: object) -> None:
+            calls.append("renew")
+
+        async def release(**_: object) -> None:
+            calls.append("release")
+
+        monkeypatch.setattr(execution_settings, "lease_renew_interval", 0.01)
+        monkeypatch.setattr(engine, "_run", run)
+        monkeypatch.setattr(engine._admission, "renew", renew)
+        monkeypatch.setattr(engine, "_release", release)
+
+        await engine.run(execution_id=1, started_at=datetime.now(tz=UTC), user_id=1)
+        await asyncio.sleep(0.03)
+
+        if "renew" not in calls:
+            pytest.fail("The lease should be renewed while the execution runs")
+        if calls[-1] != "release":
+            pytest.fail("The lease should not be renewed after release")
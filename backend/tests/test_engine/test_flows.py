@@ -0,0 +1,237 @@
+"""Tests for batched Prefect flow-run submission."""
+
+# ruff: noqa: SLF001
+
+from collections.abc import Generator
+from datetime import datetime
+from types import SimpleNamespace, TracebackType
+from typing import Any, Self
+from uuid import UUID, uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from prefect import flow
+from prefect.testing.utilities import prefect_test_harness
+
+from engine import ExecutionContext, compile_plan, flows
+from engine.flows import FlowRunSubmitter, prefect_execution_engine
+from engine.plan import ExecutionPlan
+from enums import ExecutionEventType, NodeType
+from models import Edge, Node
+from schemas import ExecutionEvent
+from settings import prefect_settings
+
+USER_ID = 7
+STARTED_AT = datetime(year=2026, month=1, day=1)  # noqa: DTZ001
+BATCH_SIZE = 2
+SUBMISSIONS = 5
+EXECUTION_ID = 1
+
+
+@flow(validate_parameters=False)
+async def run_plan(plan: ExecutionPlan, context: ExecutionContext) -> dict[str, Any]:
+    """Run a plan through the Prefect engine's node tasks."""
+    return await prefect_execution_engine._execute(
+        plan=plan, context=context, outputs={}
+    )
+
+
+class FakeClient:
+    """Prefect client double recording the flow runs it creates."""
+
+    def __init__(self, calls: dict[str, list], fail_for: set[int]) -> None:
+        """Initialize the client.
+
+        Args:
+            calls: The recorded calls, shared across clients.
+            fail_for: The execution IDs whose flow run creation fails.
+
+        """
+        self.calls = calls
+        self.fail_for = fail_for
+        self.deployment_id = uuid4()
+
+    async def __aenter__(self) -> Self:
+        """Open the client."""
+        self.calls["clients"].append(self)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client."""
+
+    async def read_deployment_by_name(self, name: str) -> SimpleNamespace:
+        """Resolve a deployment."""
+        self.calls["deployments"].append(name)
+        return SimpleNamespace(id=self.deployment_id)
+
+    async def create_flow_run_from_deployment(
+        self,
+        deployment_id: UUID,
+        parameters: dict[str, Any],
+        idempotency_key: str,
+    ) -> None:
+        """Create a flow run, failing for the configured executions."""
+        if parameters["execution_id"] in self.fail_for:
+            message = "Prefect is unavailable"
+            raise RuntimeError(message)
+
+        self.calls["runs"].append((deployment_id, parameters, idempotency_key))
+
+
+class FakeEngine:
+    """Engine double recording failed executions."""
+
+    def __init__(self) -> None:
+        """Initialize the engine."""
+        self.failed: list[tuple[int, int]] = []
+
+    async def fail(
+        self,
+        execution_id: int,
+        started_at: datetime,  # noqa: ARG002
+        user_id: int,
+        error: str,  # noqa: ARG002
+    ) -> None:
+        """Record a failed execution."""
+        self.failed.append((execution_id, user_id))
+
+
+class TestFlowRunSubmitter:
+    """Flow runs are created in batches through one client."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the Prefect client and shorten the batch window."""
+        self.calls: dict[str, list] = {"clients": [], "deployments": [], "runs": []}
+        self.fail_for: set[int] = set()
+        self.engine = FakeEngine()
+        self.submitter = FlowRunSubmitter(engine=self.engine)
+        monkeypatch.setattr(
+            flows,
+            "get_client",
+            lambda: FakeClient(calls=self.calls, fail_for=self.fail_for),
+        )
+        monkeypatch.setattr(prefect_settings, "submit_batch_window", 0.05)
+        monkeypatch.setattr(prefect_settings, "submit_batch_size", 100)
+
+    @pytest.mark.asyncio
+    async def test_batches_burst(self) -> None:
+        """A burst of submissions shares one client and deployment lookup."""
+        for execution_id in range(1, 4):
+            self.submitter.submit(
+                execution_id=execution_id, started_at=STARTED_AT, user_id=USER_ID
+            )
+        await self.submitter.close()
+
+        if len(self.calls["clients"]) != 1:
+            pytest.fail("Expected one client for the whole burst")
+        if len(self.calls["deployments"]) != 1:
+            pytest.fail("Expected one deployment lookup for the whole burst")
+        if [run[1] for run in self.calls["runs"]] != [
+            {
+                "execution_id": execution_id,
+                "started_at": STARTED_AT,
+                "user_id": USER_ID,
+            }
+            for execution_id in range(1, 4)
+        ]:
+            pytest.fail("Flow run parameters did not match submissions")
+
+    @pytest.mark.asyncio
+    async def test_idempotency_key(self) -> None:
+        """Each flow run is keyed by its execution, so retries do not duplicate."""
+        self.submitter.submit(execution_id=42, started_at=STARTED_AT, user_id=USER_ID)
+        await self.submitter.close()
+
+        if [run[2] for run in self.calls["runs"]] != ["execution-42"]:
+            pytest.fail("Flow run was not keyed by its execution")
+
+    @pytest.mark.asyncio
+    async def test_splits_batches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Batches are capped, and the deployment is resolved only once."""
+        monkeypatch.setattr(prefect_settings, "submit_batch_size", BATCH_SIZE)
+        for execution_id in range(1, SUBMISSIONS + 1):
+            self.submitter.submit(
+                execution_id=execution_id, started_at=STARTED_AT, user_id=USER_ID
+            )
+        await self.submitter.close()
+
+        if len(self.calls["clients"]) != -(-SUBMISSIONS // BATCH_SIZE):
+            pytest.fail("Expected submissions to be split into capped batches")
+        if len(self.calls["deployments"]) != 1:
+            pytest.fail("Expected the deployment ID to be reused across batches")
+        if len(self.calls["runs"]) != SUBMISSIONS:
+            pytest.fail("Expected a flow run per submission")
+
+    @pytest.mark.asyncio
+    async def test_fails_unsubmitted(self) -> None:
+        """Executions whose flow run cannot be created are marked failed."""
+        self.fail_for.add(2)
+        for execution_id in range(1, 4):
+            self.submitter.submit(
+                execution_id=execution_id, started_at=STARTED_AT, user_id=USER_ID
+            )
+        await self.submitter.close()
+
+        if self.engine.failed != [(2, USER_ID)]:
+            pytest.fail("Only the unsubmitted execution should be failed")
+        if [run[1]["execution_id"] for run in self.calls["runs"]] != [1, 3]:
+            pytest.fail("The other executions should still be submitted")
+
+
+class TestRunNode:
+    """Nodes run as Prefect tasks on event loops of their own."""
+
+    @pytest.fixture(autouse=True, scope="class")
+    def prefect(self) -> Generator[None, None, None]:
+        """Run flows against a temporary Prefect server."""
+        with prefect_test_harness():
+            yield
+
+    @pytest.mark.asyncio
+    async def test_publishes_from_task_loops(self, fake_redis: FakeAsyncRedis) -> None:
+        """Node tasks publish their events through Redis from worker loops."""
+        plan = compile_plan(
+            workflow_id=1,
+            version=0,
+            nodes=[
+                Node(id=1, type=NodeType.INPUT, data={"key": "text"}),
+                Node(id=2, type=NodeType.OUTPUT, data={"key": "text"}),
+            ],
+            edges=[Edge(id=1, source_node_id=1, target_node_id=2)],
+        )
+        context = ExecutionContext(
+            execution_id=EXECUTION_ID,
+            workflow_id=1,
+            owner_id=USER_ID,
+            input_data={"text": "hello"},
+        )
+        pubsub = fake_redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(f"execution:{EXECUTION_ID}:events")
+
+        output = await run_plan(plan=plan, context=context)
+
+        # The subscribe confirmation reads as None, so poll a few times.
+        events = []
+        for _ in range(10):
+            message = await pubsub.get_message(timeout=0.1)
+            if message is not None:
+                events.append(ExecutionEvent.model_validate_json(message["data"]).type)
+        await pubsub.aclose()
+
+        if output != {"text": "hello"}:
+            pytest.fail(f"Unexpected execution output: {output}")
+        if (
+            events
+            != [
+                ExecutionEventType.NODE_STARTED,
+                ExecutionEventType.NODE_COMPLETED,
+            ]
+            * 2
+        ):
+            pytest.fail(f"Unexpected node events: {events}")
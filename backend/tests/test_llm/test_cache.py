@@ -0,0 +1,78 @@
+"""Tests for the two-tier LLM response cache."""
+
+import pytest
+import redis.asyncio as redis
+from fakeredis import FakeAsyncRedis
+
+from llm import LLMResponseCache
+from utils.redis import redis_client
+
+PAYLOAD = {"model": "llama3", "prompt": "Summarize", "options": {"temperature": 0}}
+
+
+class TestLLMResponseCache:
+    """Completions are served from process memory first, then from Redis."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_redis: FakeAsyncRedis) -> None:
+        """Use an empty Redis."""
+        self.redis = fake_redis
+        self.cache = LLMResponseCache()
+        self.key = LLMResponseCache.key(provider_id=1, payload=PAYLOAD)
+
+    def test_key_is_content_addressed(self) -> None:
+        """Keys ignore field order but not the provider or the content."""
+        reordered = dict(reversed(PAYLOAD.items()))
+
+        if LLMResponseCache.key(provider_id=1, payload=reordered) != self.key:
+            pytest.fail("Field order should not change the key")
+        if LLMResponseCache.key(provider_id=2, payload=PAYLOAD) == self.key:
+            pytest.fail("Providers should not share entries")
+        if (
+            LLMResponseCache.key(provider_id=1, payload={**PAYLOAD, "prompt": "Other"})
+            == self.key
+        ):
+            pytest.fail("Different prompts should not share entries")
+
+    @pytest.mark.asyncio
+    async def test_local_hit(self) -> None:
+        """A cached completion is served from process memory."""
+        if await self.cache.get(key=self.key) is not None:
+            pytest.fail("An empty cache should miss")
+
+        await self.cache.set(key=self.key, response="summary")
+        await self.redis.flushall()
+
+        if await self.cache.get(key=self.key) != "summary":
+            pytest.fail("The completion should be served from process memory")
+        if self.cache.stats != {"misses": 1, "local_hits": 1}:
+            pytest.fail(f"Unexpected cache stats: {dict(self.cache.stats)}")
+
+    @pytest.mark.asyncio
+    async def test_redis_hit(self) -> None:
+        """Another worker's completion is read from Redis and kept locally."""
+        await LLMResponseCache().set(key=self.key, response="summary")
+
+        if await self.cache.get(key=self.key) != "summary":
+            pytest.fail("The completion should be served from Redis")
+        await self.redis.flushall()
+        if await self.cache.get(key=self.key) != "summary":
+            pytest.fail("A Redis hit should fill the local tier")
+        if self.cache.stats != {"redis_hits": 1, "local_hits": 1}:
+            pytest.fail(f"Unexpected cache stats: {dict(self.cache.stats)}")
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without Redis the cache degrades to the local tier."""
+
+        async def unavailable(*_: object, **__: object) -> None:
+            raise redis.ConnectionError
+
+        monkeypatch.setattr(redis_client.client, "get", unavailable)
+        monkeypatch.setattr(redis_client.client, "set", unavailable)
+
+        if await self.cache.get(key=self.key) is not None:
+            pytest.fail("A Redis failure should count as a miss")
+        await self.cache.set(key=self.key, response="summary")
+        if await self.cache.get(key=self.key) != "summary":
+            pytest.fail("The completion should still be cached locally")
@@ -0,0 +1,70 @@
+"""Tests for the shared per-loop LLM clients."""
+
+import asyncio
+
+import pytest
+
+from llm import LLMClientRegistry, OllamaClient
+
+BASE_URL = "http://ollama:11434"
+OTHER_URL = "http://ollama-2:11434"
+
+
+class TestLLMClientRegistry:
+    """Clients are shared within an event loop and closed together."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        """Use an empty registry."""
+        self.registry = LLMClientRegistry()
+
+    @pytest.mark.asyncio
+    async def test_reuses_within_loop(self) -> None:
+        """The same provider gets the same client on one loop."""
+        client = self.registry.get(base_url=BASE_URL)
+
+        if self.registry.get(base_url=BASE_URL) is not client:
+            pytest.fail("The client should be reused within the loop")
+        if self.registry.get(base_url=OTHER_URL) is client:
+            pytest.fail("Each provider should get its own client")
+
+        await self.registry.close()
+
+    @pytest.mark.asyncio
+    async def test_separate_per_loop(self) -> None:
+        """Another event loop gets a client of its own."""
+        client = self.registry.get(base_url=BASE_URL)
+
+        def get_on_new_loop() -> OllamaClient:
+            async def get() -> OllamaClient:
+                other = self.registry.get(base_url=BASE_URL)
+                await self.registry.close()
+                return other
+
+            return asyncio.run(get())
+
+        other = await asyncio.to_thread(get_on_new_loop)
+
+        if other is client:
+            pytest.fail("Clients should not be shared across loops")
+        if client.is_closed:
+            pytest.fail("Closing another loop should leave this loop's client")
+
+        await self.registry.close()
+
+    @pytest.mark.asyncio
+    async def test_close(self) -> None:
+        """Closing closes every client of the loop, and new ones replace them."""
+        clients = [
+            self.registry.get(base_url=BASE_URL),
+            self.registry.get(base_url=OTHER_URL),
+        ]
+
+        await self.registry.close()
+
+        if not all(client.is_closed for client in clients):
+            pytest.fail("Every client of the loop should be closed")
+        if self.registry.get(base_url=BASE_URL) in clients:
+            pytest.fail("A closed client should not be handed out again")
+
+        await self.registry.close()
@@ -0,0 +1,118 @@
+"""Tests for coalescing identical in-flight LLM requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from llm import SingleFlight
+from settings import llm_settings
+
+KEY = "request"
+CALLERS = 5
+
+
+def counted(
+    result: str, delay: float, calls: list[str]
+) -> Callable[[], Awaitable[str]]:
+    """Build an upstream call that records itself and takes a while.
+
+    Args:
+        result: The result to return.
+        delay: The seconds the call takes.
+        calls: The list every call appends its result to.
+
+    Returns:
+        The call.
+
+    """
+
+    async def call() -> str:
+        calls.append(result)
+        await asyncio.sleep(delay)
+        return result
+
+    return call
+
+
+class TestSingleFlight:
+    """Identical requests share one upstream call within and across workers."""
+
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, fake_redis: FakeAsyncRedis, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Use short leases on an empty Redis."""
+        self.redis = fake_redis
+        self.calls: list[str] = []
+        monkeypatch.setattr(llm_settings, "singleflight_lease", 0.15)
+        monkeypatch.setattr(llm_settings, "singleflight_poll_interval", 0.01)
+        monkeypatch.setattr(llm_settings, "singleflight_wait", 5.0)
+
+    @pytest.mark.asyncio
+    async def test_coalesces_in_process(self) -> None:
+        """Concurrent callers in one worker await the first call."""
+        flight = SingleFlight()
+        call = counted(result="A", delay=0.05, calls=self.calls)
+
+        results = await asyncio.gather(
+            *(flight.do(key=KEY, call=call) for _ in range(CALLERS))
+        )
+
+        if self.calls != ["A"]:
+            pytest.fail("Expected a single upstream call")
+        if results != ["A"] * CALLERS:
+            pytest.fail("Every caller should get the shared result")
+
+    @pytest.mark.asyncio
+    async def test_follower_wakes_with_result(self) -> None:
+        """A caller in another worker waits for the leader's published result."""
+        leader = asyncio.create_task(
+            SingleFlight().do(
+                key=KEY, call=counted(result="A", delay=0.1, calls=self.calls)
+            )
+        )
+        await asyncio.sleep(0.02)
+
+        result = await SingleFlight().do(
+            key=KEY, call=counted(result="B", delay=0, calls=self.calls)
+        )
+
+        if result != "A" or await leader != "A":
+            pytest.fail("The follower should get the leader's result")
+        if self.calls != ["A"]:
+            pytest.fail("The follower should not call upstream")
+
+    @pytest.mark.asyncio
+    async def test_renews_lease(self) -> None:
+        """The leader keeps its lock while a call outlasts the lease."""
+        leader = asyncio.create_task(
+            SingleFlight().do(
+                key=KEY, call=counted(result="A", delay=0.5, calls=self.calls)
+            )
+        )
+        await asyncio.sleep(llm_settings.singleflight_lease * 2)
+
+        if not await self.redis.exists(f"singleflight:{KEY}:lock"):
+            pytest.fail("The lock should be renewed while the call runs")
+
+        result = await SingleFlight().do(
+            key=KEY, call=counted(result="B", delay=0, calls=self.calls)
+        )
+        if result != "A" or await leader != "A":
+            pytest.fail("A renewed lock should keep followers waiting")
+        if await self.redis.exists(f"singleflight:{KEY}:lock"):
+            pytest.fail("The lock should be released after the call")
+
+    @pytest.mark.asyncio
+    async def test_takes_over_lapsed_lease(self) -> None:
+        """A follower calls upstream once a dead leader's lease lapses."""
+        await self.redis.set(f"singleflight:{KEY}:lock", "dead", px=50)
+
+        result = await SingleFlight().do(
+            key=KEY, call=counted(result="B", delay=0, calls=self.calls)
+        )
+
+        if result != "B" or self.calls != ["B"]:
+            pytest.fail("The follower should take over from the dead leader")
@@ -0,0 +1,326 @@
+"""Query plan regression tests for repository access paths."""
+
+import itertools
+import json
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from engine import ExecutionEngine
+from enums import NodeType
+from repositories import (
+    ApiKeyRepository,
+    EdgeRepository,
+    ExecutionPartitionRepository,
+    ExecutionRepository,
+    LLMProviderRepository,
+    NodeRepository,
+    NodeResultRepository,
+    WorkflowRepository,
+)
+from tests.factories import (
+    EdgeFactory,
+    ExecutionFactory,
+    LLMProviderFactory,
+    NodeFactory,
+    NodeResultFactory,
+    UserFactory,
+    WorkflowFactory,
+)
+from usecases import ExecutionUsecase
+from utils.pagination import Page
+from utils.partitions import month_start, partition_name
+
+USERS = 3
+WORKFLOWS_PER_USER = 3
+NODES_PER_WORKFLOW = 5
+EXECUTIONS_PER_WORKFLOW = 4
+EXPIRED_MONTH = datetime(year=2020, month=1, day=1)  # noqa: DTZ001
+
+type Query = Callable[[AsyncSession, dict[str, Any]], Awaitable[object]]
+
+HOT_QUERIES: dict[str, Query] = {
+    "workflows by owner": lambda session, seed: WorkflowRepository().get_all(
+        session=session, owner_id=seed["user_id"]
+    ),
+    "providers by user": lambda session, seed: LLMProviderRepository().get_all(
+        session=session, user_id=seed["user_id"]
+    ),
+    "nodes by workflow": lambda session, seed: NodeRepository().get_all(
+        session=session, workflow_id=seed["workflow_id"]
+    ),
+    "node ranks in range": lambda session, seed: (
+        NodeRepository().get_topological_orders(
+            session=session, workflow_id=seed["workflow_id"], lower=1, upper=3
+        )
+    ),
+    "edges by workflow": lambda session, seed: EdgeRepository().get_all(
+        session=session, workflow_id=seed["workflow_id"]
+    ),
+    "edges from node": lambda session, seed: EdgeRepository().get_all(
+        session=session, source_node_id=seed["node_ids"][0]
+    ),
+    "edges to node": lambda session, seed: EdgeRepository().get_all(
+        session=session, target_node_id=seed["node_ids"][-1]
+    ),
+    "edges between nodes": lambda session, seed: EdgeRepository().get_pairs_between(
+        session=session, node_ids=seed["node_ids"]
+    ),
+    "executions by workflow": lambda session, seed: ExecutionRepository().get_all(
+        session=session, workflow_id=seed["workflow_id"]
+    ),
+    "executions by payload ref": lambda session, _: (
+        ExecutionRepository().get_referenced(session=session, refs=["0" * 64])
+    ),
+    "node results by hash": lambda session, seed: NodeResultRepository().get_outputs(
+        session=session, workflow_id=seed["workflow_id"], node_hashes=["0" * 64]
+    ),
+    "API key owner by prefix": lambda session, _: ApiKeyRepository().get_owner(
+        session=session, prefix="0" * 12
+    ),
+}
+
+
+@contextmanager
+def capture_statements(engine: AsyncEngine) -> Iterator[list[tuple[str, Any]]]:
+    """Record the SQL statements sent to the database.
+
+    Args:
+        engine: The engine to listen on.
+
+    Yields:
+        The (statement, parameters) pairs, filled as statements run.
+
+    """
+    statements: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(
+        _conn: object,
+        _cursor: object,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        _context: object,
+        _executemany: object,
+    ) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def explain(
+    session: AsyncSession, statements: list[tuple[str, Any]]
+) -> list[tuple[str, dict[str, Any]]]:
+    """Explain captured statements with sequential scans disabled.
+
+    Seeded tables are small enough for the planner to prefer sequential
+    scans on cost alone, so they are disabled: the planner still picks one
+    when no index can serve the query.
+
+    Args:
+        session: The session to explain in, rolled back afterwards.
+        statements: The captured (statement, parameters) pairs.
+
+    Returns:
+        The statements with the root node of their plan.
+
+    """
+    connection = await session.connection()
+    await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        plans.append((statement, plan[0]["Plan"]))
+    await session.rollback()
+
+    return plans
+
+
+def relations(plan: dict[str, Any]) -> set[str]:
+    """Collect the relations a plan reads.
+
+    Args:
+        plan: A plan node of EXPLAIN (FORMAT JSON) output.
+
+    Returns:
+        The names of the relations read.
+
+    """
+    names = {plan["Relation Name"]} if "Relation Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= relations(plan=child)
+
+    return names
+
+
+def seq_scans(plan: dict[str, Any]) -> list[str]:
+    """Collect the relations a plan reads with a sequential scan.
+
+    Args:
+        plan: A plan node of EXPLAIN (FORMAT JSON) output.
+
+    Returns:
+        The names of the sequentially scanned relations.
+
+    """
+    relations = [plan["Relation Name"]] if plan["Node Type"] == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        relations.extend(seq_scans(plan=child))
+
+    return relations
+
+
+class TestQueryPlans:
+    """Hot repository queries must be served by an index."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self, test_engine: AsyncEngine, test_session: AsyncSession) -> None:
+        """Seed several users with workflows, graphs and executions."""
+        self.engine = test_engine
+        self.session = test_session
+
+        for _ in range(USERS):
+            user = await UserFactory.create_async(session=self.session)
+            await LLMProviderFactory.create_async(session=self.session, user_id=user.id)
+            for _ in range(WORKFLOWS_PER_USER):
+                workflow = await WorkflowFactory.create_async(
+                    session=self.session, owner_id=user.id
+                )
+                nodes = [
+                    await NodeFactory.create_async(
+                        session=self.session,
+                        workflow_id=workflow.id,
+                        type=NodeType.LLM,
+                        topological_order=rank,
+                    )
+                    for rank in range(1, NODES_PER_WORKFLOW + 1)
+                ]
+                for source, target in itertools.pairwise(nodes):
+                    await EdgeFactory.create_async(
+                        session=self.session,
+                        workflow_id=workflow.id,
+                        source_node_id=source.id,
+                        target_node_id=target.id,
+                    )
+                for _ in range(EXECUTIONS_PER_WORKFLOW):
+                    await ExecutionFactory.create_async(
+                        session=self.session, workflow_id=workflow.id
+                    )
+                await NodeResultFactory.create_async(
+                    session=self.session,
+                    workflow_id=workflow.id,
+                    node_hash=f"{workflow.id:064x}",
+                    output="cached",
+                )
+
+        self.seed = {
+            "user_id": user.id,
+            "workflow_id": workflow.id,
+            "node_ids": [node.id for node in nodes],
+        }
+        await self.session.execute(statement=text("ANALYZE"))
+        await self.session.commit()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", HOT_QUERIES.values(), ids=HOT_QUERIES.keys())
+    async def test_uses_index(self, query: Query) -> None:
+        """The query plan does not fall back to a sequential scan."""
+        with capture_statements(engine=self.engine) as statements:
+            await query(self.session, self.seed)
+        await self.session.rollback()
+
+        for statement, plan in await explain(
+            session=self.session, statements=statements
+        ):
+            scanned = seq_scans(plan=plan)
+            if scanned:
+                pytest.fail(f"Sequential scan on {scanned} for: {statement}")
+
+
+class TestPartitionPruning:
+    """Execution reads and engine writes skip the partitions they cannot hit."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self, test_engine: AsyncEngine, test_session: AsyncSession) -> None:
+        """Seed executions in an expired and in the current partition."""
+        self.engine = test_engine
+        self.session = test_session
+        self.user = await UserFactory.create_async(session=self.session)
+        self.workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=self.user.id
+        )
+        current = month_start(moment=datetime.now(tz=UTC).replace(tzinfo=None))
+        for month in (EXPIRED_MONTH, current):
+            await ExecutionPartitionRepository().create(
+                session=self.session, month=month
+            )
+        await self.session.commit()
+
+        await ExecutionFactory.create_async(
+            session=self.session, workflow_id=self.workflow.id, started_at=EXPIRED_MONTH
+        )
+        self.execution = await ExecutionFactory.create_async(
+            session=self.session, workflow_id=self.workflow.id
+        )
+        await self.session.execute(statement=text("ANALYZE"))
+        await self.session.commit()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("read", ["get", "list", "run", "stream"])
+    async def test_prunes(self, read: str) -> None:
+        """API reads, engine updates and streams skip the expired partition."""
+        usecase = ExecutionUsecase()
+        execution_engine = ExecutionEngine(
+            session_factory=async_sessionmaker(
+                self.engine, class_=AsyncSession, expire_on_commit=False
+            )
+        )
+        with capture_statements(engine=self.engine) as statements:
+            if read == "run":
+                await execution_engine._run(  # noqa: SLF001
+                    execution_id=self.execution.id,
+                    started_at=self.execution.started_at,
+                )
+            elif read == "stream":
+                events = usecase._stream(  # noqa: SLF001
+                    session=self.session,
+                    execution_id=self.execution.id,
+                    started_at=self.execution.started_at,
+                )
+                async for _ in events:
+                    pass
+            elif read == "get":
+                await usecase.get_execution(
+                    session=self.session,
+                    execution_id=self.execution.id,
+                    user_id=self.user.id,
+                )
+            else:
+                await usecase.get_executions(
+                    session=self.session,
+                    user_id=self.user.id,
+                    workflow_id=self.workflow.id,
+                    page=Page(limit=10),
+                )
+        await self.session.rollback()
+
+        expired = partition_name(month=EXPIRED_MONTH)
+        for statement, plan in await explain(
+            session=self.session, statements=statements
+        ):
+            if expired in relations(plan=plan):
+                pytest.fail(f"Expired partition read by: {statement}")
@@ -0,0 +1,188 @@
+"""Tests for the set-based repository writes."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from enums import NodeType
+from repositories import NodeRepository, NodeResultRepository
+from tests.factories import (
+    NodeFactory,
+    NodeResultFactory,
+    UserFactory,
+    WorkflowFactory,
+)
+
+NODES = 3
+
+
+class TestWrites:
+    """Multi-row writes touch exactly the rows they are given."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self, test_session: AsyncSession) -> None:
+        """Seed a workflow with a few nodes."""
+        self.session = test_session
+        user = await UserFactory.create_async(session=self.session)
+        self.workflow = await WorkflowFactory.create_async(
+            session=self.session, owner_id=user.id
+        )
+        self.nodes = [
+            await NodeFactory.create_async(
+                session=self.session,
+                workflow_id=self.workflow.id,
+                type=NodeType.LLM,
+                topological_order=rank,
+            )
+            for rank in range(1, NODES + 1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_many(self) -> None:
+        """Created rows come back in the order of the input."""
+        keys = ["b", "a", "c"]
+        nodes = await NodeRepository().create_many(
+            session=self.session,
+            data=[
+                {
+                    "workflow_id": self.workflow.id,
+                    "type": NodeType.INPUT,
+                    "data": {"key": key},
+                    "topological_order": NODES + 1,
+                }
+                for key in keys
+            ],
+        )
+
+        if [node.data["key"] for node in nodes] != keys:
+            pytest.fail("Created nodes were not returned in input order")
+
+    @pytest.mark.asyncio
+    async def test_update_all(self) -> None:
+        """Only rows matching the filters are updated and returned."""
+        target = self.nodes[0]
+        updated = await NodeRepository().update_all(
+            session=self.session,
+            data={"position_x": 10.0},
+            id=target.id,
+        )
+
+        if [node.id for node in updated] != [target.id]:
+            pytest.fail("Expected only the filtered node to be updated")
+        nodes = await NodeRepository().get_all(
+            session=self.session, workflow_id=self.workflow.id
+        )
+        moved = {node.id for node in nodes if node.position_x == 10.0}  # noqa: PLR2004
+        if moved != {target.id}:
+            pytest.fail("Other nodes were updated too")
+
+    @pytest.mark.asyncio
+    async def test_update_many(self) -> None:
+        """Each row is updated with its own values in one statement."""
+        repository = NodeRepository()
+        data = [
+            {
+                "id": node.id,
+                "type": node.type,
+                "data": {"rank": NODES - index},
+                "position_x": node.position_x,
+                "position_y": node.position_y,
+                "topological_order": NODES - index,
+            }
+            for index, node in enumerate(self.nodes[:2])
+        ]
+
+        updated = await repository.update_many(session=self.session, data=data)
+        await self.session.commit()
+
+        if {node.id: node.topological_order for node in updated} != {
+            item["id"]: item["topological_order"] for item in data
+        }:
+            pytest.fail("Updated nodes did not carry their own values")
+        untouched = await repository.get_by(session=self.session, id=self.nodes[2].id)
+        if untouched is None or untouched.topological_order != NODES:
+            pytest.fail("A node outside the VALUES list was updated")
+        if await repository.update_many(session=self.session, data=[]):
+            pytest.fail("An empty update should not touch any node")
+
+    @pytest.mark.asyncio
+    async def test_upsert_keeps_existing(self) -> None:
+        """Without update fields, conflicting rows keep their stored values."""
+        repository = NodeResultRepository()
+        row = {"workflow_id": self.workflow.id, "node_hash": "a" * 64}
+        await repository.upsert(
+            session=self.session,
+            data=[{**row, "output": "first"}],
+            index_elements=["workflow_id", "node_hash"],
+        )
+
+        inserted = await repository.upsert(
+            session=self.session,
+            data=[
+                {**row, "output": "second"},
+                {**row, "node_hash": "b" * 64, "output": "new"},
+            ],
+            index_elements=["workflow_id", "node_hash"],
+        )
+
+        if [result.node_hash for result in inserted] != ["b" * 64]:
+            pytest.fail("Only the new row should be returned")
+        outputs = await repository.get_outputs(
+            session=self.session, workflow_id=self.workflow.id, node_hashes=["a" * 64]
+        )
+        if outputs != {"a" * 64: "first"}:
+            pytest.fail("The stored output was overwritten")
+
+    @pytest.mark.asyncio
+    async def test_upsert_updates(self) -> None:
+        """With update fields, conflicting rows are overwritten in place."""
+        repository = NodeResultRepository()
+        row = {"workflow_id": self.workflow.id, "node_hash": "a" * 64}
+        first = await repository.upsert(
+            session=self.session,
+            data=[{**row, "output": "first"}],
+            index_elements=["workflow_id", "node_hash"],
+            update_fields=["output"],
+        )
+
+        second = await repository.upsert(
+            session=self.session,
+            data=[{**row, "output": "second"}],
+            index_elements=["workflow_id", "node_hash"],
+            update_fields=["output"],
+        )
+
+        if [result.id for result in second] != [first[0].id]:
+            pytest.fail("The conflicting row should be updated, not inserted")
+        if second[0].output != "second":
+            pytest.fail("The returned row did not carry the new output")
+
+    @pytest.mark.asyncio
+    async def test_delete_expired(self) -> None:
+        """Only outputs older than the maximum age are deleted, in batches."""
+        now = datetime.now(tz=UTC).replace(tzinfo=None)
+        for index, age in enumerate([timedelta(days=40)] * 3 + [timedelta(0)]):
+            await NodeResultFactory.create_async(
+                session=self.session,
+                workflow_id=self.workflow.id,
+                node_hash=f"{index:064}",
+                output=index,
+                created_at=now - age,
+            )
+        repository = NodeResultRepository()
+
+        deleted = await repository.delete_expired(
+            session=self.session, max_age=timedelta(days=30), batch_size=2
+        )
+
+        if deleted != 3:  # noqa: PLR2004
+            pytest.fail(f"Expected the 3 expired outputs to be deleted, got {deleted}")
+        outputs = await repository.get_outputs(
+            session=self.session,
+            workflow_id=self.workflow.id,
+            node_hashes=[f"{index:064}" for index in range(4)],
+        )
+        if list(outputs.values()) != [3]:
+            pytest.fail("The recent output should be kept")
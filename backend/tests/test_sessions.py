@@ -0,0 +1,64 @@
+"""Tests for the database engine options."""
+
+import pytest
+from sqlalchemy import literal, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from testcontainers.postgres import PostgresContainer
+
+from sessions import engine_options
+from settings import postgres_settings
+
+
+class TestEngineOptions:
+    """The engine is configured for the connection mode."""
+
+    def test_pooled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A direct connection keeps its own pool and prepared statements."""
+        monkeypatch.setattr(postgres_settings, "pgbouncer", False)
+
+        options = engine_options()
+
+        if options.get("pool_size") != postgres_settings.pool_size:
+            pytest.fail("Expected the configured pool size")
+        if "poolclass" in options or "connect_args" in options:
+            pytest.fail("A direct connection should keep the default pool")
+
+    def test_pgbouncer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Behind PgBouncer, nothing is pooled or prepared for reuse."""
+        monkeypatch.setattr(postgres_settings, "pgbouncer", True)
+
+        options = engine_options()
+
+        if options.get("poolclass") is not NullPool:
+            pytest.fail("Expected PgBouncer to do the pooling")
+        connect_args = options["connect_args"]
+        if connect_args["statement_cache_size"] != 0:
+            pytest.fail("Expected the asyncpg statement cache to be off")
+        if connect_args["prepared_statement_cache_size"] != 0:
+            pytest.fail("Expected the SQLAlchemy statement cache to be off")
+        name = connect_args["prepared_statement_name_func"]
+        if name() == name():
+            pytest.fail("Expected a unique name for every prepared statement")
+
+    @pytest.mark.asyncio
+    async def test_pgbouncer_queries(
+        self, postgres_container: PostgresContainer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated parameterized queries run with the PgBouncer options."""
+        monkeypatch.setattr(postgres_settings, "pgbouncer", True)
+        engine = create_async_engine(
+            url=postgres_container.get_connection_url(), **engine_options()
+        )
+
+        try:
+            async with engine.connect() as connection:
+                values = [
+                    await connection.scalar(select(literal(value)))
+                    for value in range(3)
+                ]
+        finally:
+            await engine.dispose()
+
+        if values != list(range(3)):
+            pytest.fail("Queries returned unexpected values")
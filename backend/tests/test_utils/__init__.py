@@ -0,0 +1 @@
+"""Utility unit tests."""
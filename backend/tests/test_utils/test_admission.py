@@ -0,0 +1,157 @@
+"""Tests for per-user execution admission control."""
+
+from datetime import datetime
+
+import pytest
+import redis.asyncio as redis
+from fakeredis import FakeAsyncRedis
+
+from exceptions import ExecutionLimitError
+from settings import execution_settings
+from utils.admission import ExecutionAdmission
+
+USER_ID = 1
+MAX_RUNNING = 2
+QUEUE_SIZE = 2
+STARTED_AT = datetime(year=2026, month=1, day=1)  # noqa: DTZ001
+
+
+def member(execution_id: int) -> str:
+    """Build the lease and queue member of a test execution."""
+    return f"{execution_id}:{STARTED_AT.isoformat()}"
+
+
+class TestExecutionAdmission:
+    """The admission scripts keep the running limit and queue consistent."""
+
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, fake_redis: FakeAsyncRedis, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Use small limits on an empty Redis."""
+        self.redis = fake_redis
+        self.admission = ExecutionAdmission()
+        monkeypatch.setattr(execution_settings, "user_max_running", MAX_RUNNING)
+        monkeypatch.setattr(execution_settings, "user_queue_size", QUEUE_SIZE)
+
+    async def admit_all(self, execution_ids: range) -> list[int]:
+        """Admit executions in order and collect the ones allowed to start."""
+        started: list[int] = []
+        for execution_id in execution_ids:
+            admitted = await self.admission.admit(
+                user_id=USER_ID, execution_id=execution_id, started_at=STARTED_AT
+            )
+            started.extend(item for item, _ in admitted)
+        return started
+
+    @pytest.mark.asyncio
+    async def test_queues_over_limit(self) -> None:
+        """Executions over the running limit wait instead of starting."""
+        started = await self.admit_all(execution_ids=range(1, 5))
+
+        if started != [1, 2]:
+            pytest.fail("Only executions within the running limit should start")
+        if await self.redis.lrange(f"executions:queued:{USER_ID}", 0, -1) != [
+            member(execution_id=3),
+            member(execution_id=4),
+        ]:
+            pytest.fail("Executions over the limit should be queued in order")
+
+    @pytest.mark.asyncio
+    async def test_rejects_full_queue(self) -> None:
+        """An execution is rejected once the queue is full."""
+        await self.admit_all(execution_ids=range(1, 5))
+
+        with pytest.raises(ExecutionLimitError):
+            await self.admission.admit(
+                user_id=USER_ID, execution_id=5, started_at=STARTED_AT
+            )
+
+    @pytest.mark.asyncio
+    async def test_release_promotes_in_order(self) -> None:
+        """A released slot goes to the oldest queued execution."""
+        await self.admit_all(execution_ids=range(1, 5))
+
+        promoted = await self.admission.release(
+            user_id=USER_ID, execution_id=1, started_at=STARTED_AT
+        )
+
+        if promoted != [(3, STARTED_AT)]:
+            pytest.fail("The oldest queued execution should be promoted")
+        running = await self.redis.zrange(f"executions:running:{USER_ID}", 0, -1)
+        if sorted(running) != [member(execution_id=2), member(execution_id=3)]:
+            pytest.fail("The promoted execution should hold the released slot")
+
+    @pytest.mark.asyncio
+    async def test_queue_outlives_leases(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The queue expires on its own TTL, refreshed when slots are released."""
+        monkeypatch.setattr(execution_settings, "lease_ttl", 60)
+        monkeypatch.setattr(execution_settings, "queue_ttl", 3600)
+        await self.admit_all(execution_ids=range(1, 5))
+        queue = f"executions:queued:{USER_ID}"
+
+        if await self.redis.pttl(queue) <= execution_settings.lease_ttl * 1000:
+            pytest.fail("The queue should not expire with the leases")
+
+        await self.redis.pexpire(queue, 1000)
+        await self.admission.release(
+            user_id=USER_ID, execution_id=1, started_at=STARTED_AT
+        )
+        if await self.redis.pttl(queue) <= execution_settings.lease_ttl * 1000:
+            pytest.fail("Releasing a slot should refresh the queue TTL")
+
+    @pytest.mark.asyncio
+    async def test_renew_extends_lease(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Renewing a lease keeps a long execution's slot from expiring."""
+        monkeypatch.setattr(execution_settings, "lease_ttl", 60)
+        await self.admit_all(execution_ids=range(1, 2))
+        running = f"executions:running:{USER_ID}"
+        await self.redis.zadd(running, {member(execution_id=1): 0})
+
+        await self.admission.renew(
+            user_id=USER_ID, execution_id=1, started_at=STARTED_AT
+        )
+
+        if await self.admit_all(execution_ids=range(2, 4)) != [2]:
+            pytest.fail("The renewed lease should still hold its slot")
+
+    @pytest.mark.asyncio
+    async def test_is_queued(self) -> None:
+        """Only executions waiting in the queue are reported as queued."""
+        await self.admit_all(execution_ids=range(1, 4))
+
+        if not await self.admission.is_queued(
+            user_id=USER_ID, execution_id=3, started_at=STARTED_AT
+        ):
+            pytest.fail("The execution over the limit should be queued")
+        if await self.admission.is_queued(
+            user_id=USER_ID, execution_id=1, started_at=STARTED_AT
+        ):
+            pytest.fail("A running execution should not be queued")
+
+    @pytest.mark.asyncio
+    async def test_rate_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Starts beyond the burst are rejected with a retry delay."""
+        monkeypatch.setattr(execution_settings, "user_start_rate", 0.1)
+        monkeypatch.setattr(execution_settings, "user_start_burst", 2)
+        await self.admission.check_rate(user_id=USER_ID)
+        await self.admission.check_rate(user_id=USER_ID)
+
+        with pytest.raises(ExecutionLimitError) as error:
+            await self.admission.check_rate(user_id=USER_ID)
+        if not error.value.headers.get("Retry-After"):
+            pytest.fail("Rate-limited starts should say when to retry")
+
+    @pytest.mark.asyncio
+    async def test_fails_open(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Executions start when Redis is unavailable."""
+
+        async def unavailable(**_: object) -> None:
+            raise redis.ConnectionError
+
+        monkeypatch.setattr(self.admission, "_admit", unavailable)
+
+        if await self.admission.admit(
+            user_id=USER_ID, execution_id=1, started_at=STARTED_AT
+        ) != [(1, STARTED_AT)]:
+            pytest.fail("Admission should fail open without Redis")
@@ -0,0 +1,57 @@
+"""Tests for the password hashing pool."""
+
+# ruff: noqa: SLF001
+
+import asyncio
+import threading
+
+import pytest
+
+from exceptions import AuthBusyError
+from settings import auth_settings
+from utils.crypto import PasswordHasher
+
+
+class TestPasswordHasher:
+    """The queue counts operations until bcrypt is done with them."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Create a pool with room for a single operation."""
+        monkeypatch.setattr(auth_settings, "hash_workers", 1)
+        monkeypatch.setattr(auth_settings, "hash_queue_size", 0)
+        self.hasher = PasswordHasher()
+        self.started = threading.Event()
+        self.finish = threading.Event()
+
+    def block(self) -> None:
+        """Stand in for a slow bcrypt call."""
+        self.started.set()
+        self.finish.wait(timeout=10)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller(self) -> None:
+        """A cancelled caller keeps its slot until the thread finishes."""
+        task = asyncio.create_task(self.hasher._run(self.block))
+        await asyncio.to_thread(self.started.wait, 10)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with pytest.raises(AuthBusyError):
+            await self.hasher._run(self.block)
+
+        self.finish.set()
+        await asyncio.to_thread(self.hasher._executor.shutdown, wait=True)
+        if self.hasher._pending != 0:
+            pytest.fail("Expected the slot to be released once bcrypt finished")
+
+    @pytest.mark.asyncio
+    async def test_verify(self) -> None:
+        """Operations still run through the pool."""
+        hashed = await self.hasher.hash(password="secret")  # noqa: S106
+
+        if not await self.hasher.verify(password="secret", hashed=hashed):  # noqa: S106
+            pytest.fail("Expected the password to match its hash")
+        if self.hasher._pending != 0:
+            pytest.fail("Expected every slot to be released")
@@ -0,0 +1,122 @@
+"""Tests for the execution payload store."""
+
+import os
+import time
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from exceptions import PayloadUnavailableError
+from settings import payload_settings
+from utils.payloads import PayloadStore
+
+PAYLOAD = {"text": "x" * 1024}
+
+
+async def held(kept: set[str], refs: list[str]) -> set[str]:
+    """Look up blob references as if executions held only some of them.
+
+    Args:
+        kept: The references held by executions.
+        refs: The references to look up.
+
+    Returns:
+        The references among them that are held.
+
+    """
+    return kept.intersection(refs)
+
+
+class TestPayloadStore:
+    """Blobs are read back safely and swept once unreferenced."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Store blobs in a temporary directory."""
+        monkeypatch.setattr(payload_settings, "dir", str(tmp_path))
+        monkeypatch.setattr(payload_settings, "inline_limit", 64)
+        self.store = PayloadStore()
+
+    async def put(self, payload: dict, age: float = 0) -> tuple[str, Path]:
+        """Store a payload as a blob and backdate it.
+
+        Args:
+            payload: The payload.
+            age: The seconds to backdate the blob by.
+
+        Returns:
+            The blob reference and path.
+
+        """
+        _, ref = await self.store.put(payload=payload)
+        if ref is None:
+            pytest.fail("Expected the payload to be stored as a blob")
+        path = Path(payload_settings.dir) / ref[:2] / f"{ref}.json.z"
+        moment = time.time() - age
+        os.utime(path, times=(moment, moment))
+
+        return ref, path
+
+    @pytest.mark.asyncio
+    async def test_corrupt(self) -> None:
+        """A corrupt blob raises the domain error."""
+        ref, path = await self.put(payload=PAYLOAD)
+        path.write_bytes(b"not zlib")
+
+        with pytest.raises(PayloadUnavailableError):
+            await self.store.get(ref=ref)
+
+    @pytest.mark.asyncio
+    async def test_missing(self) -> None:
+        """A missing blob raises the domain error."""
+        ref, path = await self.put(payload=PAYLOAD)
+        path.unlink()
+
+        with pytest.raises(PayloadUnavailableError):
+            await self.store.get(ref=ref)
+
+    @pytest.mark.asyncio
+    async def test_sweep(self) -> None:
+        """Only old blobs no execution references are deleted."""
+        grace = payload_settings.orphan_grace
+        kept, kept_path = await self.put(payload=PAYLOAD, age=grace * 2)
+        _, orphan_path = await self.put(payload={"text": "y" * 1024}, age=grace * 2)
+        _, fresh_path = await self.put(payload={"text": "z" * 1024})
+
+        deleted = await self.store.sweep(referenced=partial(held, {kept}))
+
+        if deleted != 1 or orphan_path.exists():
+            pytest.fail("Expected only the old orphan to be deleted")
+        if not kept_path.exists() or not fresh_path.exists():
+            pytest.fail("Referenced or recent blobs were deleted")
+
+    @pytest.mark.asyncio
+    async def test_sweep_batches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Candidate blobs are looked up a batch at a time."""
+        monkeypatch.setattr(payload_settings, "sweep_batch_size", 2)
+        age = payload_settings.orphan_grace * 2
+        refs = [
+            (await self.put(payload={"text": char * 1024}, age=age))[0]
+            for char in "abcde"
+        ]
+        batches: list[list[str]] = []
+
+        async def lookup(refs: list[str]) -> set[str]:
+            batches.append(refs)
+            return set()
+
+        deleted = await self.store.sweep(referenced=lookup)
+
+        if deleted != len(refs) or [len(batch) for batch in batches] != [2, 2, 1]:
+            pytest.fail(f"Expected batches of two, got {batches}")
+
+    @pytest.mark.asyncio
+    async def test_put_refreshes(self) -> None:
+        """Storing a payload again protects its blob from the sweep."""
+        _, path = await self.put(payload=PAYLOAD, age=payload_settings.orphan_grace * 2)
+
+        await self.store.put(payload=PAYLOAD)
+
+        if await self.store.sweep(referenced=partial(held, set())) or not path.exists():
+            pytest.fail("A blob stored again was swept")
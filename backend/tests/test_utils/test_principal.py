@@ -0,0 +1,82 @@
+"""Tests for the principal cache."""
+
+import time
+
+import pytest
+
+from exceptions import AuthUnavailableError
+from schemas import UserResponse
+from utils.principal import PrincipalCache
+
+TOKEN = "token"  # noqa: S105
+USER = UserResponse.model_validate(
+    {
+        "id": 1,
+        "email": "user@example.com",
+        "created_at": "2026-01-01T00:00:00",
+        "updated_at": "2026-01-01T00:00:00",
+    }
+)
+
+
+class TestPrincipalCache:
+    """Invalidation wins over lookups that race it."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        """Create an empty cache."""
+        self.cache = PrincipalCache()
+        self.expires_at = time.time() + 60
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_cached(self) -> None:
+        """A lookup with no invalidation in between is cached."""
+        generation = await self.cache.generation()
+        await self.cache.set(
+            token=TOKEN, expires_at=self.expires_at, user=USER, generation=generation
+        )
+
+        if await PrincipalCache().get(token=TOKEN) != USER:
+            pytest.fail("Expected the principal to be cached in Redis")
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_invalidated(self) -> None:
+        """Invalidation drops cached principals in both tiers."""
+        generation = await self.cache.generation()
+        await self.cache.set(
+            token=TOKEN, expires_at=self.expires_at, user=USER, generation=generation
+        )
+
+        await self.cache.invalidate(user_id=USER.id)
+
+        if await self.cache.get(token=TOKEN) is not None:
+            pytest.fail("Expected the principal to be dropped")
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_racing_lookup(self) -> None:
+        """A lookup that read the database before an invalidation is not cached."""
+        generation = await self.cache.generation()
+        await self.cache.invalidate(user_id=USER.id)
+
+        await self.cache.set(
+            token=TOKEN, expires_at=self.expires_at, user=USER, generation=generation
+        )
+
+        if await self.cache.get(token=TOKEN) is not None:
+            pytest.fail("A principal read before the invalidation was cached")
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable(self) -> None:
+        """Invalidation fails loudly and nothing is cached without Redis."""
+        generation = await self.cache.generation()
+        await self.cache.set(
+            token=TOKEN, expires_at=self.expires_at, user=USER, generation=generation
+        )
+
+        if await self.cache.get(token=TOKEN) is not None:
+            pytest.fail("Expected nothing to be cached without Redis")
+        with pytest.raises(AuthUnavailableError):
+            await self.cache.invalidate(user_id=USER.id)
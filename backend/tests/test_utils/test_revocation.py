@@ -0,0 +1,35 @@
+"""Tests for token revocation."""
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from exceptions import AuthUnavailableError
+from utils.revocation import DELETED_VERSION, VERSIONS_KEY, TokenRevocation
+
+USER_ID = 7
+
+
+class TestTokenRevocation:
+    """Revocations reach Redis or fail loudly."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        """Create a revocation tracker with an empty local copy."""
+        self.revocation = TokenRevocation()
+
+    @pytest.mark.asyncio
+    async def test_revoke(self, fake_redis: FakeAsyncRedis) -> None:
+        """A revocation is published and only ever raises the version."""
+        await self.revocation.revoke(user_id=USER_ID, version=DELETED_VERSION)
+        await self.revocation.revoke(user_id=USER_ID, version=1)
+
+        if await fake_redis.hget(VERSIONS_KEY, str(USER_ID)) != str(DELETED_VERSION):
+            pytest.fail("Expected the highest version to be published")
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable(self) -> None:
+        """Revoking fails closed, while syncing stored versions does not."""
+        with pytest.raises(AuthUnavailableError):
+            await self.revocation.revoke(user_id=USER_ID, version=DELETED_VERSION)
+
+        await self.revocation.publish(versions={USER_ID: 1})
@@ -1,8 +1,10 @@
 """Usecase package for business logic."""
 
+from usecases.api_key import ApiKeyUsecase
 from usecases.auth import AuthUsecase
 from usecases.edge import EdgeUsecase
 from usecases.execution import ExecutionUsecase
+from usecases.execution_archive import ExecutionArchiveUsecase
 from usecases.health import HealthUsecase
 from usecases.llm_provider import LLMProviderUsecase
 from usecases.node import NodeUsecase
@@ -10,8 +12,10 @@ from usecases.user import UserUsecase
 from usecases.workflow import WorkflowUsecase
 
 __all__ = [
+    "ApiKeyUsecase",
     "AuthUsecase",
     "EdgeUsecase",
+    "ExecutionArchiveUsecase",
     "ExecutionUsecase",
     "HealthUsecase",
     "LLMProviderUsecase",
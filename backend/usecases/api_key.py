@@ -0,0 +1,97 @@
+"""API key use case implementation."""
+
+import secrets
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from exceptions import ApiKeyNotFoundError
+from models import ApiKey
+from repositories import ApiKeyRepository
+from settings import auth_settings
+from utils.crypto import api_key_digest
+from utils.pagination import Page
+from utils.principal import principal_cache
+
+
+class ApiKeyUsecase:
+    """API key business logic."""
+
+    def __init__(self) -> None:
+        """Initialize the usecase."""
+        self._api_key_repository = ApiKeyRepository()
+        self._principal_cache = principal_cache
+
+    async def create_api_key(
+        self, session: AsyncSession, user_id: int, name: str
+    ) -> tuple[ApiKey, str]:
+        """Create an API key.
+
+        Keys look like `<api_key_prefix>_<prefix>_<secret>`. The prefix is
+        stored in clear to find the key, the whole key only as a digest.
+
+        Args:
+            session: The session.
+            user_id: The owner user ID.
+            name: The key name.
+
+        Returns:
+            The created API key and the key itself, which cannot be
+            recovered later.
+
+        """
+        prefix = secrets.token_hex(6)
+        key = f"{auth_settings.api_key_prefix}_{prefix}_{secrets.token_urlsafe(32)}"
+
+        api_key = await self._api_key_repository.create(
+            session=session,
+            data={
+                "user_id": user_id,
+                "name": name,
+                "prefix": prefix,
+                "digest": api_key_digest(key=key),
+            },
+        )
+
+        return api_key, key
+
+    async def get_api_keys(
+        self, session: AsyncSession, user_id: int, page: Page
+    ) -> tuple[list[ApiKey], str | None]:
+        """List API keys for a user.
+
+        Args:
+            session: The session.
+            user_id: The owner user ID.
+            page: The requested page.
+
+        Returns:
+            The page of API keys and the cursor of the next page, if any.
+
+        """
+        return await self._api_key_repository.get_page(
+            session=session, page=page, user_id=user_id
+        )
+
+    async def delete_api_key(
+        self, session: AsyncSession, api_key_id: int, user_id: int
+    ) -> None:
+        """Revoke an API key by ID.
+
+        Args:
+            session: The session.
+            api_key_id: The API key ID.
+            user_id: The owner user ID.
+
+        Raises:
+            ApiKeyNotFoundError: If the API key is not found.
+            AuthUnavailableError: If cached principals cannot be invalidated.
+
+        """
+        await self._principal_cache.invalidate(user_id=user_id)
+        deleted = await self._api_key_repository.delete_by(
+            session=session, id=api_key_id, user_id=user_id
+        )
+        if not deleted:
+            raise ApiKeyNotFoundError
+
+        await self._principal_cache.invalidate(user_id=user_id)
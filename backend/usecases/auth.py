@@ -1,5 +1,7 @@
 """Auth use case implementation."""
 
+import secrets
+import time
 from datetime import UTC, datetime, timedelta
 
 from jose import JWTError, jwt
@@ -11,9 +13,12 @@ from exceptions import (
     UserNotFoundError,
 )
 from models import User
-from repositories import UserRepository
+from repositories import ApiKeyRepository, UserRepository
+from schemas import UserResponse
 from settings import auth_settings
-from utils.crypto import hash_password, verify_password
+from utils.crypto import password_hasher, verify_api_key
+from utils.principal import principal_cache
+from utils.revocation import DELETED_VERSION, token_revocation
 
 
 class AuthUsecase:
@@ -22,6 +27,10 @@ class AuthUsecase:
     def __init__(self) -> None:
         """Initialize the usecase."""
         self._user_repository = UserRepository()
+        self._api_key_repository = ApiKeyRepository()
+        self._principal_cache = principal_cache
+        self._password_hasher = password_hasher
+        self._token_revocation = token_revocation
 
     @staticmethod
     def _create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -44,7 +53,7 @@ class AuthUsecase:
                 minutes=auth_settings.access_token_expire_minutes
             )
 
-        to_encode.update({"exp": expire})
+        to_encode.update({"exp": expire, "jti": secrets.token_hex(16)})
 
         return jwt.encode(
             claims=to_encode,
@@ -89,6 +98,7 @@ class AuthUsecase:
 
         Raises:
             AuthCredentialsError: If the user is not authenticated.
+            AuthBusyError: If too many password checks are queued.
 
         """
         user = await self._user_repository.get_by(session=session, email=email)
@@ -96,7 +106,9 @@ class AuthUsecase:
         if (
             not user
             or not user.hashed_password
-            or not verify_password(password=password, hashed=user.hashed_password)
+            or not await self._password_hasher.verify(
+                password=password, hashed=user.hashed_password
+            )
         ):
             raise AuthCredentialsError
 
@@ -127,7 +139,7 @@ class AuthUsecase:
         session: AsyncSession,
         token: str,
     ) -> User:
-        """Get the current user and check permissions.
+        """Get the current user of a token from the database.
 
         Args:
             session: The session.
@@ -137,7 +149,7 @@ class AuthUsecase:
             The user.
 
         Raises:
-            AuthCredentialsError: If the token is invalid.
+            AuthCredentialsError: If the token is invalid or revoked.
 
         """
         payload = self.get_payload(token=token)
@@ -148,11 +160,141 @@ class AuthUsecase:
 
         user = await self._user_repository.get_by(session=session, email=email)
 
-        if not user:
+        if not user or payload.get("ver", 0) < user.token_version:
             raise AuthCredentialsError
 
         return user
 
+    async def get_principal(
+        self, session: AsyncSession, token: str, payload: dict | None = None
+    ) -> UserResponse:
+        """Get the current user without querying the database when possible.
+
+        Tokens carrying a principal and a token version are checked against
+        the synced revocations alone. API keys and tokens issued before that
+        format go through the principal cache and, on a miss, the database.
+
+        Args:
+            session: The session.
+            token: The token or API key.
+            payload: The payload of the token, if it was already verified.
+
+        Returns:
+            The user.
+
+        Raises:
+            AuthCredentialsError: If the token is invalid or revoked.
+
+        """
+        if token.startswith(f"{auth_settings.api_key_prefix}_"):
+            return await self._get_api_key_principal(session=session, key=token)
+
+        if payload is None:
+            payload = self.get_payload(token=token)
+        if "principal" in payload and "ver" in payload:
+            principal = UserResponse.model_validate(payload["principal"])
+            if await self._token_revocation.is_revoked(
+                user_id=principal.id, version=payload["ver"]
+            ):
+                raise AuthCredentialsError
+
+            return principal
+
+        principal = await self._principal_cache.get(token=token)
+        if principal is not None:
+            return principal
+
+        generation = await self._principal_cache.generation()
+        principal = UserResponse.model_validate(
+            await self.get_current_user(session=session, token=token)
+        )
+        await self._principal_cache.set(
+            token=token,
+            expires_at=payload["exp"],
+            user=principal,
+            generation=generation,
+        )
+
+        return principal
+
+    async def _get_api_key_principal(
+        self, session: AsyncSession, key: str
+    ) -> UserResponse:
+        """Get the owner of an API key, from the principal cache when possible.
+
+        Args:
+            session: The session.
+            key: The API key.
+
+        Returns:
+            The user.
+
+        Raises:
+            AuthCredentialsError: If the key is malformed, unknown or revoked.
+
+        """
+        principal = await self._principal_cache.get(token=key)
+        if principal is not None:
+            return principal
+
+        try:
+            _, prefix, _ = key.split("_", maxsplit=2)
+        except ValueError as e:
+            raise AuthCredentialsError from e
+
+        generation = await self._principal_cache.generation()
+        owner = await self._api_key_repository.get_owner(session=session, prefix=prefix)
+        if owner is None or not verify_api_key(key=key, digest=owner[0]):
+            raise AuthCredentialsError
+
+        principal = UserResponse.model_validate(owner[1])
+        await self._principal_cache.set(
+            token=key,
+            expires_at=time.time() + auth_settings.principal_cache_ttl,
+            user=principal,
+            generation=generation,
+        )
+
+        return principal
+
+    async def logout_all(self, session: AsyncSession, user_id: int) -> None:
+        """Revoke every access token of a user.
+
+        Args:
+            session: The session.
+            user_id: The user ID.
+
+        Raises:
+            UserNotFoundError: If the user is not found.
+            AuthUnavailableError: If the tokens cannot be revoked.
+
+        """
+        await self._principal_cache.invalidate(user_id=user_id)
+        version = await self._user_repository.bump_token_version(
+            session=session, user_id=user_id
+        )
+        if version is None:
+            raise UserNotFoundError
+
+        await self._token_revocation.revoke(user_id=user_id, version=version)
+        await self._principal_cache.invalidate(user_id=user_id)
+
+    async def sync_revocations(self, session: AsyncSession) -> None:
+        """Publish the token versions stored in the database.
+
+        Restores revocations that Redis lost, for example after a restart
+        without persistence, including those of deleted users.
+
+        Args:
+            session: The session.
+
+        """
+        versions = await self._user_repository.get_token_versions(session=session)
+        for user_id in await self._user_repository.get_deleted_ids(session=session):
+            versions[user_id] = DELETED_VERSION
+
+        await self._token_revocation.publish(versions=versions)
+
     async def login(self, session: AsyncSession, email: str, password: str) -> str:
         """Login a user.
 
@@ -166,6 +308,7 @@ class AuthUsecase:
 
         Raises:
             AuthCredentialsError: If the user is not authenticated.
+            AuthBusyError: If too many password checks are queued.
 
         """
         user = await self._authenticate(
@@ -178,7 +321,11 @@ class AuthUsecase:
             raise AuthCredentialsError
 
         return self._create_access_token(
-            data={"sub": user.email},
+            data={
+                "sub": user.email,
+                "ver": user.token_version,
+                "principal": UserResponse.model_validate(user).model_dump(mode="json"),
+            },
             expires_delta=timedelta(minutes=auth_settings.access_token_expire_minutes),
         )
 
@@ -200,6 +347,7 @@ class AuthUsecase:
 
         Raises:
             UserAlreadyExistsError: If the user already exists.
+            AuthBusyError: If too many password hashes are queued.
 
         """
         if await self._user_repository.get_by(session=session, email=email):
@@ -207,5 +355,8 @@ class AuthUsecase:
 
         return await self._user_repository.create(
             session=session,
-            data={"email": email, "hashed_password": hash_password(password=password)},
+            data={
+                "email": email,
+                "hashed_password": await self._password_hasher.hash(password=password),
+            },
         )
@@ -8,8 +8,10 @@ from exceptions import (
     NodeNotFoundError,
     WorkflowNotFoundError,
 )
-from models import Edge
+from models import Edge, Node
 from repositories import EdgeRepository, NodeRepository, WorkflowRepository
+from utils.pagination import Page
+from utils.topology import reorder_for_edge
 
 
 class EdgeUsecase:
@@ -21,6 +23,93 @@ class EdgeUsecase:
         self._node_repository = NodeRepository()
         self._workflow_repository = WorkflowRepository()
 
+    async def _ensure_acyclic(
+        self,
+        session: AsyncSession,
+        source_node: Node,
+        target_node: Node,
+        exclude_edge_id: int | None = None,
+    ) -> None:
+        """Check that an edge keeps the graph acyclic and re-rank nodes.
+
+        Only nodes ranked between the two endpoints are read, so the cost is
+        proportional to the affected region rather than the whole workflow.
+        New ranks are written without committing and land with the edge.
+
+        Args:
+            session: The session.
+            source_node: The edge source node.
+            target_node: The edge target node.
+            exclude_edge_id: The edge being replaced, if any.
+
+        Raises:
+            WorkflowCycleError: If the edge would close a cycle.
+
+        """
+        lower = target_node.topological_order
+        upper = source_node.topological_order
+        if source_node.id != target_node.id and upper < lower:
+            return
+
+        orders = await self._node_repository.get_topological_orders(
+            session=session,
+            workflow_id=source_node.workflow_id,
+            lower=lower,
+            upper=upper,
+        )
+        orders[source_node.id] = upper
+        orders[target_node.id] = lower
+
+        changes = reorder_for_edge(
+            source_id=source_node.id,
+            target_id=target_node.id,
+            orders=orders,
+            edges=await self._edge_repository.get_pairs_between(
+                session=session, node_ids=list(orders), exclude_id=exclude_edge_id
+            ),
+        )
+        if changes:
+            await self._node_repository.set_topological_orders(
+                session=session, orders=changes
+            )
+
+    async def _get_endpoints(
+        self,
+        session: AsyncSession,
+        workflow_id: int,
+        source_node_id: int,
+        target_node_id: int,
+    ) -> tuple[Node, Node]:
+        """Fetch both endpoints of an edge in one query and check them.
+
+        Args:
+            session: The session.
+            workflow_id: The workflow ID.
+            source_node_id: The source node ID.
+            target_node_id: The target node ID.
+
+        Returns:
+            The source and target nodes.
+
+        Raises:
+            NodeNotFoundError: If the source or target node is not found.
+            EdgeNodeMismatchError: If the nodes do not belong to the workflow.
+
+        """
+        nodes = await self._node_repository.get_by_ids(
+            session=session, ids=[source_node_id, target_node_id]
+        )
+        if source_node_id not in nodes or target_node_id not in nodes:
+            raise NodeNotFoundError
+
+        source_node, target_node = nodes[source_node_id], nodes[target_node_id]
+        if source_node.workflow_id != workflow_id:
+            raise EdgeNodeMismatchError
+        if target_node.workflow_id != workflow_id:
+            raise EdgeNodeMismatchError
+
+        return source_node, target_node
+
     async def create_edge(
         self,
         session: AsyncSession,
@@ -45,30 +134,29 @@ class EdgeUsecase:
             WorkflowNotFoundError: If the workflow is not found.
             NodeNotFoundError: If the source or target node is not found.
             EdgeNodeMismatchError: If the nodes do not belong to the workflow.
+            WorkflowCycleError: If the edge would close a cycle.
 
         """
-        workflow = await self._workflow_repository.get_by(
+        workflow = await self._workflow_repository.get_for_update(
             session=session, id=workflow_id, owner_id=user_id
         )
         if not workflow:
             raise WorkflowNotFoundError
 
-        source_node = await self._node_repository.get_by(
-            session=session, id=source_node_id
+        source_node, target_node = await self._get_endpoints(
+            session=session,
+            workflow_id=workflow_id,
+            source_node_id=source_node_id,
+            target_node_id=target_node_id,
         )
-        if not source_node:
-            raise NodeNotFoundError
 
-        target_node = await self._node_repository.get_by(
-            session=session, id=target_node_id
+        await self._ensure_acyclic(
+            session=session, source_node=source_node, target_node=target_node
         )
-        if not target_node:
-            raise NodeNotFoundError
 
-        if source_node.workflow_id != workflow_id:
-            raise EdgeNodeMismatchError
-        if target_node.workflow_id != workflow_id:
-            raise EdgeNodeMismatchError
+        await self._workflow_repository.bump_version(
+            session=session, workflow_id=workflow_id
+        )
 
         return await self._edge_repository.create(
             session=session,
@@ -80,17 +168,18 @@ class EdgeUsecase:
         )
 
     async def get_edges(
-        self, session: AsyncSession, user_id: int, workflow_id: int
-    ) -> list[Edge]:
+        self, session: AsyncSession, user_id: int, workflow_id: int, page: Page
+    ) -> tuple[list[Edge], str | None]:
         """List edges for a workflow.
 
         Args:
             session: The session.
             user_id: The owner user ID.
             workflow_id: The workflow ID.
+            page: The requested page.
 
         Returns:
-            The list of edges.
+            The page of edges and the cursor of the next page, if any.
 
         Raises:
             WorkflowNotFoundError: If the workflow is not found.
@@ -102,8 +191,8 @@ class EdgeUsecase:
         if not workflow:
             raise WorkflowNotFoundError
 
-        return await self._edge_repository.get_all(
-            session=session, workflow_id=workflow_id
+        return await self._edge_repository.get_page(
+            session=session, page=page, workflow_id=workflow_id
         )
 
     async def get_edge(self, session: AsyncSession, edge_id: int, user_id: int) -> Edge:
@@ -119,19 +208,14 @@ class EdgeUsecase:
 
         Raises:
             EdgeNotFoundError: If the edge is not found.
-            WorkflowNotFoundError: If the workflow is not found.
 
         """
-        edge = await self._edge_repository.get_by(session=session, id=edge_id)
+        edge = await self._edge_repository.get_owned(
+            session=session, owner_id=user_id, id=edge_id
+        )
         if not edge:
             raise EdgeNotFoundError
 
-        workflow = await self._workflow_repository.get_by(
-            session=session, id=edge.workflow_id, owner_id=user_id
-        )
-        if not workflow:
-            raise WorkflowNotFoundError
-
         return edge
 
     async def update_edge(
@@ -150,7 +234,7 @@ class EdgeUsecase:
 
         Raises:
             EdgeNotFoundError: If the edge is not found.
-            WorkflowNotFoundError: If the workflow is not found.
+            WorkflowCycleError: If the edge would close a cycle.
 
         """
         edge = await self.get_edge(session=session, edge_id=edge_id, user_id=user_id)
@@ -159,25 +243,30 @@ class EdgeUsecase:
         if not update_data:
             return edge
 
+        await self._workflow_repository.get_for_update(
+            session=session, id=edge.workflow_id
+        )
+
         source_node_id = update_data.get("source_node_id", edge.source_node_id)
         target_node_id = update_data.get("target_node_id", edge.target_node_id)
 
-        source_node = await self._node_repository.get_by(
-            session=session, id=source_node_id
+        source_node, target_node = await self._get_endpoints(
+            session=session,
+            workflow_id=edge.workflow_id,
+            source_node_id=source_node_id,
+            target_node_id=target_node_id,
         )
-        if not source_node:
-            raise NodeNotFoundError
 
-        target_node = await self._node_repository.get_by(
-            session=session, id=target_node_id
+        await self._ensure_acyclic(
+            session=session,
+            source_node=source_node,
+            target_node=target_node,
+            exclude_edge_id=edge_id,
         )
-        if not target_node:
-            raise NodeNotFoundError
 
-        if source_node.workflow_id != edge.workflow_id:
-            raise EdgeNodeMismatchError
-        if target_node.workflow_id != edge.workflow_id:
-            raise EdgeNodeMismatchError
+        await self._workflow_repository.bump_version(
+            session=session, workflow_id=edge.workflow_id
+        )
 
         edge = await self._edge_repository.update_by(
             session=session,
@@ -201,10 +290,13 @@ class EdgeUsecase:
 
         Raises:
             EdgeNotFoundError: If the edge is not found.
-            WorkflowNotFoundError: If the workflow is not found.
 
         """
-        await self.get_edge(session=session, edge_id=edge_id, user_id=user_id)
+        edge = await self.get_edge(session=session, edge_id=edge_id, user_id=user_id)
+
+        await self._workflow_repository.bump_version(
+            session=session, workflow_id=edge.workflow_id
+        )
 
         deleted = await self._edge_repository.delete_by(session=session, id=edge_id)
         if not deleted:
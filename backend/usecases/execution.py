@@ -1,10 +1,38 @@
 """Execution use case implementation."""
 
+import asyncio
+import logging
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from exceptions import ExecutionNotFoundError, WorkflowNotFoundError
+from engine import execution_engine, execution_events, flow_run_submitter
+from enums import ExecutionEventType, ExecutionMode, ExecutionStatus
+from exceptions import (
+    ExecutionLimitError,
+    ExecutionNotFoundError,
+    PayloadUnavailableError,
+    WorkflowNotFoundError,
+)
 from models import Execution
-from repositories import ExecutionRepository, WorkflowRepository
+from repositories import (
+    ExecutionArchiveRepository,
+    ExecutionRepository,
+    NodeResultRepository,
+    WorkflowRepository,
+)
+from schemas import ExecutionEvent, ExecutionResponse
+from settings import execution_settings
+from utils.admission import execution_admission
+from utils.pagination import Page
+from utils.partitions import retained_since
+from utils.payloads import payload_store
+
+logger = logging.getLogger(__name__)
+
+QUEUE_EXPIRED_ERROR = "Execution expired in the admission queue"
 
 
 class ExecutionUsecase:
@@ -13,7 +41,30 @@ class ExecutionUsecase:
     def __init__(self) -> None:
         """Initialize the usecase."""
         self._execution_repository = ExecutionRepository()
+        self._execution_archive_repository = ExecutionArchiveRepository()
+        self._node_result_repository = NodeResultRepository()
         self._workflow_repository = WorkflowRepository()
+        self._execution_engine = execution_engine
+        self._flow_run_submitter = flow_run_submitter
+        self._admission = execution_admission
+        self._events = execution_events
+        self._payload_store = payload_store
+
+    @staticmethod
+    def _retained_since() -> datetime:
+        """Get the lower bound of start times still kept in Postgres.
+
+        Reads bound the start time with it, so the planner skips the
+        partitions that are past retention.
+
+        Returns:
+            The bound, as the naive timestamps the table holds.
+
+        """
+        return retained_since(
+            moment=datetime.now(tz=UTC).replace(tzinfo=None),
+            months=execution_settings.retention_months,
+        )
 
     async def create_execution(
         self,
@@ -22,7 +73,11 @@ class ExecutionUsecase:
         workflow_id: int,
         input_data: dict | None = None,
     ) -> Execution:
-        """Create an execution for a workflow.
+        """Create an execution for a workflow and start or queue it.
+
+        Executions over the user's running limit stay CREATED in a queue and
+        start once one of the user's running executions finishes. Input too
+        large to keep in the row is stored as a blob.
 
         Args:
             session: The session.
@@ -35,6 +90,8 @@ class ExecutionUsecase:
 
         Raises:
             WorkflowNotFoundError: If the workflow is not found.
+            ExecutionLimitError: If the user is over the start rate or their
+                queue is full.
 
         """
         workflow = await self._workflow_repository.get_by(
@@ -43,26 +100,115 @@ class ExecutionUsecase:
         if not workflow:
             raise WorkflowNotFoundError
 
-        return await self._execution_repository.create(
+        await self._admission.check_rate(user_id=user_id)
+
+        inline, ref = await self._payload_store.put(payload=input_data)
+        execution = await self._execution_repository.create(
             session=session,
             data={
                 "workflow_id": workflow_id,
-                "input_data": input_data,
+                "input_data": inline,
+                "input_ref": ref,
             },
         )
+        try:
+            executions = await self._admission.admit(
+                user_id=user_id,
+                execution_id=execution.id,
+                started_at=execution.started_at,
+            )
+        except ExecutionLimitError:
+            await self._execution_repository.delete_by(
+                session=session, id=execution.id, started_at=execution.started_at
+            )
+            raise
+
+        for execution_id, started_at in executions:
+            if execution_settings.mode == ExecutionMode.PREFECT:
+                self._flow_run_submitter.submit(
+                    execution_id=execution_id, started_at=started_at, user_id=user_id
+                )
+            else:
+                self._execution_engine.submit(
+                    execution_id=execution_id, started_at=started_at, user_id=user_id
+                )
+
+        return execution
+
+    async def expire_queued(self, session: AsyncSession) -> None:
+        """Fail executions that were dropped from their admission queue.
+
+        An idle queue expires after `queue_ttl`, taking the executions still
+        in it along, and those would otherwise stay CREATED forever.
+        Executions that are still queued, because the queue kept moving, are
+        left alone, and so is everything while Redis is unavailable.
+
+        Args:
+            session: The session.
+
+        """
+        now = datetime.now(tz=UTC).replace(tzinfo=None)
+        waiting = await self._execution_repository.get_waiting(
+            session=session,
+            started_since=self._retained_since(),
+            started_before=now - timedelta(seconds=execution_settings.queue_ttl),
+        )
+        for execution_id, started_at, user_id in waiting:
+            if await self._admission.is_queued(
+                user_id=user_id, execution_id=execution_id, started_at=started_at
+            ):
+                continue
+
+            expired = await self._execution_repository.update_by(
+                session=session,
+                data={
+                    "status": ExecutionStatus.FAILED,
+                    "error": QUEUE_EXPIRED_ERROR,
+                    "finished_at": func.now(),
+                },
+                id=execution_id,
+                started_at=started_at,
+                status=ExecutionStatus.CREATED,
+            )
+            if expired:
+                await self._events.publish(
+                    execution_id=execution_id,
+                    type=ExecutionEventType.FINISHED,
+                    data={
+                        "status": ExecutionStatus.FAILED,
+                        "error": QUEUE_EXPIRED_ERROR,
+                    },
+                )
+
+    async def expire_node_results(self, session: AsyncSession) -> None:
+        """Delete memoized node outputs older than `node_result_ttl`.
+
+        Every edit of a workflow leaves the outputs of the old node hashes
+        behind, so the table would otherwise only grow.
+
+        Args:
+            session: The session.
+
+        """
+        deleted = await self._node_result_repository.delete_expired(
+            session=session,
+            max_age=timedelta(seconds=execution_settings.node_result_ttl),
+        )
+        logger.info("Deleted %d expired node results", deleted)
 
     async def get_executions(
-        self, session: AsyncSession, user_id: int, workflow_id: int
-    ) -> list[Execution]:
+        self, session: AsyncSession, user_id: int, workflow_id: int, page: Page
+    ) -> tuple[list[Execution], str | None]:
         """List executions for a workflow.
 
         Args:
             session: The session.
             user_id: The owner user ID.
             workflow_id: The workflow ID.
+            page: The requested page.
 
         Returns:
-            The list of executions.
+            The page of executions and the cursor of the next page, if any.
 
         Raises:
             WorkflowNotFoundError: If the workflow is not found.
@@ -74,14 +220,20 @@ class ExecutionUsecase:
         if not workflow:
             raise WorkflowNotFoundError
 
-        return await self._execution_repository.get_all(
-            session=session, workflow_id=workflow_id
+        return await self._execution_repository.get_page(
+            session=session,
+            page=page,
+            sort_by="started_at",
+            where=[Execution.started_at >= self._retained_since()],
+            workflow_id=workflow_id,
         )
 
     async def get_execution(
         self, session: AsyncSession, execution_id: int, user_id: int
     ) -> Execution:
-        """Fetch an execution by ID.
+        """Fetch an execution by ID, reading it from the archive if needed.
+
+        Archived executions are returned detached from the session.
 
         Args:
             session: The session.
@@ -93,19 +245,168 @@ class ExecutionUsecase:
 
         Raises:
             ExecutionNotFoundError: If the execution is not found.
-            WorkflowNotFoundError: If the workflow is not found.
 
         """
-        execution = await self._execution_repository.get_by(
-            session=session, id=execution_id
+        execution = await self._execution_repository.get_owned(
+            session=session,
+            owner_id=user_id,
+            where=[Execution.started_at >= self._retained_since()],
+            id=execution_id,
         )
-        if not execution:
+        if execution:
+            return execution
+
+        archived = await self._execution_archive_repository.find_execution(
+            session=session, execution_id=execution_id
+        )
+        if not archived:
             raise ExecutionNotFoundError
 
+        execution = Execution(**ExecutionResponse.model_validate(archived).model_dump())
         workflow = await self._workflow_repository.get_by(
             session=session, id=execution.workflow_id, owner_id=user_id
         )
         if not workflow:
-            raise WorkflowNotFoundError
+            raise ExecutionNotFoundError
 
         return execution
+
+    async def load_payloads(self, execution: ExecutionResponse) -> ExecutionResponse:
+        """Fill in the payloads of an execution that are stored as blobs.
+
+        Args:
+            execution: The execution.
+
+        Returns:
+            The execution with its input and output data inline.
+
+        Raises:
+            PayloadUnavailableError: If a blob is missing or corrupt.
+
+        """
+        input_data, output_data = await asyncio.gather(
+            self._payload_store.resolve(
+                payload=execution.input_data, ref=execution.input_ref
+            ),
+            self._payload_store.resolve(
+                payload=execution.output_data, ref=execution.output_ref
+            ),
+        )
+
+        return execution.model_copy(
+            update={"input_data": input_data, "output_data": output_data}
+        )
+
+    async def stream_execution(
+        self, session: AsyncSession, execution_id: int, user_id: int
+    ) -> AsyncGenerator[ExecutionEvent, None]:
+        """Open the event stream of an execution.
+
+        Access is checked before the stream is returned, so errors surface
+        as regular responses rather than in the middle of a stream.
+
+        Args:
+            session: The session.
+            execution_id: The execution ID.
+            user_id: The owner user ID.
+
+        Returns:
+            The execution events, ending with the FINISHED event.
+
+        Raises:
+            ExecutionNotFoundError: If the execution is not found.
+
+        """
+        execution = await self.get_execution(
+            session=session, execution_id=execution_id, user_id=user_id
+        )
+        # Only executions past retention come from the archive. They never
+        # change again and nothing publishes their events.
+        if execution.started_at < self._retained_since():
+            return self._archived(execution=execution)
+
+        return self._stream(
+            session=session, execution_id=execution_id, started_at=execution.started_at
+        )
+
+    async def _archived(
+        self, execution: Execution
+    ) -> AsyncGenerator[ExecutionEvent, None]:
+        """Stream the final state of an archived execution.
+
+        Args:
+            execution: The archived execution.
+
+        Yields:
+            The FINISHED event.
+
+        """
+        yield await self._finished_event(execution=execution)
+
+    async def _finished_event(self, execution: Execution) -> ExecutionEvent:
+        """Build the FINISHED event of an execution from its stored state.
+
+        Args:
+            execution: The execution.
+
+        Returns:
+            The event, carrying the output or the error.
+
+        """
+        output_data, error = None, execution.error
+        try:
+            output_data = await self._payload_store.resolve(
+                payload=execution.output_data, ref=execution.output_ref
+            )
+        except PayloadUnavailableError as e:
+            error = error or e.message
+
+        return ExecutionEvent(
+            type=ExecutionEventType.FINISHED,
+            data={
+                "status": execution.status,
+                "output_data": output_data,
+                "error": error,
+            },
+        )
+
+    async def _stream(
+        self, session: AsyncSession, execution_id: int, started_at: datetime
+    ) -> AsyncGenerator[ExecutionEvent, None]:
+        """Stream execution events, starting from a database snapshot.
+
+        The snapshot is read after subscribing, so no event between the two
+        is lost. The session is closed before waiting for events, so a long
+        stream does not hold a pooled connection.
+
+        Args:
+            session: The session.
+            execution_id: The execution ID.
+            started_at: The execution start time, which locates its partition.
+
+        Yields:
+            The execution events.
+
+        """
+        async with self._events.subscribe(execution_id=execution_id) as events:
+            execution = await self._execution_repository.get_by(
+                session=session, id=execution_id, started_at=started_at
+            )
+            await session.close()
+            if not execution:
+                return
+
+            if execution.status in {ExecutionStatus.SUCCESS, ExecutionStatus.FAILED}:
+                yield await self._finished_event(execution=execution)
+                return
+
+            yield ExecutionEvent(
+                type=ExecutionEventType.STATUS, data={"status": execution.status}
+            )
+            if events is None:
+                return
+
+            async for event in events:
+                yield event
+                if event.type == ExecutionEventType.FINISHED:
+                    return
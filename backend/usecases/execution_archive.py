@@ -0,0 +1,195 @@
+"""Execution partition maintenance and archival."""
+
+import asyncio
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from exceptions import PayloadUnavailableError
+from repositories import (
+    ExecutionArchiveRepository,
+    ExecutionPartitionRepository,
+    ExecutionRepository,
+)
+from schemas import ExecutionResponse
+from settings import execution_settings
+from utils.partitions import add_months, month_start, partition_month
+from utils.payloads import payload_store
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionArchiveUsecase:
+    """Keep the executions table partitioned by month and bounded in size.
+
+    Partitions are created ahead of time so inserts land in them rather
+    than in the default partition. Partitions past the retention window are
+    detached, written out as gzip-compressed JSON lines and dropped; an
+    index row records which IDs each file holds so runs stay readable.
+
+    The jobs hold an advisory lock, so one worker runs them at a time, but
+    that worker may be on any host and any host reads archives back, so
+    `archive_dir` must be storage shared by every API host. Deployments
+    with local disks must run the API on a single host.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the usecase."""
+        self._partition_repository = ExecutionPartitionRepository()
+        self._archive_repository = ExecutionArchiveRepository()
+        self._execution_repository = ExecutionRepository()
+        self._payload_store = payload_store
+
+    @staticmethod
+    async def _current_month(session: AsyncSession) -> datetime:
+        """Get the start of the current month by the database clock.
+
+        Args:
+            session: The session.
+
+        Returns:
+            The start of the month, as the naive timestamps the table holds.
+
+        """
+        return month_start(moment=await session.scalar(select(func.localtimestamp())))
+
+    async def create_partitions(self, session: AsyncSession) -> None:
+        """Create the partitions of this month and the coming ones.
+
+        Args:
+            session: The session.
+
+        """
+        month = await self._current_month(session=session)
+        for offset in range(execution_settings.partition_months_ahead + 1):
+            await self._partition_repository.create(
+                session=session, month=add_months(month=month, months=offset)
+            )
+
+        await session.commit()
+
+    async def archive_partitions(self, session: AsyncSession) -> None:
+        """Detach the partitions past retention, archive them and sweep blobs.
+
+        Partitions detached by an interrupted earlier run are picked up too.
+        Blobs are swept only once every detached partition is archived, as
+        the rows of those partitions are not in the executions table.
+
+        Args:
+            session: The session.
+
+        """
+        cutoff = add_months(
+            month=await self._current_month(session=session),
+            months=-execution_settings.retention_months,
+        )
+        for name in await self._partition_repository.get_attached(session=session):
+            if add_months(month=partition_month(name=name), months=1) <= cutoff:
+                await self._partition_repository.detach(session=session, name=name)
+                await session.commit()
+
+        for name in await self._partition_repository.get_detached(session=session):
+            await self._archive(session=session, name=name)
+
+        deleted = await self._payload_store.sweep(
+            referenced=lambda refs: self._execution_repository.get_referenced(
+                session=session, refs=refs
+            )
+        )
+        logger.info("Swept %d unreferenced payload blobs", deleted)
+
+    async def _encode(self, row: dict[str, Any]) -> tuple[int, str]:
+        """Encode an execution for the archive, with its payloads inline.
+
+        Archived executions keep no blob references, so their blobs can be
+        swept. A payload that cannot be read keeps its reference instead.
+
+        Args:
+            row: The execution row.
+
+        Returns:
+            The execution ID and JSON document.
+
+        """
+        execution = ExecutionResponse.model_validate(row)
+        try:
+            input_data, output_data = await asyncio.gather(
+                self._payload_store.resolve(
+                    payload=execution.input_data, ref=execution.input_ref
+                ),
+                self._payload_store.resolve(
+                    payload=execution.output_data, ref=execution.output_ref
+                ),
+            )
+        except PayloadUnavailableError:
+            logger.warning("Archiving execution %s by reference", execution.id)
+        else:
+            execution = execution.model_copy(
+                update={
+                    "input_data": input_data,
+                    "output_data": output_data,
+                    "input_ref": None,
+                    "output_ref": None,
+                }
+            )
+
+        return execution.id, execution.model_dump_json()
+
+    async def _archive(self, session: AsyncSession, name: str) -> None:
+        """Write a detached partition to disk, then drop it.
+
+        The file is written under a temporary name and moved into place, and
+        the partition is dropped in the same transaction that indexes the
+        file, so a crash at any point leaves the partition to be archived
+        again on the next run.
+
+        Args:
+            session: The session.
+            name: The partition name.
+
+        """
+        directory = Path(execution_settings.archive_dir)
+        path = directory / f"{name}.jsonl.gz"
+        temporary = directory / f"{name}.jsonl.gz.tmp"
+        await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+
+        ids: list[int] = []
+        blocks: list[list[int]] = []
+        offset = 0
+        archive = await asyncio.to_thread(temporary.open, mode="wb")
+        try:
+            async for rows in self._partition_repository.stream_rows(
+                session=session, name=name
+            ):
+                block = await asyncio.to_thread(
+                    self._archive_repository.encode_block,
+                    executions=[await self._encode(row=row) for row in rows],
+                )
+                await asyncio.to_thread(archive.write, block)
+                blocks.append([rows[0]["id"], offset])
+                offset += len(block)
+                ids.extend(row["id"] for row in rows)
+        finally:
+            await asyncio.to_thread(archive.close)
+        await asyncio.to_thread(temporary.replace, path)
+
+        month = partition_month(name=name)
+        await self._partition_repository.drop(session=session, name=name)
+        await self._archive_repository.create(
+            session=session,
+            data={
+                "partition": name,
+                "path": str(path),
+                "range_start": month,
+                "range_end": add_months(month=month, months=1),
+                "min_id": min(ids, default=None),
+                "max_id": max(ids, default=None),
+                "row_count": len(ids),
+                "blocks": blocks,
+            },
+        )
+        logger.info("Archived %d executions of %s to %s", len(ids), name, path)
@@ -8,14 +8,34 @@ import redis.asyncio as redis
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
-from sessions import async_session
-from settings import chroma_settings, prefect_settings
+from llm import llm_cache
+from sessions import async_session, replica_session
+from settings import chroma_settings, postgres_settings, prefect_settings
 from utils.redis import redis_client
+from utils.replica import read_routing
+
+# Zero once everything received has been replayed, so an idle primary does
+# not read as a growing lag.
+REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
 
 
 class HealthUsecase:
     """Usecase operations for health checks."""
 
+    def llm_cache_stats(self) -> dict[str, int]:
+        """Get the LLM response cache counters of this worker.
+
+        Returns:
+            The hit and miss counts since the worker started.
+
+        """
+        return dict(llm_cache.stats)
+
     async def check_postgres(self) -> bool:
         """Check postgres connectivity.
 
@@ -30,6 +50,35 @@ class HealthUsecase:
         except SQLAlchemyError:
             return False
 
+    async def replica_lag(self) -> float | None:
+        """Measure how far the read replica is behind the primary.
+
+        Returns:
+            The replication lag in seconds, or None if no replica is
+            configured or it cannot be reached.
+
+        """
+        if not read_routing.enabled:
+            return None
+
+        try:
+            async with replica_session() as session:
+                lag = await session.scalar(text(REPLICA_LAG_QUERY))
+        except SQLAlchemyError:
+            return None
+
+        return float(lag or 0)
+
+    async def check_replica(self) -> bool:
+        """Check that the read replica is reachable and caught up.
+
+        Returns:
+            True if the replica lag is within bounds, False otherwise.
+
+        """
+        lag = await self.replica_lag()
+        return lag is not None and lag <= postgres_settings.replica_max_lag
+
     async def check_chroma(self) -> bool:
         """Check Chroma connectivity.
 
@@ -89,6 +138,8 @@ class HealthUsecase:
             ("chroma", self.check_chroma()),
             ("prefect", self.check_prefect()),
         ]
+        if read_routing.enabled:
+            tasks.append(("replica", self.check_replica()))
 
         results = await asyncio.gather(
             *[task[1] for task in tasks], return_exceptions=True
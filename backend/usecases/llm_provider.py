@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from exceptions import LLMProviderNotFoundError
 from models import LLMProvider
 from repositories import LLMProviderRepository, UserRepository
+from utils.pagination import Page
 
 
 class LLMProviderUsecase:
@@ -41,20 +42,21 @@ class LLMProviderUsecase:
         )
 
     async def get_llm_providers(
-        self, session: AsyncSession, user_id: int
-    ) -> list[LLMProvider]:
+        self, session: AsyncSession, user_id: int, page: Page
+    ) -> tuple[list[LLMProvider], str | None]:
         """List LLM providers for a user.
 
         Args:
             session: The session.
             user_id: The owner user ID.
+            page: The requested page.
 
         Returns:
-            The list of LLM providers.
+            The page of LLM providers and the cursor of the next page, if any.
 
         """
-        return await self._llm_provider_repository.get_all(
-            session=session, user_id=user_id
+        return await self._llm_provider_repository.get_page(
+            session=session, page=page, user_id=user_id
         )
 
     async def get_llm_provider(
@@ -100,16 +102,14 @@ class LLMProviderUsecase:
             LLMProviderNotFoundError: If the LLM provider is not found.
 
         """
-        provider = await self.get_llm_provider(
-            session=session, provider_id=provider_id, user_id=user_id
-        )
-
         update_data = {k: v for k, v in kwargs.items() if v is not None}
         if not update_data:
-            return provider
+            return await self.get_llm_provider(
+                session=session, provider_id=provider_id, user_id=user_id
+            )
 
         provider = await self._llm_provider_repository.update_by(
-            session=session, data=update_data, id=provider_id
+            session=session, data=update_data, id=provider_id, user_id=user_id
         )
         if not provider:
             raise LLMProviderNotFoundError
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from exceptions import NodeNotFoundError, WorkflowNotFoundError
 from models import Node
 from repositories import NodeRepository, WorkflowRepository
+from utils.pagination import Page
 
 
 class NodeUsecase:
@@ -35,29 +36,40 @@ class NodeUsecase:
             WorkflowNotFoundError: If the workflow is not found.
 
         """
-        workflow = await self._workflow_repository.get_by(
+        # The lock keeps concurrent creates from reading the same highest rank.
+        workflow = await self._workflow_repository.get_for_update(
             session=session, id=kwargs["workflow_id"], owner_id=user_id
         )
         if not workflow:
             raise WorkflowNotFoundError
 
+        await self._workflow_repository.bump_version(
+            session=session, workflow_id=workflow.id
+        )
+
         return await self._node_repository.create(
             session=session,
-            data=kwargs,
+            data={
+                **kwargs,
+                "topological_order": self._node_repository.next_topological_order(
+                    workflow_id=kwargs["workflow_id"]
+                ),
+            },
         )
 
     async def get_nodes(
-        self, session: AsyncSession, user_id: int, workflow_id: int
-    ) -> list[Node]:
+        self, session: AsyncSession, user_id: int, workflow_id: int, page: Page
+    ) -> tuple[list[Node], str | None]:
         """List nodes for a workflow.
 
         Args:
             session: The session.
             user_id: The owner user ID.
             workflow_id: The workflow ID.
+            page: The requested page.
 
         Returns:
-            The list of nodes.
+            The page of nodes and the cursor of the next page, if any.
 
         Raises:
             WorkflowNotFoundError: If the workflow is not found.
@@ -69,8 +81,8 @@ class NodeUsecase:
         if not workflow:
             raise WorkflowNotFoundError
 
-        return await self._node_repository.get_all(
-            session=session, workflow_id=workflow_id
+        return await self._node_repository.get_page(
+            session=session, page=page, workflow_id=workflow_id
         )
 
     async def get_node(self, session: AsyncSession, node_id: int, user_id: int) -> Node:
@@ -86,19 +98,14 @@ class NodeUsecase:
 
         Raises:
             NodeNotFoundError: If the node is not found.
-            WorkflowNotFoundError: If the workflow is not found.
 
         """
-        node = await self._node_repository.get_by(session=session, id=node_id)
+        node = await self._node_repository.get_owned(
+            session=session, owner_id=user_id, id=node_id
+        )
         if not node:
             raise NodeNotFoundError
 
-        workflow = await self._workflow_repository.get_by(
-            session=session, id=node.workflow_id, owner_id=user_id
-        )
-        if not workflow:
-            raise WorkflowNotFoundError
-
         return node
 
     async def update_node(
@@ -117,15 +124,17 @@ class NodeUsecase:
 
         Raises:
             NodeNotFoundError: If the node is not found.
-            WorkflowNotFoundError: If the workflow is not found.
 
         """
-        await self.get_node(session=session, node_id=node_id, user_id=user_id)
+        node = await self.get_node(session=session, node_id=node_id, user_id=user_id)
 
         update_data = {k: v for k, v in kwargs.items() if v is not None}
         if not update_data:
-            return await self.get_node(
-                session=session, node_id=node_id, user_id=user_id
+            return node
+
+        if "data" in update_data:
+            await self._workflow_repository.bump_version(
+                session=session, workflow_id=node.workflow_id
             )
 
         node = await self._node_repository.update_by(
@@ -150,10 +159,13 @@ class NodeUsecase:
 
         Raises:
             NodeNotFoundError: If the node is not found.
-            WorkflowNotFoundError: If the workflow is not found.
 
         """
-        await self.get_node(session=session, node_id=node_id, user_id=user_id)
+        node = await self.get_node(session=session, node_id=node_id, user_id=user_id)
+
+        await self._workflow_repository.bump_version(
+            session=session, workflow_id=node.workflow_id
+        )
 
         deleted = await self._node_repository.delete_by(session=session, id=node_id)
         if not deleted:
@@ -4,6 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from exceptions import UserNotFoundError
 from repositories import UserRepository
+from utils.principal import principal_cache
+from utils.revocation import DELETED_VERSION, token_revocation
 
 
 class UserUsecase:
@@ -12,9 +14,11 @@ class UserUsecase:
     def __init__(self) -> None:
         """Initialize the usecase."""
         self._user_repository = UserRepository()
+        self._principal_cache = principal_cache
+        self._token_revocation = token_revocation
 
     async def delete_user(self, session: AsyncSession, user_id: int) -> None:
-        """Delete a user by id.
+        """Delete a user by id and revoke their access tokens.
 
         Args:
             session: The session.
@@ -22,8 +26,18 @@ class UserUsecase:
 
         Raises:
             UserNotFoundError: If the user is not found.
+            AuthUnavailableError: If the tokens cannot be revoked.
 
         """
-        deleted = await self._user_repository.delete_by(session=session, id=user_id)
+        # Revoked first, so that the user is never deleted with their tokens
+        # still accepted. The tombstone written with the delete lets
+        # `sync_revocations` restore the revocation if Redis loses it.
+        await self._principal_cache.invalidate(user_id=user_id)
+        await self._token_revocation.revoke(user_id=user_id, version=DELETED_VERSION)
+        deleted = await self._user_repository.delete_revoked(
+            session=session, user_id=user_id
+        )
         if not deleted:
             raise UserNotFoundError
+
+        await self._principal_cache.invalidate(user_id=user_id)
@@ -1,10 +1,21 @@
 """Workflow use case implementation."""
 
+from typing import Any
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from exceptions import WorkflowNotFoundError
-from models import Workflow
-from repositories import UserRepository, WorkflowRepository
+from exceptions import NodeNotFoundError, WorkflowGraphError, WorkflowNotFoundError
+from models import Edge, Node, Workflow
+from repositories import (
+    EdgeRepository,
+    NodeRepository,
+    UserRepository,
+    WorkflowRepository,
+)
+from utils.pagination import Page
+from utils.topology import topological_ranks
+
+NODE_FIELDS = ("type", "data", "position_x", "position_y")
 
 
 class WorkflowUsecase:
@@ -14,6 +25,8 @@ class WorkflowUsecase:
         """Initialize the usecase."""
         self._workflow_repository = WorkflowRepository()
         self._user_repository = UserRepository()
+        self._node_repository = NodeRepository()
+        self._edge_repository = EdgeRepository()
 
     async def create_workflow(
         self, session: AsyncSession, user_id: int, name: str
@@ -35,20 +48,21 @@ class WorkflowUsecase:
         )
 
     async def get_workflows(
-        self, session: AsyncSession, user_id: int
-    ) -> list[Workflow]:
+        self, session: AsyncSession, user_id: int, page: Page
+    ) -> tuple[list[Workflow], str | None]:
         """List workflows for a user.
 
         Args:
             session: The session.
             user_id: The owner user ID.
+            page: The requested page.
 
         Returns:
-            The list of workflows.
+            The page of workflows and the cursor of the next page, if any.
 
         """
-        return await self._workflow_repository.get_all(
-            session=session, owner_id=user_id
+        return await self._workflow_repository.get_page(
+            session=session, page=page, owner_id=user_id
         )
 
     async def get_workflow(
@@ -76,6 +90,31 @@ class WorkflowUsecase:
 
         return workflow
 
+    async def get_graph(
+        self, session: AsyncSession, workflow_id: int, user_id: int
+    ) -> str:
+        """Fetch a workflow with its nodes and edges as a JSON document.
+
+        Args:
+            session: The session.
+            workflow_id: The workflow ID.
+            user_id: The owner user ID.
+
+        Returns:
+            The JSON document.
+
+        Raises:
+            WorkflowNotFoundError: If the workflow is not found.
+
+        """
+        graph = await self._workflow_repository.get_graph_json(
+            session=session, workflow_id=workflow_id, owner_id=user_id
+        )
+        if graph is None:
+            raise WorkflowNotFoundError
+
+        return graph
+
     async def update_workflow(
         self, session: AsyncSession, workflow_id: int, user_id: int, **kwargs: object
     ) -> Workflow:
@@ -94,13 +133,11 @@ class WorkflowUsecase:
             WorkflowNotFoundError: If the workflow is not found.
 
         """
-        workflow = await self.get_workflow(
-            session=session, workflow_id=workflow_id, user_id=user_id
-        )
-
         update_data = {k: v for k, v in kwargs.items() if v is not None}
         if not update_data:
-            return workflow
+            return await self.get_workflow(
+                session=session, workflow_id=workflow_id, user_id=user_id
+            )
 
         workflow = await self._workflow_repository.update_by(
             session=session,
@@ -132,3 +169,218 @@ class WorkflowUsecase:
         )
         if not deleted:
             raise WorkflowNotFoundError
+
+    async def save_graph(
+        self,
+        session: AsyncSession,
+        workflow_id: int,
+        user_id: int,
+        nodes: list[dict[str, Any]],
+        edges: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Replace the graph of a workflow in one transaction.
+
+        The submitted graph is diffed against the stored one, and every kind
+        of change is applied as a single multi-row statement under the
+        workflow lock, so concurrent saves and edge checks serialize and the
+        whole save commits or fails as a unit.
+
+        Args:
+            session: The session.
+            workflow_id: The workflow ID.
+            user_id: The owner user ID.
+            nodes: The desired nodes; new ones have no ID.
+            edges: The desired edges between node keys.
+
+        Returns:
+            The workflow ID, its new version, the nodes in submitted order and
+            the edges.
+
+        Raises:
+            WorkflowNotFoundError: If the workflow is not found.
+            NodeNotFoundError: If a node ID is not part of the workflow.
+            WorkflowGraphError: If keys are duplicated or edges reference
+                unknown keys.
+            WorkflowCycleError: If the graph contains a cycle.
+
+        """
+        workflow = await self._workflow_repository.get_for_update(
+            session=session, id=workflow_id, owner_id=user_id
+        )
+        if not workflow:
+            raise WorkflowNotFoundError
+
+        pairs = self._validate_graph(nodes=nodes, edges=edges)
+        ranks = topological_ranks(nodes=[node["key"] for node in nodes], edges=pairs)
+
+        saved_nodes = await self._save_nodes(
+            session=session, workflow_id=workflow_id, nodes=nodes, ranks=ranks
+        )
+        saved_edges = await self._save_edges(
+            session=session,
+            workflow_id=workflow_id,
+            pairs=[
+                (saved_nodes[source].id, saved_nodes[target].id)
+                for source, target in pairs
+            ],
+        )
+        version = await self._workflow_repository.bump_version(
+            session=session, workflow_id=workflow_id
+        )
+        await session.commit()
+
+        return {
+            "id": workflow_id,
+            "version": version,
+            "nodes": [saved_nodes[node["key"]] for node in nodes],
+            "edges": saved_edges,
+        }
+
+    @staticmethod
+    def _validate_graph(
+        nodes: list[dict[str, Any]], edges: list[dict[str, Any]]
+    ) -> list[tuple[str, str]]:
+        """Check that node keys and IDs are unique and edges reference keys.
+
+        Args:
+            nodes: The desired nodes.
+            edges: The desired edges.
+
+        Returns:
+            The distinct edges as (source key, target key) pairs.
+
+        Raises:
+            WorkflowGraphError: If the graph is inconsistent.
+
+        """
+        keys = {node["key"] for node in nodes}
+        if len(keys) != len(nodes):
+            raise WorkflowGraphError(message="Node keys must be unique")
+
+        ids = [node["id"] for node in nodes if node["id"] is not None]
+        if len(set(ids)) != len(ids):
+            raise WorkflowGraphError(message="Node IDs must be unique")
+
+        pairs = list(dict.fromkeys((edge["source"], edge["target"]) for edge in edges))
+        if any(source not in keys or target not in keys for source, target in pairs):
+            raise WorkflowGraphError(message="Edges must reference submitted nodes")
+
+        return pairs
+
+    async def _save_nodes(
+        self,
+        session: AsyncSession,
+        workflow_id: int,
+        nodes: list[dict[str, Any]],
+        ranks: dict[str, int],
+    ) -> dict[str, Node]:
+        """Insert, update and delete nodes to match the desired set.
+
+        Args:
+            session: The session.
+            workflow_id: The workflow ID.
+            nodes: The desired nodes.
+            ranks: The topological rank of each node key.
+
+        Returns:
+            The saved nodes by key.
+
+        Raises:
+            NodeNotFoundError: If a node ID is not part of the workflow.
+
+        """
+        stored = {
+            node.id: node
+            for node in await self._node_repository.get_all(
+                session=session, workflow_id=workflow_id
+            )
+        }
+        kept = {node["id"] for node in nodes if node["id"] is not None}
+        if not kept <= stored.keys():
+            raise NodeNotFoundError
+
+        await self._node_repository.delete_many(
+            session=session, ids=[node_id for node_id in stored if node_id not in kept]
+        )
+        await self._node_repository.update_many(
+            session=session,
+            data=[
+                {
+                    "id": node["id"],
+                    "topological_order": ranks[node["key"]],
+                    **{field: node[field] for field in NODE_FIELDS},
+                }
+                for node in nodes
+                if node["id"] is not None
+                and (
+                    stored[node["id"]].topological_order != ranks[node["key"]]
+                    or any(
+                        getattr(stored[node["id"]], field) != node[field]
+                        for field in NODE_FIELDS
+                    )
+                )
+            ],
+        )
+
+        new_nodes = [node for node in nodes if node["id"] is None]
+        inserted = await self._node_repository.insert_many(
+            session=session,
+            data=[
+                {
+                    "workflow_id": workflow_id,
+                    "topological_order": ranks[node["key"]],
+                    **{field: node[field] for field in NODE_FIELDS},
+                }
+                for node in new_nodes
+            ],
+        )
+
+        return {
+            **{node["key"]: stored[node["id"]] for node in nodes if node["id"]},
+            **{node["key"]: row for node, row in zip(new_nodes, inserted, strict=True)},
+        }
+
+    async def _save_edges(
+        self, session: AsyncSession, workflow_id: int, pairs: list[tuple[int, int]]
+    ) -> list[Edge]:
+        """Insert and delete edges to match the desired set.
+
+        Edges of deleted nodes are already gone through the foreign key
+        cascade.
+
+        Args:
+            session: The session.
+            workflow_id: The workflow ID.
+            pairs: The desired edges as (source ID, target ID) pairs.
+
+        Returns:
+            The saved edges.
+
+        """
+        desired = set(pairs)
+        kept: dict[tuple[int, int], Edge] = {}
+        stale: list[int] = []
+        for edge in await self._edge_repository.get_all(
+            session=session, workflow_id=workflow_id
+        ):
+            pair = (edge.source_node_id, edge.target_node_id)
+            if pair in desired and pair not in kept:
+                kept[pair] = edge
+            else:
+                stale.append(edge.id)
+
+        await self._edge_repository.delete_many(session=session, ids=stale)
+        inserted = await self._edge_repository.insert_many(
+            session=session,
+            data=[
+                {
+                    "workflow_id": workflow_id,
+                    "source_node_id": source,
+                    "target_node_id": target,
+                }
+                for source, target in pairs
+                if (source, target) not in kept
+            ],
+        )
+
+        return [*kept.values(), *inserted]
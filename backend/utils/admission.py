@@ -0,0 +1,320 @@
+"""Per-user execution admission control backed by Redis.
+
+Both limits are enforced by Lua scripts so that concurrent API workers never
+race between reading and updating a user's counters, and both use the Redis
+server clock so workers with skewed clocks agree on the state.
+"""
+
+import logging
+import math
+from datetime import datetime
+
+import redis.asyncio as redis
+
+from exceptions import ExecutionLimitError
+from settings import execution_settings
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+NOW = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+"""
+
+# Queued executions wait for as long as running ones take, which may exceed
+# the lease TTL, so the queue has its own TTL, refreshed on every promotion.
+PROMOTE = """
+local limit = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local promoted = {}
+while redis.call("ZCARD", KEYS[1]) < limit do
+    local member = redis.call("LPOP", KEYS[2])
+    if not member then
+        break
+    end
+    redis.call("ZADD", KEYS[1], now + ttl, member)
+    table.insert(promoted, member)
+end
+redis.call("PEXPIRE", KEYS[1], ttl)
+redis.call("PEXPIRE", KEYS[2], ARGV[4])
+return promoted
+"""
+
+# KEYS: bucket. ARGV: rate per second, burst. Returns the wait in ms, 0 if the
+# start was admitted.
+TAKE_TOKEN_SCRIPT = (
+    NOW
+    + """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "timestamp")
+local tokens = tonumber(bucket[1]) or burst
+local timestamp = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - timestamp) * rate / 1000)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "timestamp", now)
+redis.call("PEXPIRE", KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return wait
+"""
+)
+
+# KEYS: running leases, queue. ARGV: execution member, limit, lease TTL in ms,
+# queue TTL in ms, queue size. Returns the executions to start, or false if
+# the queue is full.
+ADMIT_SCRIPT = (
+    NOW
+    + """
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now)
+if redis.call("ZCARD", KEYS[1]) >= tonumber(ARGV[2])
+    and redis.call("LLEN", KEYS[2]) >= tonumber(ARGV[5]) then
+    return false
+end
+redis.call("RPUSH", KEYS[2], ARGV[1])
+"""
+    + PROMOTE
+)
+
+# KEYS: running leases, queue. ARGV: execution member, limit, lease TTL in ms,
+# queue TTL in ms. Returns the queued executions to start in place of the
+# released one.
+RELEASE_SCRIPT = (
+    NOW
+    + """
+redis.call("ZREM", KEYS[1], ARGV[1])
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now)
+"""
+    + PROMOTE
+)
+
+# KEYS: running leases. ARGV: execution member, lease TTL in ms. Extends the
+# lease of a running execution.
+RENEW_SCRIPT = (
+    NOW
+    + """
+redis.call("ZADD", KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+redis.call("PEXPIRE", KEYS[1], ARGV[2])
+"""
+)
+
+
+class ExecutionAdmission:
+    """Limit how fast and how many executions each user may run.
+
+    A token bucket caps the start rate. Running executions hold a lease in a
+    sorted set scored by expiry and renew it while they run, so a worker
+    that dies without releasing only blocks the slot until the lease times
+    out. Executions over the running limit wait in a per-user FIFO queue and
+    are promoted atomically whenever a slot frees up. When Redis is
+    unavailable admission fails open.
+
+    Executions are held by their ID and start time, so the engine can
+    address their partition without another lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scripts."""
+        self._take_token = redis_client.register_script(script=TAKE_TOKEN_SCRIPT)
+        self._admit = redis_client.register_script(script=ADMIT_SCRIPT)
+        self._release = redis_client.register_script(script=RELEASE_SCRIPT)
+        self._renew = redis_client.register_script(script=RENEW_SCRIPT)
+
+    @staticmethod
+    def _keys(user_id: int) -> list[str]:
+        """Build the Redis keys of a user's running leases and queue.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            The running and queued keys.
+
+        """
+        return [f"executions:running:{user_id}", f"executions:queued:{user_id}"]
+
+    @staticmethod
+    def _member(execution_id: int, started_at: datetime) -> str:
+        """Build the lease and queue member of an execution.
+
+        Args:
+            execution_id: The execution ID.
+            started_at: The execution start time.
+
+        Returns:
+            The member.
+
+        """
+        return f"{execution_id}:{started_at.isoformat()}"
+
+    @staticmethod
+    def _parse(members: list[str]) -> list[tuple[int, datetime]]:
+        """Parse lease and queue members back into executions.
+
+        Args:
+            members: The members.
+
+        Returns:
+            The execution IDs and start times.
+
+        """
+        executions = []
+        for member in members:
+            execution_id, started_at = member.split(":", 1)
+            executions.append((int(execution_id), datetime.fromisoformat(started_at)))
+
+        return executions
+
+    async def check_rate(self, user_id: int) -> None:
+        """Take a start token from the user's bucket.
+
+        Args:
+            user_id: The user ID.
+
+        Raises:
+            ExecutionLimitError: If the user is starting executions too fast.
+
+        """
+        try:
+            wait = await self._take_token(
+                keys=[f"executions:rate:{user_id}"],
+                args=[
+                    execution_settings.user_start_rate,
+                    execution_settings.user_start_burst,
+                ],
+            )
+        except redis.RedisError:
+            logger.warning("Admission control unavailable", exc_info=True)
+            return
+
+        if wait:
+            raise ExecutionLimitError(
+                retry_after=math.ceil(int(wait) / 1000),
+                message="Execution start rate exceeded",
+            )
+
+    async def admit(
+        self, user_id: int, execution_id: int, started_at: datetime
+    ) -> list[tuple[int, datetime]]:
+        """Admit an execution or queue it behind the user's running ones.
+
+        Args:
+            user_id: The user ID.
+            execution_id: The execution ID.
+            started_at: The execution start time.
+
+        Returns:
+            The IDs and start times of the executions that may start now,
+            which may include queued ones.
+
+        Raises:
+            ExecutionLimitError: If the user's queue is full.
+
+        """
+        try:
+            admitted = await self._admit(
+                keys=self._keys(user_id=user_id),
+                args=[
+                    self._member(execution_id=execution_id, started_at=started_at),
+                    execution_settings.user_max_running,
+                    execution_settings.lease_ttl * 1000,
+                    execution_settings.queue_ttl * 1000,
+                    execution_settings.user_queue_size,
+                ],
+            )
+        except redis.RedisError:
+            logger.warning("Admission control unavailable", exc_info=True)
+            return [(execution_id, started_at)]
+
+        if admitted is None:
+            raise ExecutionLimitError(
+                retry_after=execution_settings.limit_retry_after,
+                message="Too many running executions",
+            )
+
+        return self._parse(members=admitted)
+
+    async def release(
+        self, user_id: int, execution_id: int, started_at: datetime
+    ) -> list[tuple[int, datetime]]:
+        """Release a finished execution's slot.
+
+        Args:
+            user_id: The user ID.
+            execution_id: The execution ID.
+            started_at: The execution start time.
+
+        Returns:
+            The IDs and start times of the queued executions that may start
+            now.
+
+        """
+        try:
+            admitted = await self._release(
+                keys=self._keys(user_id=user_id),
+                args=[
+                    self._member(execution_id=execution_id, started_at=started_at),
+                    execution_settings.user_max_running,
+                    execution_settings.lease_ttl * 1000,
+                    execution_settings.queue_ttl * 1000,
+                ],
+            )
+        except redis.RedisError:
+            logger.warning("Admission control unavailable", exc_info=True)
+            return []
+
+        return self._parse(members=admitted)
+
+    async def renew(
+        self, user_id: int, execution_id: int, started_at: datetime
+    ) -> None:
+        """Extend the lease of a running execution.
+
+        Args:
+            user_id: The user ID.
+            execution_id: The execution ID.
+            started_at: The execution start time.
+
+        """
+        try:
+            await self._renew(
+                keys=self._keys(user_id=user_id)[:1],
+                args=[
+                    self._member(execution_id=execution_id, started_at=started_at),
+                    execution_settings.lease_ttl * 1000,
+                ],
+            )
+        except redis.RedisError:
+            logger.warning("Admission control unavailable", exc_info=True)
+
+    async def is_queued(
+        self, user_id: int, execution_id: int, started_at: datetime
+    ) -> bool:
+        """Check whether an execution is still waiting in the user's queue.
+
+        Args:
+            user_id: The user ID.
+            execution_id: The execution ID.
+            started_at: The execution start time.
+
+        Returns:
+            True if the execution is queued, or if Redis is unavailable.
+
+        """
+        try:
+            position = await redis_client.lpos(
+                self._keys(user_id=user_id)[1],
+                self._member(execution_id=execution_id, started_at=started_at),
+            )
+        except redis.RedisError:
+            logger.warning("Admission control unavailable", exc_info=True)
+            return True
+
+        return position is not None
+
+
+execution_admission = ExecutionAdmission()
@@ -0,0 +1,74 @@
+"""In-process cache helpers."""
+
+import time
+from collections import OrderedDict
+
+
+class LRUCache[Key, Value]:
+    """Bounded least-recently-used cache with an optional time to live."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: The maximum number of entries.
+            ttl: The entry lifetime in seconds, or None to keep entries until evicted.
+
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Key, tuple[float | None, Value]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: Key) -> Value | None:
+        """Get a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if it is missing or expired.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Key, value: Value) -> None:
+        """Cache a value, evicting the least recently used entry when full.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Key) -> None:
+        """Remove a cached value if present.
+
+        Args:
+            key: The cache key.
+
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
@@ -1,7 +1,18 @@
 """Password hashing utilities."""
 
+import asyncio
+import hashlib
+import hmac
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
 import bcrypt
 
+from exceptions import AuthBusyError
+from settings import auth_settings
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
@@ -13,7 +24,10 @@ def hash_password(password: str) -> str:
         The bcrypt hash.
 
     """
-    return bcrypt.hashpw(password=password.encode(), salt=bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(
+        password=password.encode(),
+        salt=bcrypt.gensalt(rounds=auth_settings.bcrypt_rounds),
+    ).decode()
 
 
 def verify_password(password: str, hashed: str) -> bool:
@@ -28,3 +42,137 @@ def verify_password(password: str, hashed: str) -> bool:
 
     """
     return bcrypt.checkpw(password=password.encode(), hashed_password=hashed.encode())
+
+
+def api_key_digest(key: str) -> str:
+    """Digest an API key with HMAC-SHA256.
+
+    API keys are long random strings, so unlike passwords they need no slow
+    hash; the keyed digest keeps a leaked table useless without the secret.
+
+    Args:
+        key: The API key.
+
+    Returns:
+        The hex digest.
+
+    """
+    return hmac.new(
+        key=auth_settings.secret_key.encode(),
+        msg=key.encode(),
+        digestmod=hashlib.sha256,
+    ).hexdigest()
+
+
+def verify_api_key(key: str, digest: str) -> bool:
+    """Verify an API key against its digest in constant time.
+
+    Args:
+        key: The API key.
+        digest: The stored digest.
+
+    Returns:
+        Whether the key matches the digest.
+
+    """
+    return hmac.compare_digest(api_key_digest(key=key), digest)
+
+
+class PasswordHasher:
+    """Run bcrypt on a dedicated thread pool with a bounded queue.
+
+    bcrypt releases the GIL while it works, so threads keep the event loop
+    responsive during a login burst without the cost of a process pool.
+    The pool is sized on its own so that hashing cannot starve the default
+    executor, and once the queue is full, new operations are rejected
+    instead of piling up behind requests that will time out anyway.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pool."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=auth_settings.hash_workers, thread_name_prefix="bcrypt"
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _release(self, _: Future | None) -> None:
+        """Count a queued operation as finished.
+
+        Called from the pool once the operation finishes or is cancelled
+        before it starts, so an operation whose caller went away keeps its
+        place in the queue for as long as bcrypt is still running it.
+        """
+        with self._lock:
+            self._pending -= 1
+
+    async def _run[Result](
+        self, function: Callable[..., Result], **kwargs: object
+    ) -> Result:
+        """Run a bcrypt call on the pool.
+
+        Args:
+            function: The call.
+            **kwargs: The call arguments.
+
+        Returns:
+            The call result.
+
+        Raises:
+            AuthBusyError: If the queue is full.
+
+        """
+        with self._lock:
+            if (
+                self._pending
+                >= auth_settings.hash_workers + auth_settings.hash_queue_size
+            ):
+                raise AuthBusyError(retry_after=auth_settings.hash_retry_after)
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(partial(function, **kwargs))
+        except RuntimeError:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password off the event loop.
+
+        Args:
+            password: The plain-text password.
+
+        Returns:
+            The bcrypt hash.
+
+        Raises:
+            AuthBusyError: If the queue is full.
+
+        """
+        return await self._run(hash_password, password=password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        """Verify a password off the event loop.
+
+        Args:
+            password: The plain-text password.
+            hashed: The bcrypt hash.
+
+        Returns:
+            Whether the password matches the hash.
+
+        Raises:
+            AuthBusyError: If the queue is full.
+
+        """
+        return await self._run(verify_password, password=password, hashed=hashed)
+
+    def shutdown(self) -> None:
+        """Stop the pool, letting running operations finish."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,93 @@
+"""Periodic background jobs shared between API workers."""
+
+import asyncio
+import contextlib
+import logging
+import zlib
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from sessions import async_engine, async_session
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """Run a job on an interval in at most one worker at a time.
+
+    Every API worker schedules the job, and a Postgres advisory lock picks
+    the one that runs it. The lock is scoped to a transaction held open on
+    a dedicated connection, so the job may commit as often as it needs
+    without releasing it, and no session-level state is left behind for
+    PgBouncer to hand to another client.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        job: Callable[[AsyncSession], Awaitable[None]],
+        engine: AsyncEngine = async_engine,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+    ) -> None:
+        """Initialize the job.
+
+        Args:
+            name: The job name, which also derives the lock key.
+            interval: The seconds between runs.
+            job: The job, called with a session.
+            engine: The engine the lock is taken on.
+            session_factory: The factory of the job sessions.
+
+        """
+        self.name = name
+        self.interval = interval
+        self._job = job
+        self._engine = engine
+        self._session_factory = session_factory
+        self._lock_key = zlib.crc32(name.encode())
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start running the job in the background."""
+        self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self) -> None:
+        """Stop the job, cancelling a run in progress."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> bool:
+        """Run the job unless another worker is running it.
+
+        Returns:
+            True if the job ran here, False if another worker holds it.
+
+        """
+        async with self._engine.begin() as lock:
+            if not await lock.scalar(
+                select(func.pg_try_advisory_xact_lock(self._lock_key))
+            ):
+                return False
+
+            async with self._session_factory() as session:
+                await self._job(session)
+
+        return True
+
+    async def _loop(self) -> None:
+        """Run the job every interval until stopped."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Job %s failed", self.name)
+
+            await asyncio.sleep(self.interval)
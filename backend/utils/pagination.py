@@ -0,0 +1,104 @@
+"""Keyset pagination cursors."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from fastapi import Response
+
+from enums import SortOrder
+from exceptions import InvalidCursorError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page:
+    """A requested page of a list, and where to report the next one."""
+
+    limit: int
+    cursor: str | None = None
+    order: SortOrder = SortOrder.ASC
+    response: Response | None = field(default=None, repr=False)
+
+    def set_next_cursor(self, cursor: str | None) -> None:
+        """Tell the client where the next page starts.
+
+        Args:
+            cursor: The cursor of the next page, or None on the last page.
+
+        """
+        if cursor and self.response is not None:
+            self.response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def encode_cursor(values: list[object], sort_by: str, order: SortOrder) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor.
+
+    The cursor records the sort it was issued for, since its key is only a
+    position within that sort.
+
+    Args:
+        values: The sort key values.
+        sort_by: The column the page is sorted by.
+        order: The sort direction.
+
+    Returns:
+        The cursor.
+
+    """
+    content = json.dumps(
+        {
+            "sort_by": sort_by,
+            "order": order,
+            "key": [
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in values
+            ],
+        },
+        separators=(",", ":"),
+    )
+
+    return base64.urlsafe_b64encode(content.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, types: list[type], sort_by: str, order: SortOrder
+) -> list[object]:
+    """Decode a cursor back into sort key values.
+
+    Args:
+        cursor: The cursor.
+        types: The Python type of each sort key column.
+        sort_by: The column the requested page is sorted by.
+        order: The requested sort direction.
+
+    Returns:
+        The sort key values.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for
+            another sort.
+
+    """
+    try:
+        content = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        values = content["key"]
+        if not isinstance(values, list) or len(values) != len(types):
+            raise InvalidCursorError
+
+        if content["sort_by"] != sort_by or content["order"] != order:
+            raise InvalidCursorError(
+                message="Page cursor does not match the requested sort"
+            )
+
+        return [
+            kind.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, values, strict=True)
+        ]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, KeyError) as e:
+        raise InvalidCursorError from e
@@ -0,0 +1,82 @@
+"""Monthly partition naming and date arithmetic."""
+
+import re
+from datetime import datetime
+
+PARTITION_PATTERN = re.compile(r"^executions_p(\d{4})_(\d{2})$")
+
+
+def month_start(moment: datetime) -> datetime:
+    """Truncate a moment to the start of its month.
+
+    Args:
+        moment: The moment.
+
+    Returns:
+        Midnight on the first day of the month.
+
+    """
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift the start of a month by a number of months.
+
+    Args:
+        month: The start of a month.
+        months: The number of months, negative to go back.
+
+    Returns:
+        The start of the shifted month.
+
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def retained_since(moment: datetime, months: int) -> datetime:
+    """Get the earliest start time of executions that may still be in Postgres.
+
+    Partitions are archived once they are `months` full months old. One more
+    month stays in range for partitions the archive job has not reached yet.
+
+    Args:
+        moment: The current time.
+        months: The retention in full months.
+
+    Returns:
+        The start of the earliest month that may still be attached.
+
+    """
+    return add_months(month=month_start(moment=moment), months=-months - 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Name the partition holding the executions started in a month.
+
+    Args:
+        month: The start of the month.
+
+    Returns:
+        The partition table name.
+
+    """
+    return f"executions_p{month:%Y_%m}"
+
+
+def partition_month(name: str) -> datetime | None:
+    """Parse the month a partition table covers from its name.
+
+    Args:
+        name: The table name.
+
+    Returns:
+        The start of the month, or None for tables that are not monthly
+        partitions.
+
+    """
+    match = PARTITION_PATTERN.match(name)
+    if match is None:
+        return None
+
+    return datetime(year=int(match[1]), month=int(match[2]), day=1)  # noqa: DTZ001
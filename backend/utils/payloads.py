@@ -0,0 +1,232 @@
+"""Content-addressed storage of large execution payloads."""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import secrets
+import time
+import zlib
+from collections.abc import Awaitable, Callable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from exceptions import PayloadUnavailableError
+from settings import payload_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadStore:
+    """Keep large JSON payloads out of rows as compressed blobs on disk.
+
+    Payloads under the inline limit stay in the row. Larger ones are stored
+    zlib-compressed under the SHA-256 of their canonical JSON, so identical
+    payloads share one blob, and the row keeps that hash as a reference.
+    Blobs are immutable and written under a temporary name before being
+    moved into place, so a reader never sees a partial one.
+
+    Blobs are not deleted along with their executions, since others may
+    share them. The archive job sweeps the ones no execution references
+    any more, once they are older than `orphan_grace`; storing a payload
+    again refreshes its blob, so the grace period covers a row that is
+    about to reference it.
+    """
+
+    def _path(self, ref: str) -> Path:
+        """Get the path of a blob.
+
+        Args:
+            ref: The blob reference.
+
+        Returns:
+            The blob path, fanned out by the first two hex digits.
+
+        """
+        return Path(payload_settings.dir) / ref[:2] / f"{ref}.json.z"
+
+    async def put(self, payload: dict | None) -> tuple[dict | None, str | None]:
+        """Store a payload as a blob if it is too large to keep inline.
+
+        Args:
+            payload: The payload.
+
+        Returns:
+            The payload to keep inline and the blob reference, one of which
+            is None.
+
+        """
+        if payload is None:
+            return None, None
+
+        content = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+        if len(content) <= payload_settings.inline_limit:
+            return payload, None
+
+        ref = hashlib.sha256(content).hexdigest()
+        await asyncio.to_thread(self._write, path=self._path(ref=ref), content=content)
+
+        return None, ref
+
+    async def get(self, ref: str) -> dict[str, Any]:
+        """Read a payload back from its blob.
+
+        Args:
+            ref: The blob reference.
+
+        Returns:
+            The payload.
+
+        Raises:
+            PayloadUnavailableError: If the blob is missing or corrupt.
+
+        """
+        try:
+            return await asyncio.to_thread(self._read, path=self._path(ref=ref))
+        except (OSError, zlib.error, ValueError) as e:
+            logger.exception("Failed to read payload blob %s", ref)
+            raise PayloadUnavailableError from e
+
+    async def resolve(self, payload: dict | None, ref: str | None) -> dict | None:
+        """Get a payload whether it is inline or stored as a blob.
+
+        Args:
+            payload: The inline payload.
+            ref: The blob reference.
+
+        Returns:
+            The payload.
+
+        Raises:
+            PayloadUnavailableError: If the blob is missing or corrupt.
+
+        """
+        if ref is None:
+            return payload
+
+        return await self.get(ref=ref)
+
+    async def sweep(
+        self, referenced: Callable[[list[str]], Awaitable[set[str]]]
+    ) -> int:
+        """Delete the blobs no execution references.
+
+        Only blobs older than `orphan_grace` are candidates. They are looked
+        up in batches of `sweep_batch_size`, so neither the directory nor the
+        references held by executions are ever loaded whole.
+
+        Args:
+            referenced: Returns which of a batch of blob references are still
+                held by executions.
+
+        Returns:
+            The number of deleted files.
+
+        """
+        cutoff = time.time() - payload_settings.orphan_grace
+        candidates = self._candidates(
+            directory=Path(payload_settings.dir), cutoff=cutoff
+        )
+        deleted = 0
+        while batch := await asyncio.to_thread(
+            list, islice(candidates, payload_settings.sweep_batch_size)
+        ):
+            held = await referenced([ref for ref, _ in batch if ref is not None])
+            deleted += await asyncio.to_thread(
+                self._delete,
+                paths=[path for ref, path in batch if ref not in held],
+                cutoff=cutoff,
+            )
+
+        return deleted
+
+    @staticmethod
+    def _candidates(
+        directory: Path, cutoff: float
+    ) -> Iterator[tuple[str | None, Path]]:
+        """List the blobs and stray temporary files older than a cutoff.
+
+        Args:
+            directory: The blob directory.
+            cutoff: The modification time files must be older than.
+
+        Yields:
+            The blob reference, or None for a temporary file, and the path.
+
+        """
+        for path in directory.glob("*/*"):
+            try:
+                if path.stat().st_mtime >= cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            ref = path.name.removesuffix(".json.z")
+            yield (ref if ref != path.name else None), path
+
+    @staticmethod
+    def _delete(paths: list[Path], cutoff: float) -> int:
+        """Delete files that are still older than a cutoff.
+
+        A blob stored again since it was listed has been touched, and is
+        kept for the new reference.
+
+        Args:
+            paths: The files to delete.
+            cutoff: The modification time files must be older than.
+
+        Returns:
+            The number of deleted files.
+
+        """
+        deleted = 0
+        for path in paths:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+
+        return deleted
+
+    @staticmethod
+    def _write(path: Path, content: bytes) -> None:
+        """Write a blob unless an identical one already exists.
+
+        An existing blob is touched instead, which keeps the sweep from
+        deleting it before the new reference is committed.
+
+        Args:
+            path: The blob path.
+            content: The uncompressed content.
+
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{secrets.token_hex(8)}.tmp")
+        temporary.write_bytes(
+            zlib.compress(content, level=payload_settings.compression_level)
+        )
+        temporary.replace(path)
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any]:
+        """Read and decompress a blob.
+
+        Args:
+            path: The blob path.
+
+        Returns:
+            The payload.
+
+        """
+        return json.loads(zlib.decompress(path.read_bytes()))
+
+
+payload_store = PayloadStore()
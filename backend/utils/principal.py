@@ -0,0 +1,232 @@
+"""Two-tier cache of authenticated principals."""
+
+import hashlib
+import json
+import logging
+import time
+
+import redis.asyncio as redis
+
+from exceptions import AuthUnavailableError
+from schemas import UserResponse
+from settings import auth_settings
+from utils.cache import LRUCache
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "auth:principal:generation"
+
+# KEYS: generation, entry, user index. ARGV: generation read before the
+# lookup, entry, entry TTL, index TTL, digest. Returns 1 if the entry is set.
+SET_SCRIPT = """
+if (redis.call("GET", KEYS[1]) or "0") ~= ARGV[1] then
+    return 0
+end
+redis.call("SET", KEYS[2], ARGV[2], "EX", ARGV[3])
+redis.call("SADD", KEYS[3], ARGV[5])
+redis.call("EXPIRE", KEYS[3], ARGV[4])
+return 1
+"""
+
+# KEYS: generation, user index. ARGV: entry key prefix, generation TTL.
+# Returns the digests whose entries were dropped.
+INVALIDATE_SCRIPT = """
+redis.call("INCR", KEYS[1])
+redis.call("EXPIRE", KEYS[1], ARGV[2])
+local digests = redis.call("SMEMBERS", KEYS[2])
+for _, digest in ipairs(digests) do
+    redis.call("DEL", ARGV[1] .. digest)
+end
+redis.call("DEL", KEYS[2])
+return digests
+"""
+
+
+class PrincipalCache:
+    """Cache the user a token resolves to, in process and in Redis.
+
+    Entries are keyed by the SHA-256 of the token, so a hit proves the token
+    was verified before and neither the JWT nor the database is touched
+    again; entries never outlive the token's expiry. Each user's token
+    digests are indexed in Redis so that all of their entries can be
+    invalidated at once. Other workers drop their in-process copies within
+    `principal_local_ttl` seconds, which is why that tier is kept short.
+
+    Every invalidation bumps a generation counter. A lookup reads it before
+    going to the database and its result is only cached if the counter has
+    not moved since, so a lookup racing an invalidation cannot cache the
+    state from before it. Without Redis, nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the local tier and the scripts."""
+        self._local: LRUCache[str, tuple[float, UserResponse]] = LRUCache(
+            maxsize=auth_settings.principal_cache_size,
+            ttl=auth_settings.principal_local_ttl,
+        )
+        self._set = redis_client.register_script(script=SET_SCRIPT)
+        self._invalidate = redis_client.register_script(script=INVALIDATE_SCRIPT)
+
+    @staticmethod
+    def digest(token: str) -> str:
+        """Hash a token so that it is never stored in clear.
+
+        Args:
+            token: The access token.
+
+        Returns:
+            The token digest.
+
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def _key(digest: str) -> str:
+        """Build the Redis key of a token.
+
+        Args:
+            digest: The token digest.
+
+        Returns:
+            The Redis key.
+
+        """
+        return f"auth:principal:{digest}"
+
+    @staticmethod
+    def _index_key(user_id: int) -> str:
+        """Build the Redis key of a user's token index.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            The Redis key.
+
+        """
+        return f"auth:principal:user:{user_id}"
+
+    async def get(self, token: str) -> UserResponse | None:
+        """Get the cached principal of a token.
+
+        Args:
+            token: The access token.
+
+        Returns:
+            The user, or None on a miss or once the token has expired.
+
+        """
+        digest = self.digest(token=token)
+        entry = self._local.get(key=digest)
+
+        if entry is None:
+            try:
+                cached = await redis_client.get(self._key(digest=digest))
+            except redis.RedisError:
+                logger.warning("Principal cache unavailable", exc_info=True)
+                return None
+
+            if cached is None:
+                return None
+
+            data = json.loads(cached)
+            entry = data["exp"], UserResponse.model_validate(data["user"])
+            self._local.set(key=digest, value=entry)
+
+        expires_at, user = entry
+        if expires_at <= time.time():
+            self._local.pop(key=digest)
+            return None
+
+        return user
+
+    async def generation(self) -> str | None:
+        """Read the invalidation generation before looking a principal up.
+
+        Returns:
+            The generation to pass to `set`, or None if Redis is unavailable.
+
+        """
+        try:
+            return await redis_client.get(GENERATION_KEY) or "0"
+        except redis.RedisError:
+            logger.warning("Principal cache unavailable", exc_info=True)
+            return None
+
+    async def set(
+        self,
+        token: str,
+        expires_at: float,
+        user: UserResponse,
+        generation: str | None,
+    ) -> None:
+        """Cache the principal of a verified token.
+
+        Args:
+            token: The access token.
+            expires_at: The token expiry as a Unix timestamp.
+            user: The user the token resolves to.
+            generation: The generation read before the principal was looked
+                up; the principal is not cached if it has moved since.
+
+        """
+        ttl = min(auth_settings.principal_cache_ttl, int(expires_at - time.time()))
+        if ttl <= 0 or generation is None:
+            return
+
+        digest = self.digest(token=token)
+        try:
+            cached = await self._set(
+                keys=[
+                    GENERATION_KEY,
+                    self._key(digest=digest),
+                    self._index_key(user_id=user.id),
+                ],
+                args=[
+                    generation,
+                    json.dumps(
+                        {"exp": expires_at, "user": user.model_dump(mode="json")}
+                    ),
+                    ttl,
+                    auth_settings.principal_cache_ttl,
+                    digest,
+                ],
+            )
+        except redis.RedisError:
+            logger.warning("Principal cache unavailable", exc_info=True)
+            return
+
+        if cached:
+            self._local.set(key=digest, value=(expires_at, user))
+
+    async def invalidate(self, user_id: int) -> None:
+        """Drop every cached principal of a user.
+
+        Callers invalidate before the change that revokes the principals,
+        so that the change fails when Redis cannot be reached, and again
+        once it is committed, to drop entries of lookups that read the
+        database in between.
+
+        Args:
+            user_id: The user ID.
+
+        Raises:
+            AuthUnavailableError: If Redis is unavailable.
+
+        """
+        try:
+            digests = await self._invalidate(
+                keys=[GENERATION_KEY, self._index_key(user_id=user_id)],
+                args=[self._key(digest=""), auth_settings.principal_cache_ttl],
+            )
+        except redis.RedisError as e:
+            logger.warning("Principal cache unavailable", exc_info=True)
+            self._local.clear()
+            raise AuthUnavailableError from e
+
+        for digest in digests:
+            self._local.pop(key=digest)
+
+
+principal_cache = PrincipalCache()
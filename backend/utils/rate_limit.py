@@ -0,0 +1,179 @@
+"""Per-user, per-route rate limiting middleware."""
+
+import logging
+import math
+import time
+from http import HTTPStatus
+
+import redis.asyncio as redis
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from exceptions import AuthCredentialsError
+from settings import auth_settings, rate_limit_settings
+from usecases import AuthUsecase
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Request state holding the access token verified here and its payload.
+VERIFIED_PAYLOAD_STATE = "verified_payload"
+
+# KEYS: current window counter, previous window counter. ARGV: limit, window
+# in ms, ms elapsed in the current window. Weighs the previous window by how
+# much of it still overlaps the sliding window, and counts the request only
+# if it is allowed. Returns whether it is allowed and the requests left.
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local current = tonumber(redis.call("GET", KEYS[1]) or "0")
+local previous = tonumber(redis.call("GET", KEYS[2]) or "0")
+local weighted = previous * (window - elapsed) / window + current
+if weighted >= limit then
+    return {0, 0}
+end
+if redis.call("INCR", KEYS[1]) == 1 then
+    redis.call("PEXPIRE", KEYS[1], window * 2)
+end
+return {1, math.floor(limit - weighted - 1)}
+"""
+
+
+class RateLimitMiddleware:
+    """Limit how often each client may call each route.
+
+    Clients are identified by the user in their access token, and by
+    address for API keys, older tokens and anything else that cannot be
+    verified without a lookup. They are counted per method and path
+    template over a sliding window approximated from two fixed-window
+    counters. A request costs a single Redis round trip; when Redis is
+    unavailable requests are let through.
+
+    The verified token payload is left in the request state, so that
+    authentication does not decode the token again.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped application.
+
+        """
+        self.app = app
+        self._auth = AuthUsecase()
+        self._check = redis_client.register_script(script=SLIDING_WINDOW_SCRIPT)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Check the rate limit of an HTTP request before handling it.
+
+        Args:
+            scope: The connection scope.
+            receive: The receive channel.
+            send: The send channel.
+
+        """
+        if (
+            scope["type"] != "http"
+            or not rate_limit_settings.enabled
+            or scope["path"].startswith(tuple(rate_limit_settings.exempt_paths))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        route = self._route(scope=scope)
+        limit = rate_limit_settings.route_limits.get(
+            route, rate_limit_settings.default_limit
+        )
+        window = rate_limit_settings.window * 1000
+        now = int(time.time() * 1000)
+        index, elapsed = divmod(now, window)
+        key = f"ratelimit:{{{self._identity(scope=scope)}:{route}}}"
+
+        try:
+            allowed, remaining = await self._check(
+                keys=[f"{key}:{index}", f"{key}:{index - 1}"],
+                args=[limit, window, elapsed],
+            )
+        except redis.RedisError:
+            logger.warning("Rate limiting unavailable", exc_info=True)
+            await self.app(scope, receive, send)
+            return
+
+        reset = math.ceil((window - elapsed) / 1000)
+        headers = {
+            "RateLimit-Limit": str(limit),
+            "RateLimit-Remaining": str(max(remaining, 0)),
+            "RateLimit-Reset": str(reset),
+        }
+        if not allowed:
+            response = JSONResponse(
+                status_code=HTTPStatus.TOO_MANY_REQUESTS,
+                content={"detail": "Too many requests"},
+                headers={**headers, "Retry-After": str(reset)},
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            """Add the rate limit headers to the response.
+
+            Args:
+                message: The ASGI message.
+
+            """
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    @staticmethod
+    def _route(scope: Scope) -> str:
+        """Name the route of a request by method and path template.
+
+        Args:
+            scope: The connection scope.
+
+        Returns:
+            The route name, shared by every request to the same endpoint.
+
+        """
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return f"{scope['method']} {route.path}"
+
+        return f"{scope['method']} unmatched"
+
+    def _identity(self, scope: Scope) -> str:
+        """Identify the client of a request without a lookup.
+
+        Only an access token carrying its principal names a user. Other
+        credentials count against the client address, so that inventing
+        credentials does not buy a fresh budget.
+
+        Args:
+            scope: The connection scope.
+
+        Returns:
+            The client identity.
+
+        """
+        _, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+        if token and not token.startswith(f"{auth_settings.api_key_prefix}_"):
+            try:
+                payload = self._auth.get_payload(token=token)
+            except AuthCredentialsError:
+                payload = {}
+
+            principal = payload.get("principal")
+            if isinstance(principal, dict) and "id" in principal:
+                scope.setdefault("state", {})[VERIFIED_PAYLOAD_STATE] = (token, payload)
+                return f"user:{principal['id']}"
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
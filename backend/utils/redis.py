@@ -1,12 +1,95 @@
 """Redis client setup."""
 
+import asyncio
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+from weakref import WeakKeyDictionary
+
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
 from settings import redis_settings
 
-redis_client = redis.StrictRedis(
-    host=redis_settings.host,
-    port=redis_settings.port,
-    db=redis_settings.db,
-    decode_responses=True,
+
+class LoopRedis:
+    """Redis client keeping one connection pool per event loop.
+
+    Pooled connections belong to the event loop that opened them, and using
+    one from another loop raises RuntimeError. The API has a single loop,
+    while Prefect runs async tasks on loops of their own in worker threads,
+    so every loop gets its own client, the way `LLMClientRegistry` keeps its
+    HTTP clients. Commands are forwarded to the client of the running loop.
+    """
+
+    def __init__(self, factory: Callable[[], redis.Redis]) -> None:
+        """Initialize the client.
+
+        Args:
+            factory: Creates the client of a new event loop.
+
+        """
+        self._factory = factory
+        self._clients: WeakKeyDictionary[asyncio.AbstractEventLoop, redis.Redis] = (
+            WeakKeyDictionary()
+        )
+
+    @property
+    def client(self) -> redis.Redis:
+        """Return the client of the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = self._factory()
+
+        return client
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Forward commands to the client of the running event loop."""
+        return getattr(self.client, name)
+
+    def use(self, factory: Callable[[], redis.Redis]) -> Callable[[], redis.Redis]:
+        """Create clients with another factory from now on.
+
+        Args:
+            factory: Creates the client of a new event loop.
+
+        Returns:
+            The previous factory.
+
+        """
+        previous, self._factory = self._factory, factory
+        self._clients.clear()
+        return previous
+
+    def register_script(self, script: str) -> AsyncScript:
+        """Register a Lua script that runs on the client of the calling loop.
+
+        Args:
+            script: The script source.
+
+        Returns:
+            The callable script.
+
+        """
+        # The digest only needs the encoder, which every client shares.
+        registered = self._factory().register_script(script=script)
+        registered.registered_client = self
+        return registered
+
+    async def aclose(self) -> None:
+        """Close the client of the current event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+redis_client = LoopRedis(
+    factory=partial(
+        redis.StrictRedis,
+        host=redis_settings.host,
+        port=redis_settings.port,
+        db=redis_settings.db,
+        decode_responses=True,
+    )
 )
@@ -0,0 +1,82 @@
+"""Read-your-writes routing between the primary and the read replica."""
+
+import logging
+
+import redis.asyncio as redis
+
+from settings import postgres_settings
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class ReadRouting:
+    """Decide whether a user's reads may be served by the replica.
+
+    After a write, the user's reads are pinned to the primary for a few
+    seconds so that they see their own change even while the replica lags.
+    The pin lives in Redis, so it holds across API workers. Without Redis,
+    reads go to the primary, since stale data is worse than the extra load.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether a read replica is configured."""
+        return postgres_settings.replica_url is not None
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        """Build the pin key of a user.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            The Redis key.
+
+        """
+        return f"replica:pin:{user_id}"
+
+    async def pin(self, user_id: int) -> None:
+        """Route a user's reads to the primary for a while.
+
+        The pin is best effort: when Redis is unreachable the write still
+        goes ahead unpinned. Reads go to the primary while Redis is down,
+        so a stale read is only possible if Redis recovers within
+        `replica_sticky_ttl` of the write and the replica still lags.
+
+        Args:
+            user_id: The user ID.
+
+        """
+        if not self.enabled:
+            return
+
+        try:
+            await redis_client.set(
+                self._key(user_id=user_id), 1, ex=postgres_settings.replica_sticky_ttl
+            )
+        except redis.RedisError:
+            logger.warning("Replica routing unavailable", exc_info=True)
+
+    async def use_replica(self, user_id: int) -> bool:
+        """Check whether a user's reads may go to the replica.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            True if a replica is configured and the user is not pinned.
+
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            return not await redis_client.exists(self._key(user_id=user_id))
+        except redis.RedisError:
+            logger.warning("Replica routing unavailable", exc_info=True)
+            return False
+
+
+read_routing = ReadRouting()
@@ -0,0 +1,133 @@
+"""Revocation of access tokens by per-user token version."""
+
+import logging
+import time
+
+import redis.asyncio as redis
+
+from exceptions import AuthUnavailableError
+from settings import auth_settings
+from utils.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Stored for deleted users, so that none of their tokens is ever accepted.
+DELETED_VERSION = 2**31
+
+VERSIONS_KEY = "auth:token_versions"
+
+# KEYS: versions hash. ARGV: user ID, version pairs. Versions only increase.
+RAISE_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    local current = tonumber(redis.call("HGET", KEYS[1], ARGV[i]) or "0")
+    if tonumber(ARGV[i + 1]) > current then
+        redis.call("HSET", KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+return 0
+"""
+
+
+class TokenRevocation:
+    """Reject tokens issued before a user's latest revocation.
+
+    Tokens carry the token version of their user. Revoking all of a user's
+    tokens bumps the version, and the new version is published in a Redis
+    hash holding only the users that ever revoked. Every worker keeps a
+    copy of the hash and refreshes it at most every
+    `revocation_sync_interval` seconds, so checking a token is a dict lookup
+    and a revocation reaches every worker within that interval. While Redis
+    is unavailable, the last synced copy keeps being used.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the local copy and the script."""
+        self._versions: dict[int, int] = {}
+        self._synced_at = float("-inf")
+        self._raise = redis_client.register_script(script=RAISE_SCRIPT)
+
+    async def _sync(self) -> None:
+        """Refresh the local copy if it is older than the sync interval."""
+        now = time.monotonic()
+        if now - self._synced_at < auth_settings.revocation_sync_interval:
+            return
+
+        # Claimed before awaiting, so concurrent requests do not all sync.
+        self._synced_at = now
+        try:
+            versions = await redis_client.hgetall(VERSIONS_KEY)
+        except redis.RedisError:
+            logger.warning("Token revocation sync unavailable", exc_info=True)
+            return
+
+        self._versions = {
+            int(user_id): int(version) for user_id, version in versions.items()
+        }
+
+    async def is_revoked(self, user_id: int, version: int) -> bool:
+        """Check whether a token has been revoked.
+
+        Args:
+            user_id: The user ID of the token.
+            version: The token version of the token.
+
+        Returns:
+            Whether the user has revoked their tokens since it was issued.
+
+        """
+        await self._sync()
+
+        return version < self._versions.get(user_id, 0)
+
+    async def revoke(self, user_id: int, version: int) -> None:
+        """Revoke the tokens of a user issued before a version.
+
+        Args:
+            user_id: The user ID.
+            version: The first token version still accepted.
+
+        Raises:
+            AuthUnavailableError: If the revocation cannot be published.
+
+        """
+        self._versions[user_id] = max(version, self._versions.get(user_id, 0))
+        try:
+            await self._publish(versions={user_id: version})
+        except redis.RedisError as e:
+            logger.warning("Token revocation sync unavailable", exc_info=True)
+            raise AuthUnavailableError from e
+
+    def clear(self) -> None:
+        """Forget the local copy, so that the next check syncs again."""
+        self._versions.clear()
+        self._synced_at = float("-inf")
+
+    async def publish(self, versions: dict[int, int]) -> None:
+        """Publish token versions to the other workers.
+
+        A published version never lowers the one already in Redis.
+
+        Args:
+            versions: The token versions keyed by user ID.
+
+        """
+        try:
+            await self._publish(versions=versions)
+        except redis.RedisError:
+            logger.warning("Token revocation sync unavailable", exc_info=True)
+
+    async def _publish(self, versions: dict[int, int]) -> None:
+        """Raise the token versions in Redis.
+
+        Args:
+            versions: The token versions keyed by user ID.
+
+        """
+        if versions:
+            await self._raise(
+                keys=[VERSIONS_KEY],
+                args=[value for item in versions.items() for value in item],
+            )
+
+
+token_revocation = TokenRevocation()
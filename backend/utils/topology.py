@@ -0,0 +1,144 @@
+"""Incremental topological order maintenance."""
+
+from collections import defaultdict
+from collections.abc import Callable, Hashable
+
+from exceptions import WorkflowCycleError
+
+
+def _search(
+    start: int,
+    adjacency: dict[int, list[int]],
+    within: Callable[[int], bool],
+    forbidden: int | None = None,
+) -> set[int]:
+    """Collect the nodes reachable from a start node inside a rank window.
+
+    Args:
+        start: The start node ID.
+        adjacency: The neighbours of each node in the search direction.
+        within: Whether a node lies inside the rank window.
+        forbidden: A node whose discovery means the new edge closes a cycle.
+
+    Returns:
+        The visited node IDs, including the start node.
+
+    Raises:
+        WorkflowCycleError: If the forbidden node is reachable.
+
+    """
+    visited = {start}
+    stack = [start]
+    while stack:
+        for node_id in adjacency.get(stack.pop(), []):
+            if node_id == forbidden:
+                raise WorkflowCycleError
+            if node_id not in visited and within(node_id):
+                visited.add(node_id)
+                stack.append(node_id)
+
+    return visited
+
+
+def reorder_for_edge(
+    source_id: int,
+    target_id: int,
+    orders: dict[int, int],
+    edges: list[tuple[int, int]],
+) -> dict[int, int]:
+    """Validate a new edge and repair the topological order around it.
+
+    Implements the Pearce-Kelly insertion step. Ranks satisfy
+    `order[source] <= order[target]` for every edge, so an edge whose source
+    already ranks below its target needs no work. Otherwise only nodes ranked
+    between the target and the source (the affected region) can lie on a
+    cycle or need a new rank, and `orders`/`edges` only have to cover that
+    region.
+
+    Args:
+        source_id: The new edge source node ID.
+        target_id: The new edge target node ID.
+        orders: The ranks of the nodes in the affected region, including both
+            endpoints.
+        edges: The existing edges between nodes of the affected region.
+
+    Returns:
+        The new ranks of the nodes whose rank changed.
+
+    Raises:
+        WorkflowCycleError: If the edge would close a cycle.
+
+    """
+    if source_id == target_id:
+        raise WorkflowCycleError
+
+    lower, upper = orders[target_id], orders[source_id]
+    if upper < lower:
+        return {}
+
+    successors: defaultdict[int, list[int]] = defaultdict(list)
+    predecessors: defaultdict[int, list[int]] = defaultdict(list)
+    for source, target in edges:
+        successors[source].append(target)
+        predecessors[target].append(source)
+
+    forward = _search(
+        start=target_id,
+        adjacency=successors,
+        within=lambda node_id: orders.get(node_id, upper + 1) <= upper,
+        forbidden=source_id,
+    )
+    backward = _search(
+        start=source_id,
+        adjacency=predecessors,
+        within=lambda node_id: orders.get(node_id, lower - 1) >= lower,
+    )
+
+    affected = sorted(backward, key=orders.__getitem__) + sorted(
+        forward, key=orders.__getitem__
+    )
+    ranks = sorted(orders[node_id] for node_id in affected)
+
+    return {
+        node_id: rank
+        for node_id, rank in zip(affected, ranks, strict=True)
+        if orders[node_id] != rank
+    }
+
+
+def topological_ranks[Key: Hashable](
+    nodes: list[Key], edges: list[tuple[Key, Key]]
+) -> dict[Key, int]:
+    """Rank the nodes of a whole graph with Kahn's algorithm.
+
+    Args:
+        nodes: The nodes.
+        edges: The edges as (source, target) pairs.
+
+    Returns:
+        The rank of each node, starting at 1.
+
+    Raises:
+        WorkflowCycleError: If the graph contains a cycle.
+
+    """
+    successors: defaultdict[Key, list[Key]] = defaultdict(list)
+    remaining = dict.fromkeys(nodes, 0)
+    for source, target in edges:
+        successors[source].append(target)
+        remaining[target] += 1
+
+    ready = [node for node in nodes if remaining[node] == 0]
+    ranks: dict[Key, int] = {}
+    while ready:
+        node = ready.pop()
+        ranks[node] = len(ranks) + 1
+        for successor in successors[node]:
+            remaining[successor] -= 1
+            if remaining[successor] == 0:
+                ready.append(successor)
+
+    if len(ranks) != len(nodes):
+        raise WorkflowCycleError
+
+    return ranks